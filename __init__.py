@@ -16,11 +16,36 @@ from . import properties
 from . import operators
 from . import ui
 from . import utils
+from . import path_status
+from . import library_watcher
+from . import usage_index
+from . import blendfile
+from . import scan_cache
+from . import search_index
+from . import worker_pool
+from . import profiler
 
 # Import the handler specifically for the append/remove logic
-from .utils import auto_update_linked_handler
+from .utils import (
+    auto_update_linked_handler,
+    reset_on_file_load,
+    cancel_scheduled_refresh,
+    start_library_watch,
+    stop_library_watch,
+    stop_path_probes,
+    stop_worker_pool,
+    warn_proxies_on_render,
+)
 
 # Force reload sub-modules for fast updates during development
+importlib.reload(profiler)
+importlib.reload(path_status)
+importlib.reload(library_watcher)
+importlib.reload(usage_index)
+importlib.reload(blendfile)
+importlib.reload(scan_cache)
+importlib.reload(search_index)
+importlib.reload(worker_pool)
 importlib.reload(properties)
 importlib.reload(operators)
 importlib.reload(ui)
@@ -39,11 +64,26 @@ def register():
     # 4. Add the Handler
     if auto_update_linked_handler not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(auto_update_linked_handler)
+    if reset_on_file_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(reset_on_file_load)
+    if warn_proxies_on_render not in bpy.app.handlers.render_init:
+        bpy.app.handlers.render_init.append(warn_proxies_on_render)
+
+    # 5. Watch linked library files for on-disk changes
+    start_library_watch()
 
 def unregister():
     # 1. Remove the Handler first
     if auto_update_linked_handler in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(auto_update_linked_handler)
+    if reset_on_file_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(reset_on_file_load)
+    if warn_proxies_on_render in bpy.app.handlers.render_init:
+        bpy.app.handlers.render_init.remove(warn_proxies_on_render)
+    cancel_scheduled_refresh()
+    stop_library_watch()
+    stop_path_probes()
+    stop_worker_pool()
     
     # 2. Unregister in REVERSE order (Note the indentation here!)
     ui.unregister()
@@ -0,0 +1,218 @@
+"""Headless batch audit of linked libraries across many .blend files.
+
+Streams one JSON line per file: its libraries (path, broken, ghost, nested
+dependencies, cost footprint) and linked assets (instance count, ghost), using the same
+scan as the add-on's list. Usage covers every scene of the file: instance
+counts are summed over the scenes, ghosts are used in none of them and
+"used_in" names the scenes that do use a library or asset. Files are spread
+over parallel background Blender processes.
+
+    blender -b --factory-startup -P batch_audit.py -- --jobs 8 --output audit.jsonl "shots/**/*.blend"
+    python batch_audit.py --blender /opt/blender/blender --jobs 8 @file_list.txt
+
+Positional arguments are .blend paths, glob patterns (** recurses) or
+@list files with one path/pattern per line. Without --output the lines go
+to stdout (mixed with Blender's own messages when run through blender).
+"""
+
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import sys
+import time
+
+ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_MODULE = "library_manager_audit"
+
+
+def _load_module(name, filename, package=False):
+    """Imports an add-on file without installing the add-on"""
+    path = os.path.join(ADDON_DIR, filename)
+    spec = importlib.util.spec_from_file_location(
+        name, path, submodule_search_locations=[ADDON_DIR] if package else None)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# =========================================================================
+# WORKER (inside background Blender)
+# =========================================================================
+
+def audit_file(addon, path):
+    """Opens one .blend and reports its libraries and assets"""
+    import bpy
+
+    utils = addon.utils
+    start = time.perf_counter()
+    bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+    load_time = time.perf_counter() - start
+
+    # Per-file state: session uids restart with every file
+    addon.usage_index.clear()
+    addon.utils.invalidate_library_inventory()
+    addon.path_status.service.invalidate()
+    addon.path_status.service.probe_many(utils.library_abspath(lib) for lib in bpy.data.libraries)
+
+    # File-level usage: the usage overlay of every scene, merged per row
+    inventory = utils.library_inventory()
+    scenes = list(bpy.data.scenes)
+    overlays = [utils.usage_overlay(scene, inventory)[1] for scene in scenes]
+    stats = utils.library_stats(inventory["abs_paths"])
+    # Scan cache entries are only written by the interactive add-on
+    utils._cache_pending.clear()
+
+    libraries = []
+    for i, ((lib_path, is_library, name, id_type), fields, _) in enumerate(inventory["rows"]):
+        instance_count = sum(overlay[i][0] for overlay in overlays)
+        used_in = [scene.name for scene, overlay in zip(scenes, overlays) if overlay[i][1]]
+        if is_library:
+            library = bpy.data.libraries.get(name)
+            abs_path = utils.library_abspath(library)
+            cost = {key: value for key, value in stats.get(name, {}).items() if key != "reload_time"}
+            # No watcher runs here, so the file size is read directly
+            cost["file_size"] = os.path.getsize(abs_path) if os.path.isfile(abs_path) else 0
+            libraries.append({
+                "name": name,
+                "filepath": lib_path,
+                "abspath": abs_path,
+                "parent": library.parent.name if library.parent else None,
+                "depth": fields["depth"],
+                "is_broken": fields["is_broken"],
+                "has_broken_dependency": fields["has_broken_dependency"],
+                "is_ghost": not used_in,
+                "instance_count": instance_count,
+                "used_in": used_in,
+                "cost": cost,
+                "assets": [],
+            })
+        else:
+            libraries[-1]["assets"].append({
+                "name": name,
+                "type": id_type,
+                "instance_count": instance_count,
+                "is_ghost": not used_in,
+                "used_in": used_in,
+            })
+
+    return {
+        "file": path,
+        "ok": True,
+        "usage_scope": "all_scenes",
+        "scenes": [scene.name for scene in scenes],
+        "load_time": load_time,
+        "summary": {
+            "libraries": len(libraries),
+            "broken": sum(1 for lib in libraries if lib["is_broken"]),
+            "ghost_libraries": sum(1 for lib in libraries if lib["is_ghost"]),
+            "assets": sum(len(lib["assets"]) for lib in libraries),
+            "ghost_assets": sum(1 for lib in libraries for a in lib["assets"] if a["is_ghost"]),
+        },
+        "libraries": libraries,
+    }
+
+
+def run_worker():
+    """Answers every stdin path with one RESULT_PREFIX JSON line"""
+    addon = _load_module(ADDON_MODULE, "__init__.py", package=True)
+    prefix = addon.worker_pool.RESULT_PREFIX
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+        try:
+            result = audit_file(addon, path)
+        except Exception as e:
+            result = {"file": path, "ok": False, "error": str(e)}
+        sys.stdout.write(prefix + json.dumps(result) + "\n")
+        sys.stdout.flush()
+    addon.path_status.service.shutdown()
+    addon.library_watcher.watcher.stop()
+
+
+# =========================================================================
+# COORDINATOR
+# =========================================================================
+
+def expand_inputs(inputs):
+    """Paths, globs and @list files -> sorted unique absolute .blend paths"""
+    patterns = []
+    for value in inputs:
+        if value.startswith("@"):
+            with open(value[1:], encoding="utf-8") as f:
+                patterns.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+        else:
+            patterns.append(value)
+
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        paths.update(os.path.abspath(p) for p in matches if p.endswith(".blend"))
+    return sorted(paths)
+
+
+def _default_binary():
+    try:
+        import bpy
+        return bpy.app.binary_path
+    except ImportError:
+        return "blender"
+
+
+def run_audit(args):
+    worker_pool = _load_module("library_manager_worker_pool", "worker_pool.py")
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("Library Manager audit: no .blend files matched", file=sys.stderr)
+        return 1
+
+    pool = worker_pool.BlenderWorkerPool(
+        max_workers=args.jobs, timeout=args.timeout,
+        script=os.path.abspath(__file__), script_args=["--worker"])
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    start = time.perf_counter()
+    try:
+        pool.submit(args.blender or _default_binary(), paths)
+        done = 0
+        while done < len(paths):
+            time.sleep(0.1)
+            for path, result in sorted(pool.take_results().items()):
+                result.setdefault("file", path)
+                failed += not result.get("ok")
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                done += 1
+    finally:
+        pool.shutdown()
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Library Manager audit: {len(paths)} files, {failed} failed, "
+          f"{time.perf_counter() - start:.1f}s with {pool.max_workers} processes", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv):
+    if "--worker" in argv:
+        run_worker()
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("inputs", nargs="+", help=".blend paths, glob patterns or @list files")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parallel Blender processes (default: CPU count)")
+    parser.add_argument("--output", "-o", help="JSON lines file (default: stdout)")
+    parser.add_argument("--blender", help="Blender binary (default: the running Blender, else 'blender' on PATH)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds per file before its process is killed")
+    return run_audit(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    # Under blender -P the script's own arguments follow "--"
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    code = main(argv)
+    if code:
+        sys.exit(code)
@@ -0,0 +1,540 @@
+"""Lightweight stand-in for the parts of bpy the add-on's hot paths use.
+
+Only meant for the benchmarks: it lets utils/usage_index/ui run in a plain
+Python interpreter on synthetic data. RNA properties, ID collections and
+timers are modelled closely enough for the add-on's code to run unchanged;
+everything Blender does in C (drawing, the depsgraph, operators) is either
+absent or a no-op, so timings cover the add-on's own Python work only.
+
+Call install() before importing the add-on.
+"""
+
+import os
+import sys
+import types
+
+
+# =========================================================================
+# RNA PROPERTIES
+# =========================================================================
+
+_DEFAULTS = {"string": "", "bool": False, "int": 0, "float": 0.0}
+
+
+class _Property:
+    """bpy.props.*Property(): a data descriptor storing values per instance"""
+
+    def __init__(self, kind, **options):
+        self.kind = kind
+        self.options = options
+        self.name = None
+
+    def _default(self):
+        if self.kind == "collection":
+            return _PropertyCollection(self.options["type"])
+        if self.kind == "pointer":
+            return self.options["type"]()
+        if "default" in self.options:
+            return self.options["default"]
+        if self.kind == "enum":
+            items = self.options.get("items")
+            return items[0][0] if isinstance(items, (list, tuple)) and items else ""
+        return _DEFAULTS.get(self.kind)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance.__dict__.setdefault("_rna", {})
+        try:
+            return values[self.name]
+        except KeyError:
+            value = values[self.name] = self._default()
+            if self.kind == "collection":
+                value.id_data = getattr(instance, "id_data", instance)
+            return value
+
+    def __set__(self, instance, value):
+        instance.__dict__.setdefault("_rna", {})[self.name] = value
+        update = self.options.get("update")
+        if update is not None:
+            update(instance, context)
+
+
+class _StructMeta(type):
+    """Names properties when they are assigned to a class (bpy.types.Scene.x = ...)"""
+
+    def __setattr__(cls, name, value):
+        if isinstance(value, _Property):
+            value.name = name
+        super().__setattr__(name, value)
+
+
+class bpy_struct(metaclass=_StructMeta):
+    def get(self, key, default=None):
+        # RNA properties registered from Python are ID properties underneath
+        return self.__dict__.get("_rna", {}).get(key, default)
+
+    def __contains__(self, key):
+        return key in self.__dict__.get("_rna", {})
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class _PropertyCollection:
+    """CollectionProperty value"""
+
+    def __init__(self, item_type):
+        self.item_type = item_type
+        self.items = []
+        self.id_data = None
+
+    def add(self):
+        item = self.item_type()
+        item.id_data = self.id_data
+        self.items.append(item)
+        return item
+
+    def remove(self, index):
+        del self.items[index]
+
+    def move(self, from_index, to_index):
+        self.items.insert(to_index, self.items.pop(from_index))
+
+    def clear(self):
+        self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+props = types.ModuleType("bpy.props")
+for _kind in ("String", "Bool", "Int", "Float", "Enum", "Collection", "Pointer",
+              "FloatVector", "IntVector", "BoolVector"):
+    setattr(props, _kind + "Property",
+            (lambda kind: lambda **options: _Property(kind, **options))(_kind.lower()))
+
+
+# =========================================================================
+# ID DATABLOCKS
+# =========================================================================
+
+_next_uid = [0]
+
+
+class ID(bpy_struct):
+    def __init__(self, name, library=None, asset=False):
+        _next_uid[0] += 1
+        self.session_uid = _next_uid[0]
+        self.name = name
+        self.library = library
+        self.asset_data = object() if asset else None
+        self.is_library_indirect = False
+        self.users = 0
+        self.use_fake_user = False
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class Library(ID):
+    def __init__(self, name, filepath, parent=None):
+        super().__init__(name)
+        self.filepath = filepath
+        self.parent = parent
+
+    def reload(self):
+        pass
+
+
+class Mesh(ID):
+    def __init__(self, name, library=None, asset=False, vertices=0, polygons=0):
+        super().__init__(name, library, asset)
+        self.vertices = range(vertices)
+        self.polygons = range(polygons)
+
+
+class Material(ID):
+    pass
+
+
+class NodeTree(ID):
+    pass
+
+
+class World(ID):
+    pass
+
+
+class Action(ID):
+    pass
+
+
+class Image(ID):
+    def __init__(self, name, library=None, asset=False, size=(0, 0), channels=4, is_float=False):
+        super().__init__(name, library, asset)
+        self.size = size
+        self.channels = channels
+        self.is_float = is_float
+        self.has_data = False
+
+
+class _MaterialSlot:
+    __slots__ = ("material",)
+
+    def __init__(self, material):
+        self.material = material
+
+
+class Object(ID):
+    def __init__(self, name, library=None, asset=False, data=None, instance_collection=None, materials=()):
+        super().__init__(name, library, asset)
+        self.type = 'MESH' if data is not None else 'EMPTY'
+        self.data = data
+        self.instance_collection = instance_collection
+        self.instance_type = 'COLLECTION' if instance_collection is not None else 'NONE'
+        self.material_slots = [_MaterialSlot(m) for m in materials]
+        self.animation_data = None
+        self.hide_viewport = False
+        self.hide_select = False
+        self.matrix_world = None
+        self._selected = False
+        self._hidden = False
+
+    @property
+    def original(self):
+        return self
+
+    def select_set(self, state):
+        self._selected = state
+
+    def select_get(self):
+        return self._selected
+
+    def hide_set(self, state, view_layer=None):
+        self._hidden = state
+
+    def hide_get(self, view_layer=None):
+        return self._hidden
+
+
+class _IDCollection:
+    """bpy.data.<type>: insertion ordered, with Blender's get() semantics.
+
+    get(name) prefers a local ID, get((name, library filepath)) finds a
+    linked one. Both are dict lookups, like Blender's name maps.
+    """
+
+    def __init__(self):
+        self._ids = {}       # (name, library filepath or None) -> ID
+        self._by_name = {}   # name -> IDs with that name, in insertion order
+
+    @staticmethod
+    def _key(id_data):
+        return (id_data.name, id_data.library.filepath if id_data.library else None)
+
+    def link(self, id_data):
+        self._ids[self._key(id_data)] = id_data
+        self._by_name.setdefault(id_data.name, []).append(id_data)
+        return id_data
+
+    def get(self, key, default=None):
+        if isinstance(key, tuple):
+            return self._ids.get(key, default)
+        local = self._ids.get((key, None))
+        if local is not None:
+            return local
+        named = self._by_name.get(key)
+        return named[0] if named else default
+
+    def remove(self, id_data, **_options):
+        self._ids.pop(self._key(id_data), None)
+        named = self._by_name.get(id_data.name, [])
+        if id_data in named:
+            named.remove(id_data)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids.values())
+
+    def __bool__(self):
+        return bool(self._ids)
+
+
+class _ObjectCollection(_IDCollection):
+    def new(self, name, object_data):
+        return self.link(Object(name, data=object_data))
+
+
+class _SceneObjects(_IDCollection):
+    """Scene.objects / Collection.objects / ViewLayer.objects"""
+
+    def __init__(self):
+        super().__init__()
+        self.active = None
+
+
+class Collection(ID):
+    def __init__(self, name, library=None, asset=False):
+        super().__init__(name, library, asset)
+        self.objects = _SceneObjects()
+        self.children = _IDCollection()
+
+    @property
+    def all_objects(self):
+        return list(self.objects)
+
+
+class Scene(ID):
+    def __init__(self, name="Scene"):
+        super().__init__(name)
+        self.objects = _SceneObjects()
+        self.collection = Collection("Scene Collection")
+        # Objects linked to the master collection are the scene's objects
+        self.collection.objects = self.objects
+        self.cursor = types.SimpleNamespace(location=(0.0, 0.0, 0.0))
+        self.world = None
+
+
+class WindowManager(ID):
+    def __init__(self):
+        super().__init__("WinMan")
+        self.windows = []
+
+
+class _BlendData:
+    def __init__(self):
+        self.filepath = ""
+        self.objects = _ObjectCollection()
+        for attr in ("libraries", "collections", "materials", "node_groups", "worlds",
+                     "actions", "images", "meshes", "scenes"):
+            setattr(self, attr, _IDCollection())
+
+    def batch_remove(self, ids):
+        for id_data in list(ids):
+            for attr, value in vars(self).items():
+                if isinstance(value, _IDCollection) and value.get(_IDCollection._key(id_data)) is id_data:
+                    value.remove(id_data)
+
+    def user_map(self, subset=None, key_types=None, value_types=None):
+        return {}
+
+
+# =========================================================================
+# TYPES / APP / UTILS / PATH / CONTEXT
+# =========================================================================
+
+class Operator(bpy_struct):
+    def report(self, level, message):
+        pass
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class Menu(bpy_struct):
+    pass
+
+
+class AddonPreferences(bpy_struct):
+    pass
+
+
+class UIList(bpy_struct):
+    bitflag_filter_item = 1 << 30
+    filter_name = ""
+    use_filter_sort_reverse = False
+    use_filter_sort_alpha = False
+
+
+class Depsgraph:
+    def __init__(self, updates=()):
+        self.updates = list(updates)
+
+
+class DepsgraphUpdate:
+    def __init__(self, id_data, is_updated_transform=False, is_updated_geometry=False):
+        self.id = id_data
+        self.is_updated_transform = is_updated_transform
+        self.is_updated_geometry = is_updated_geometry
+        self.is_updated_shading = False
+
+
+bpy_types = types.ModuleType("bpy.types")
+for _cls in (bpy_struct, PropertyGroup, ID, Library, Mesh, Material, NodeTree, World, Action,
+             Image, Object, Collection, Scene, WindowManager, Operator, Panel, Menu,
+             AddonPreferences, UIList, Depsgraph, DepsgraphUpdate):
+    setattr(bpy_types, _cls.__name__, _cls)
+
+
+# Callbacks Blender checks on registration: name -> (min, max) argument
+# count, self/cls included (the trailing ones of draw_item are optional)
+CALLBACK_ARGS = {
+    "poll": (2, 2),
+    "draw": (2, 2),
+    "draw_header": (2, 2),
+    "draw_filter": (3, 3),
+    "draw_item": (8, 10),
+    "filter_items": (4, 4),
+    "execute": (2, 2),
+    "invoke": (3, 3),
+    "modal": (3, 3),
+    "check": (2, 2),
+    "cancel": (2, 2),
+}
+
+
+def register_class(cls):
+    for name, (low, high) in CALLBACK_ARGS.items():
+        func = cls.__dict__.get(name)
+        if func is None:
+            continue
+        func = getattr(func, "__func__", func)
+        count = func.__code__.co_argcount
+        if not low <= count <= high:
+            expected = low if low == high else f"{low}-{high}"
+            raise ValueError(f"expected {cls.__name__} class \"{name}\" function to have "
+                             f"{expected} args, found {count}")
+    for name, value in getattr(cls, "__annotations__", {}).items():
+        if isinstance(value, _Property):
+            setattr(cls, name, value)
+
+
+def unregister_class(cls):
+    pass
+
+
+bpy_utils = types.ModuleType("bpy.utils")
+bpy_utils.register_class = register_class
+bpy_utils.unregister_class = unregister_class
+
+
+class _Timers:
+    """bpy.app.timers; run_pending() plays the role of Blender's event loop"""
+
+    def __init__(self):
+        self._callbacks = {}
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self._callbacks[function] = first_interval
+
+    def unregister(self, function):
+        self._callbacks.pop(function, None)
+
+    def is_registered(self, function):
+        return function in self._callbacks
+
+    def run_pending(self, only=None):
+        """Calls every registered timer (or just the ones in `only`) once"""
+        ran = 0
+        for function in list(self._callbacks):
+            if only is not None and function not in only:
+                continue
+            ran += 1
+            if function() is None:
+                self._callbacks.pop(function, None)
+        return ran
+
+
+app = types.ModuleType("bpy.app")
+app.version = (5, 1, 0)
+app.binary_path = ""
+app.timers = _Timers()
+app.handlers = types.SimpleNamespace(
+    depsgraph_update_post=[], load_post=[], load_pre=[], save_pre=[], render_init=[],
+    persistent=lambda function: function,
+)
+
+path = types.ModuleType("bpy.path")
+
+
+def _abspath(filepath, library=None):
+    if filepath.startswith("//"):
+        return os.path.join(os.path.dirname(data.filepath), filepath[2:])
+    return filepath
+
+
+path.abspath = _abspath
+path.relpath = lambda filepath, start=None: filepath
+path.basename = os.path.basename
+
+data = _BlendData()
+context = types.SimpleNamespace(
+    scene=None, view_layer=None, window_manager=WindowManager(), selected_objects=[],
+    active_object=None, blend_data=data,
+)
+ops = types.SimpleNamespace(
+    object=types.SimpleNamespace(select_all=lambda **kwargs: {'FINISHED'}),
+    wm=types.SimpleNamespace(),
+)
+
+
+def new_scene(name="Scene"):
+    """Creates a scene with its view layer and makes it the context scene"""
+    scene = Scene(name)
+    data.scenes.link(scene)
+    context.scene = scene
+    context.view_layer = types.SimpleNamespace(objects=scene.objects)
+    return scene
+
+
+# =========================================================================
+# INSTALL
+# =========================================================================
+
+class _Vector(tuple):
+    pass
+
+
+class _Matrix:
+    pass
+
+
+def install():
+    """Registers bpy, bpy_extras and mathutils stand-ins in sys.modules"""
+    bpy = types.ModuleType("bpy")
+    bpy.props = props
+    bpy.types = bpy_types
+    bpy.utils = bpy_utils
+    bpy.app = app
+    bpy.path = path
+    bpy.data = data
+    bpy.context = context
+    bpy.ops = ops
+    bpy.stub = sys.modules[__name__]
+
+    io_utils = types.ModuleType("bpy_extras.io_utils")
+    io_utils.ImportHelper = type("ImportHelper", (), {})
+    io_utils.ExportHelper = type("ExportHelper", (), {})
+    bpy_extras = types.ModuleType("bpy_extras")
+    bpy_extras.io_utils = io_utils
+
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = _Vector
+    mathutils.Matrix = _Matrix
+
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.props": props,
+        "bpy.types": bpy_types,
+        "bpy.utils": bpy_utils,
+        "bpy.app": app,
+        "bpy.path": path,
+        "bpy_extras": bpy_extras,
+        "bpy_extras.io_utils": io_utils,
+        "mathutils": mathutils,
+    })
+    return bpy
@@ -0,0 +1,69 @@
+"""Records depsgraph updates from a real Blender session for run_benchmarks.py.
+
+    blender scene.blend --python benchmarks/record_depsgraph.py -- updates.jsonl
+
+Work in the scene as usual; every depsgraph_update_post call is appended to
+the file as one JSON line. Run the script again to stop recording.
+"""
+
+import json
+import sys
+import time
+
+import bpy
+
+ID_TYPES = (
+    (bpy.types.Object, 'OBJECT'),
+    (bpy.types.Collection, 'COLLECTION'),
+    (bpy.types.Scene, 'SCENE'),
+    (bpy.types.Mesh, 'MESH'),
+    (bpy.types.Material, 'MATERIAL'),
+)
+
+_state = {"file": None, "start": 0.0}
+
+
+def _id_type(id_data):
+    for cls, name in ID_TYPES:
+        if isinstance(id_data, cls):
+            return name
+    return None
+
+
+@bpy.app.handlers.persistent
+def record_updates(scene, depsgraph):
+    updates = []
+    for update in depsgraph.updates:
+        id_type = _id_type(update.id)
+        if id_type is None:
+            continue
+        id_data = update.id.original
+        updates.append({
+            "type": id_type,
+            "name": id_data.name,
+            "library": id_data.library.filepath if getattr(id_data, "library", None) else None,
+            "transform": update.is_updated_transform,
+            "geometry": update.is_updated_geometry,
+        })
+    event = {"t": time.monotonic() - _state["start"], "scene": scene.name, "updates": updates}
+    _state["file"].write(json.dumps(event) + "\n")
+    _state["file"].flush()
+
+
+def main():
+    handlers = bpy.app.handlers.depsgraph_update_post
+    for handler in [h for h in handlers if getattr(h, "__name__", "") == "record_updates"]:
+        handlers.remove(handler)
+        print("Depsgraph recording stopped")
+        return
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    filepath = argv[0] if argv else "depsgraph_updates.jsonl"
+    _state["file"] = open(filepath, "a", encoding="utf-8")
+    _state["start"] = time.monotonic()
+    handlers.append(record_updates)
+    print(f"Recording depsgraph updates to {filepath}")
+
+
+if __name__ == "__main__":
+    main()
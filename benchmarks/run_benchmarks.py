@@ -0,0 +1,455 @@
+"""Synthetic-scene benchmarks for the Library Manager hot paths.
+
+Runs the add-on against bpy_stub (no Blender needed) on a generated data
+set and prints min/median time and peak Python memory per scenario:
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --libraries 100 --assets 5000 --objects 25000
+    python benchmarks/run_benchmarks.py --json new.json --compare old.json
+    python benchmarks/run_benchmarks.py --replay recorded_updates.jsonl
+
+Recorded depsgraph streams come from record_depsgraph.py (run in Blender).
+Without --replay a synthetic stream of transform edits, instance swaps and
+new instances is generated from the same seed as the data set.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import bpy_stub  # noqa: E402
+
+# ID type of a replayed update -> bpy.data attribute
+REPLAY_ID_TYPES = {
+    'OBJECT': "objects",
+    'COLLECTION': "collections",
+    'SCENE': "scenes",
+    'MESH': "meshes",
+    'MATERIAL': "materials",
+}
+
+
+# =========================================================================
+# ADD-ON AND DATA SET
+# =========================================================================
+
+def load_addon(cache_dir):
+    """Imports and registers the add-on on top of the bpy stand-in"""
+    import importlib.util
+
+    # Keep the persistent scan cache out of the user's cache directory
+    os.environ["XDG_CACHE_HOME"] = cache_dir
+    bpy = bpy_stub.install()
+    spec = importlib.util.spec_from_file_location(
+        "library_manager", os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules["library_manager"] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return bpy, addon
+
+
+def build_scene(bpy, library_dir, libraries, assets, objects, seed):
+    """Generates libraries, linked assets and scene objects using them.
+
+    Library files exist on disk (empty), so path checks and the watcher
+    behave like they do for a healthy project. 10% of the libraries are
+    linked indirectly, through another library.
+    """
+    rng = random.Random(seed)
+    stub = bpy.stub
+    data = bpy.data
+    scene = stub.new_scene("Scene")
+    bpy.context.window_manager.linked_list_refresh_delay = 0.0
+
+    libs = []
+    for i in range(libraries):
+        filepath = os.path.join(library_dir, f"lib_{i:05d}.blend")
+        open(filepath, "wb").close()
+        parent = libs[rng.randrange(len(libs))] if libs and rng.random() < 0.1 else None
+        libs.append(data.libraries.link(stub.Library(f"lib_{i:05d}.blend", filepath, parent)))
+
+    # Asset mix: collections and objects (marked as assets) plus directly
+    # linked materials, node groups and images
+    collections, object_assets, materials = [], [], []
+    for i in range(assets):
+        lib = libs[i % libraries]
+        kind = rng.random()
+        if kind < 0.40:
+            collections.append(data.collections.link(stub.Collection(f"Asset_{i:06d}", lib, asset=True)))
+        elif kind < 0.70:
+            mesh = data.meshes.link(stub.Mesh(f"Mesh_{i:06d}", lib, vertices=rng.randrange(10_000), polygons=rng.randrange(10_000)))
+            object_assets.append(data.objects.link(stub.Object(f"Asset_{i:06d}", lib, asset=True, data=mesh)))
+        elif kind < 0.85:
+            materials.append(data.materials.link(stub.Material(f"Material_{i:06d}", lib)))
+        elif kind < 0.95:
+            tree = data.node_groups.link(stub.NodeTree(f"Nodes_{i:06d}", lib))
+            tree.users = rng.randrange(3)
+        else:
+            image = data.images.link(stub.Image(f"Image_{i:06d}", lib, size=(2048, 2048)))
+            image.has_data = rng.random() < 0.5
+            image.users = rng.randrange(3)
+
+    # Scene objects: collection instances, placed object assets (sharing the
+    # linked mesh) and local objects with linked materials
+    collections = collections or [None]
+    object_assets = object_assets or [None]
+    for i in range(objects):
+        kind = rng.random()
+        if kind < 0.6 and collections[0] is not None:
+            obj = stub.Object(f"Instance_{i:07d}", instance_collection=rng.choice(collections))
+        elif kind < 0.9 and object_assets[0] is not None:
+            obj = stub.Object(f"Placed_{i:07d}", data=rng.choice(object_assets).data)
+        else:
+            obj = stub.Object(f"Local_{i:07d}", materials=rng.sample(materials, min(2, len(materials))))
+        data.objects.link(obj)
+        scene.collection.objects.link(obj)
+
+    return scene
+
+
+# =========================================================================
+# DEPSGRAPH STREAMS
+# =========================================================================
+
+def synthetic_stream(bpy, scene, events, seed):
+    """Edit session: mostly transform drags, some swaps and new instances"""
+    rng = random.Random(seed + 1)
+    names = [obj.name for obj in scene.objects]
+    collections = [(c.name, c.library.filepath) for c in bpy.data.collections if c.library]
+    stream = []
+    t = 0.0
+    for i in range(events):
+        # Bursts of 30 events 16ms apart, then a pause longer than the refresh delay
+        t += 0.016 if i % 30 else 1.0
+        roll = rng.random()
+        if roll < 0.90 or not collections:
+            moved = rng.sample(names, min(len(names), rng.randint(1, 50)))
+            stream.append({"t": t, "updates": [
+                {"type": 'OBJECT', "name": name, "transform": True} for name in moved]})
+        elif roll < 0.97:
+            name = rng.choice(names)
+            stream.append({"t": t, "ops": [
+                {"op": "retarget", "object": name, "collection": list(rng.choice(collections))}],
+                "updates": [{"type": 'OBJECT', "name": name}]})
+        else:
+            name = f"Replay_{i:06d}"
+            stream.append({"t": t, "ops": [
+                {"op": "add_instance", "object": name, "collection": list(rng.choice(collections))}],
+                "updates": [{"type": 'OBJECT', "name": name},
+                            {"type": 'COLLECTION', "name": "Scene Collection"},
+                            {"type": 'SCENE', "name": scene.name}]})
+    return stream
+
+
+def load_stream(filepath):
+    with open(filepath, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _resolve(bpy, scene, entry):
+    if entry["type"] == 'SCENE':
+        return scene
+    if entry["type"] == 'COLLECTION' and entry["name"] == scene.collection.name:
+        return scene.collection
+    attr = REPLAY_ID_TYPES.get(entry["type"])
+    if attr is None:
+        return None
+    ids = getattr(bpy.data, attr)
+    library = entry.get("library")
+    return ids.get((entry["name"], library)) if library else ids.get(entry["name"])
+
+
+def _apply_op(bpy, scene, op):
+    collection = bpy.data.collections.get(tuple(op["collection"]))
+    if op["op"] == "retarget":
+        obj = bpy.data.objects.get(op["object"])
+        if obj is not None:
+            obj.instance_collection = collection
+    elif op["op"] == "add_instance":
+        obj = bpy.stub.Object(op["object"], instance_collection=collection)
+        bpy.data.objects.link(obj)
+        scene.collection.objects.link(obj)
+
+
+# =========================================================================
+# SCENARIOS
+# =========================================================================
+# Each scenario returns (setup, run): setup is untimed and runs before every
+# timed run() call; run() returns the number of items it processed.
+
+def scenario_refresh_cold(env):
+    utils, usage_index, scene, wm = env["utils"], env["usage_index"], env["scene"], env["wm"]
+
+    def setup():
+        usage_index.clear()
+        utils._overlays.clear()
+        utils.invalidate_library_inventory()
+        wm.linked_assets_list.clear()
+
+    def run():
+        utils.update_linked_items_list(scene, full_rebuild=True)
+        return len(wm.linked_assets_list)
+    return setup, run
+
+
+def scenario_refresh_noop(env):
+    utils, scene, wm = env["utils"], env["scene"], env["wm"]
+
+    def run():
+        utils.update_linked_items_list(scene)
+        return len(wm.linked_assets_list)
+    return None, run
+
+
+def scenario_expand_all(env):
+    utils, wm = env["utils"], env["wm"]
+
+    def setup():
+        utils.set_all_expanded(wm, False)
+
+    def run():
+        utils.set_all_expanded(wm, True)
+        return len(wm.linked_assets_list)
+    return setup, run
+
+
+def scenario_refresh_expanded(env):
+    utils, scene, wm = env["utils"], env["scene"], env["wm"]
+    utils.set_all_expanded(wm, True)
+
+    def run():
+        utils.update_linked_items_list(scene, full_rebuild=True)
+        return len(wm.linked_assets_list)
+    return None, run
+
+
+def _filter_scenario(filter_name="", sort_mode='NONE', reverse=False):
+    def scenario(env):
+        utils, ui, wm = env["utils"], env["ui"], env["wm"]
+        utils.set_all_expanded(wm, True)
+        ui_list = ui.VIEW3D_UL_libraries()
+        ui_list.filter_name = filter_name
+        ui_list.sort_mode = sort_mode
+        ui_list.use_filter_sort_reverse = reverse
+
+        def run():
+            ui_list.filter_items(env["bpy"].context, wm, "linked_assets_list")
+            return len(wm.linked_assets_list)
+        return None, run
+    return scenario
+
+
+def _select_scenario(pick_library):
+    def scenario(env):
+        utils, scene, wm, bpy = env["utils"], env["scene"], env["wm"], env["bpy"]
+        utils.set_all_expanded(wm, True)
+        rows = [item for item in wm.linked_assets_list if item.is_library == pick_library]
+        item = max(rows, key=lambda row: row.instance_count)
+
+        def run():
+            return utils.select_instances_internal(scene, bpy.context, item)
+        return None, run
+    return scenario
+
+
+# Typed one keystroke at a time, with a typo
+SEARCH_KEYSTROKES = ["a", "as", "ass", "asse", "asset", "asset ", "asset 0", "asset 00", "asset 004", "asset 0042", "aset 0042"]
+
+
+def scenario_fuzzy_search(env):
+    search_index = env["search_index"]
+
+    def setup():
+        # Cold cache: every keystroke is a new query
+        search_index.index._cache.clear()
+
+    def run():
+        for query in SEARCH_KEYSTROKES:
+            search_index.index.search(query, limit=8)
+        return len(SEARCH_KEYSTROKES)
+    return setup, run
+
+
+def scenario_depsgraph_replay(env):
+    utils, scene, bpy = env["utils"], env["scene"], env["bpy"]
+    stream = env["stream"]
+    refresh = {utils._run_scheduled_refresh}
+
+    def run():
+        refreshes = 0
+        delay = bpy.context.window_manager.linked_list_refresh_delay
+        for i, event in enumerate(stream):
+            for op in event.get("ops", ()):
+                _apply_op(bpy, scene, op)
+            updates = []
+            for entry in event.get("updates", ()):
+                id_data = _resolve(bpy, scene, entry)
+                if id_data is not None:
+                    updates.append(bpy.stub.DepsgraphUpdate(
+                        id_data, entry.get("transform", False), entry.get("geometry", False)))
+            utils.auto_update_linked_handler(scene, bpy.stub.Depsgraph(updates))
+
+            # The debounce timer fires in gaps longer than the refresh delay
+            next_t = stream[i + 1]["t"] if i + 1 < len(stream) else float("inf")
+            if next_t - event["t"] > max(delay, 0.1):
+                refreshes += bpy.app.timers.run_pending(only=refresh)
+        env["refreshes"] = refreshes
+        return len(stream)
+    return None, run
+
+
+SCENARIOS = (
+    ("refresh_cold", scenario_refresh_cold),
+    ("refresh_noop", scenario_refresh_noop),
+    ("expand_all", scenario_expand_all),
+    ("refresh_expanded", scenario_refresh_expanded),
+    ("filter_plain", _filter_scenario()),
+    ("filter_search", _filter_scenario(filter_name="_0042")),
+    ("filter_sort_name", _filter_scenario(sort_mode='NAME')),
+    ("filter_sort_count_reverse", _filter_scenario(sort_mode='COUNT', reverse=True)),
+    ("select_library", _select_scenario(True)),
+    ("select_asset", _select_scenario(False)),
+    ("fuzzy_search", scenario_fuzzy_search),
+    ("depsgraph_replay", scenario_depsgraph_replay),
+)
+
+
+# =========================================================================
+# RUNNER
+# =========================================================================
+
+def measure(setup, run, repeat):
+    """Returns (timings, items, peak traced bytes); memory is traced in an extra run"""
+    timings = []
+    items = 0
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        items = run()
+        timings.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return timings, items, peak
+
+
+def _max_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--libraries", type=int, default=1000)
+    parser.add_argument("--assets", type=int, default=50000)
+    parser.add_argument("--objects", type=int, default=250000)
+    parser.add_argument("--events", type=int, default=300, help="Synthetic depsgraph events")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenario", action="append", help="Run only these (repeatable)")
+    parser.add_argument("--replay", help="JSON lines depsgraph stream from record_depsgraph.py")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--compare", help="Results file of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    names = {name for name, _ in SCENARIOS}
+    for name in args.scenario or ():
+        if name not in names:
+            parser.error(f"unknown scenario {name!r} (choose from {', '.join(sorted(names))})")
+
+    with tempfile.TemporaryDirectory(prefix="library_manager_bench_") as workdir:
+        bpy, addon = load_addon(os.path.join(workdir, "cache"))
+        library_dir = os.path.join(workdir, "libraries")
+        os.makedirs(library_dir)
+
+        start = time.perf_counter()
+        scene = build_scene(bpy, library_dir, args.libraries, args.assets, args.objects, args.seed)
+        print(f"Data set: {args.libraries} libraries, {args.assets} assets, {args.objects} objects "
+              f"(built in {time.perf_counter() - start:.1f}s)")
+
+        env = {"bpy": bpy, "scene": scene, "wm": bpy.context.window_manager,
+               "utils": addon.utils, "ui": addon.ui, "usage_index": addon.usage_index,
+               "search_index": addon.search_index}
+        env["stream"] = (load_stream(args.replay) if args.replay
+                         else synthetic_stream(bpy, scene, args.events, args.seed))
+        # First refresh outside the measurements (path checks, watcher start)
+        addon.path_status.service.probe_many(addon.utils.library_abspath(lib) for lib in bpy.data.libraries)
+        addon.utils.update_linked_items_list(scene)
+
+        results = []
+        print(f"{'scenario':<28}{'min ms':>10}{'median ms':>12}{'peak KiB':>12}{'items':>10}")
+        try:
+            for name, scenario in SCENARIOS:
+                if args.scenario and name not in args.scenario:
+                    continue
+                setup, run = scenario(env)
+                timings, items, peak = measure(setup, run, args.repeat)
+                result = {
+                    "scenario": name,
+                    "min_ms": min(timings) * 1000.0,
+                    "median_ms": statistics.median(timings) * 1000.0,
+                    "peak_kib": peak / 1024.0,
+                    "items": items,
+                }
+                if name == "depsgraph_replay":
+                    result["refreshes"] = env.get("refreshes", 0)
+                results.append(result)
+                print(f"{name:<28}{result['min_ms']:>10.2f}{result['median_ms']:>12.2f}"
+                      f"{result['peak_kib']:>12.1f}{items:>10}")
+        finally:
+            addon.unregister()
+
+    report = {
+        "addon_version": list(addon.bl_info["version"]),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {key: getattr(args, key) for key in ("libraries", "assets", "objects", "events", "seed", "repeat")},
+        "replay": args.replay,
+        "max_rss_kib": _max_rss_kb(),
+        "results": results,
+    }
+    print(f"Max RSS: {report['max_rss_kib']} KiB")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = {r["scenario"]: r for r in json.load(f)["results"]}
+        print(f"\n{'scenario':<28}{'old ms':>10}{'new ms':>10}{'ratio':>8}")
+        for result in results:
+            old = baseline.get(result["scenario"])
+            if old:
+                ratio = result["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+                print(f"{result['scenario']:<28}{old['median_ms']:>10.2f}{result['median_ms']:>10.2f}{ratio:>8.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
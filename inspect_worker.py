@@ -0,0 +1,96 @@
+# =========================================================================
+# HEADLESS INSPECTION WORKER
+# =========================================================================
+# Runs inside a background Blender started by worker_pool:
+#   blender -b --factory-startup --python inspect_worker.py
+# Reads one .blend path per line from stdin, opens it and answers with one
+# RESULT_PREFIX + JSON line on stdout. Blender prints its own messages on
+# stdout too, so the prefix is what tells results apart.
+# This file is never imported by the add-on itself.
+
+import json
+import os
+import sys
+import time
+
+import bpy
+
+RESULT_PREFIX = "LIBRARY_MANAGER_RESULT:"
+
+# (id_type, bpy.data attribute) reported per file
+ID_TYPES = (
+    ('COLLECTION', "collections"),
+    ('OBJECT', "objects"),
+    ('MATERIAL', "materials"),
+    ('NODETREE', "node_groups"),
+    ('WORLD', "worlds"),
+    ('ACTION', "actions"),
+    ('IMAGE', "images"),
+)
+
+# External files a .blend can depend on besides libraries
+RESOURCE_TYPES = ("images", "sounds", "movieclips", "fonts", "volumes", "cache_files")
+
+
+def _exists(filepath, id_data):
+    return os.path.exists(os.path.abspath(bpy.path.abspath(filepath, library=id_data.library)))
+
+
+def inspect(path):
+    start = time.perf_counter()
+    bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+    load_time = time.perf_counter() - start
+
+    ids = {}
+    assets = []
+    for id_type, attr in ID_TYPES:
+        names = []
+        for id_data in getattr(bpy.data, attr):
+            if id_data.library is not None:
+                continue
+            names.append(id_data.name)
+            if id_data.asset_data:
+                assets.append([id_data.name, id_type])
+        ids[id_type] = names
+
+    libraries = []
+    for lib in bpy.data.libraries:
+        abs_path = os.path.abspath(bpy.path.abspath(lib.filepath, library=lib.parent))
+        libraries.append({"filepath": lib.filepath, "abspath": abs_path,
+                          "exists": os.path.exists(abs_path)})
+
+    missing = []
+    for attr in RESOURCE_TYPES:
+        for id_data in getattr(bpy.data, attr, ()):
+            filepath = getattr(id_data, "filepath", "")
+            if not filepath or getattr(id_data, "packed_file", None) is not None:
+                continue
+            if not _exists(filepath, id_data):
+                missing.append([attr, id_data.name, filepath])
+
+    return {
+        "filepath": path,
+        "ok": True,
+        "load_time": load_time,
+        "ids": ids,
+        "assets": assets,
+        "libraries": libraries,
+        "missing": missing,
+    }
+
+
+def main():
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+        try:
+            result = inspect(path)
+        except Exception as e:
+            result = {"filepath": path, "ok": False, "error": str(e)}
+        sys.stdout.write(RESULT_PREFIX + json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
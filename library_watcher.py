@@ -0,0 +1,328 @@
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import threading
+import time
+
+from . import path_status
+
+# =========================================================================
+# LIBRARY FILE WATCHER
+# =========================================================================
+# Tracks (mtime, size) for every linked library file on a background thread
+# and flags the ones that changed on disk since they were loaded ("stale").
+# Local directories are watched with inotify when libc provides it; polling
+# is always kept as a slow backstop because network shares (NFS/SMB) do not
+# report changes made by other machines.
+
+
+def file_fingerprint(path):
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def file_content_hash(path, chunk_size=1024 * 1024):
+    """blake2b hex digest of a file's content, or None if it cannot be read"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+# --- INOTIFY (Linux only, optional) ---
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes wrapper: watches directories, yields changed file paths"""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify not available")
+        self._libc = libc
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}   # watch descriptor -> directory
+        self._wds = {}    # directory -> watch descriptor
+
+    def watch_dirs(self, directories):
+        for directory in set(directories) - set(self._wds):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+                self._wds[directory] = wd
+
+    def read(self, timeout):
+        """Blocks up to `timeout` seconds, returns the set of touched paths"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        paths = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory and name:
+                paths.add(os.path.join(directory, os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+# --- WATCHER ---
+
+class LibraryWatcher:
+    """Background (mtime, size) tracker for linked library files"""
+
+    def __init__(self, interval=2.0, batch_size=64, use_inotify=True, hash_baselines=True):
+        self.interval = interval         # Seconds between polling batches
+        self.batch_size = batch_size     # Max files stat'ed per batch
+        self.use_inotify = use_inotify
+        self.hash_baselines = hash_baselines  # Hash loaded files in the background
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._paths = []          # Round-robin polling order
+        self._path_set = set()
+        self._cursor = 0
+        self._baseline = {}       # path -> fingerprint when loaded/acknowledged
+        self._pending = []        # New paths waiting for their first fingerprint
+        self._hashes = {}         # path -> content hash of the baseline (once computed)
+        self._unhashed = []       # Baselines still waiting for their content hash
+        self._current = {}        # path -> last seen fingerprint
+        self._stale = set()
+        self._changed = False
+
+    # --- Main thread API ---
+
+    def set_paths(self, paths):
+        """Replaces the watched set. Cheap when nothing changed, never stats.
+
+        New paths wait for their baseline, which the watcher thread takes as
+        soon as it wakes, before it checks any event or polling batch: the
+        baseline must be what Blender loaded, not a later change.
+        """
+        paths = set(paths)
+        with self._lock:
+            if paths == self._path_set:
+                return
+            self._pending.extend(path for path in paths - self._path_set if path not in self._baseline)
+            for gone in self._path_set - paths:
+                self._baseline.pop(gone, None)
+                self._hashes.pop(gone, None)
+                self._current.pop(gone, None)
+                self._stale.discard(gone)
+            self._paths = sorted(paths)
+            self._path_set = paths
+            self._cursor = 0
+        self.start()
+        self._wake.set()
+
+    def acknowledge(self, path, fingerprint=None, content_hash=None):
+        """Marks the file as loaded as-is (e.g. right after a reload)"""
+        if fingerprint is None:
+            fingerprint = file_fingerprint(path)
+        with self._lock:
+            self._baseline[path] = fingerprint
+            if content_hash is None:
+                self._hashes.pop(path, None)
+                self._unhashed.append(path)
+            else:
+                self._hashes[path] = content_hash
+            self._current[path] = fingerprint
+            if path in self._stale:
+                self._stale.discard(path)
+                self._changed = True
+
+    def baseline(self, path):
+        with self._lock:
+            return self._baseline.get(path)
+
+    def is_tracked(self, path):
+        """True once a baseline exists (the path was watched or acknowledged)"""
+        with self._lock:
+            return path in self._baseline
+
+    def baseline_hash(self, path):
+        with self._lock:
+            return self._hashes.get(path)
+
+    def is_stale(self, path):
+        with self._lock:
+            return path in self._stale
+
+    def stale_paths(self):
+        with self._lock:
+            return set(self._stale)
+
+    def take_changed(self):
+        """True once after the stale set changed or baselines were taken; resets the flag"""
+        with self._lock:
+            changed = self._changed
+            self._changed = False
+            return changed
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="LibraryManagerWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # --- Worker thread ---
+
+    def _take_baselines(self):
+        """Stats the paths set_paths() added and makes that their baseline"""
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+        for path in pending:
+            fingerprint = file_fingerprint(path)
+            path_status.service.record(path, fingerprint is not None, fingerprint)
+            with self._lock:
+                # Dropped meanwhile, or acknowledged after a reload
+                if path not in self._path_set or path in self._baseline:
+                    continue
+                self._baseline[path] = fingerprint
+                self._current[path] = fingerprint
+                self._unhashed.append(path)
+                self._changed = True
+
+    def _check(self, paths):
+        """Stats `paths` and updates the stale set"""
+        for path in paths:
+            fingerprint = file_fingerprint(path)
+            path_status.service.record(path, fingerprint is not None, fingerprint)
+            with self._lock:
+                # Paths without a baseline are not watched (yet); a change
+                # seen now must never become what counts as "loaded"
+                if path not in self._path_set or path not in self._baseline:
+                    continue
+                self._current[path] = fingerprint
+                stale = fingerprint is not None and fingerprint != self._baseline.get(path)
+                if stale != (path in self._stale):
+                    if stale:
+                        self._stale.add(path)
+                    else:
+                        self._stale.discard(path)
+                    self._changed = True
+
+    def _hash_baselines(self, budget):
+        """Hashes baselines for up to `budget` seconds; True if some are left.
+
+        A hash is only kept when the file still has its baseline fingerprint
+        before and after reading it, so it is the content Blender loaded.
+        """
+        deadline = time.monotonic() + budget
+        while self.hash_baselines and not self._stop.is_set():
+            with self._lock:
+                if not self._unhashed:
+                    return False
+                path = self._unhashed.pop()
+                baseline = self._baseline.get(path)
+                if baseline is None or path in self._hashes:
+                    continue
+            if file_fingerprint(path) != baseline:
+                continue
+            content_hash = file_content_hash(path)
+            after = file_fingerprint(path)
+            with self._lock:
+                if content_hash is not None and after == self._baseline.get(path) == baseline:
+                    self._hashes[path] = content_hash
+            if time.monotonic() >= deadline:
+                break
+        with self._lock:
+            return self.hash_baselines and bool(self._unhashed)
+
+    def _next_batch(self):
+        with self._lock:
+            if not self._paths:
+                return [], []
+            count = min(self.batch_size, len(self._paths))
+            batch = [self._paths[(self._cursor + i) % len(self._paths)] for i in range(count)]
+            self._cursor = (self._cursor + count) % len(self._paths)
+            return batch, list(self._paths)
+
+    def _run(self):
+        notifier = None
+        if self.use_inotify:
+            try:
+                notifier = _Inotify()
+            except (OSError, AttributeError):
+                notifier = None
+
+        try:
+            while not self._stop.is_set():
+                self._take_baselines()
+                batch, all_paths = self._next_batch()
+                self._check(batch)
+                hashing = self._hash_baselines(self.interval)
+
+                if notifier is None:
+                    self._wake.wait(0 if hashing else self.interval)
+                    self._wake.clear()
+                    continue
+
+                # Events for watched files are checked immediately; the
+                # polling batches above keep running at a slower pace
+                notifier.watch_dirs(os.path.dirname(p) for p in all_paths)
+                watched = set(all_paths)
+                deadline = time.monotonic() + self.interval * 5
+                while not self._stop.is_set() and not self._wake.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    touched = notifier.read(0 if hashing else min(remaining, 0.5))
+                    self._check(touched & watched)
+                    if hashing:
+                        hashing = self._hash_baselines(0.5)
+                self._wake.clear()
+        finally:
+            if notifier is not None:
+                notifier.close()
+
+
+watcher = LibraryWatcher()
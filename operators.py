@@ -1,8 +1,38 @@
 import bpy
+import math
 import os
+import random
+import re
 import subprocess
-from bpy_extras.io_utils import ImportHelper
-from .utils import auto_update_linked_handler, select_instances_internal, update_linked_items_list
+import time
+from concurrent.futures import ThreadPoolExecutor
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from mathutils import Matrix, Vector
+from . import blendfile
+from . import library_watcher
+from . import path_status
+from . import worker_pool
+from .profiler import profiler
+from .utils import (
+    auto_update_linked_handler,
+    find_unused_libraries,
+    has_reveal_snapshot,
+    linked_ids_from,
+    proxied_libraries,
+    proxy_path,
+    PROXY_PATH_KEY,
+    relocate_libraries,
+    reload_times,
+    reload_library,
+    restore_revealed_objects,
+    reveal_item_objects,
+    restore_proxies,
+    reveal_list_row,
+    select_instances_internal,
+    set_all_expanded,
+    update_linked_items_list,
+    watch_worker_results,
+)
 
 # =========================================================================
 # PF = PREFERENCES
@@ -13,6 +43,9 @@ from .utils import auto_update_linked_handler, select_instances_internal, update
 # IT = ITEM
 # =========================================================================
 
+# Lines listed in a popup or dialog before "... and N more"
+DIALOG_ROWS = 25
+
 
 def absolute_path(relpath):
     return os.path.abspath(bpy.path.abspath(relpath))
@@ -290,6 +323,8 @@ class WM_OT_refresh_libraries(bpy.types.Operator):
     bl_label = "Refresh Libraries List"
 
     def execute(self, context):
+        # A manual refresh re-checks every library file in the background
+        path_status.service.invalidate()
         update_linked_items_list(bpy.context.scene, bpy.context)
         return {'FINISHED'}
 
@@ -319,12 +354,10 @@ class WM_OT_toggle_all_linked_categories(bpy.types.Operator):
     bl_label = "Expand/Collapse All Linked Categories"
     
     def execute(self, context):
-        scene = context.scene
-        first_lib = next((i for i in scene.linked_assets_list if i.is_library), None)
+        wm = context.window_manager
+        first_lib = next((i for i in wm.linked_assets_list if i.is_library), None)
         if first_lib:
-            target_state = not first_lib.is_expanded
-            for item in scene.linked_assets_list:
-                if item.is_library: item.is_expanded = target_state
+            set_all_expanded(wm, not first_lib.is_expanded)
         return {'FINISHED'}
 
 
@@ -345,7 +378,7 @@ class WM_OT_reload_library(bpy.types.Operator):
             return {'CANCELLED'}
         
         try:
-            library.reload()
+            reload_library(library)
             self.report({'INFO'}, f"Reloaded: {self.library_name}")
             update_linked_items_list(context.scene, context)
             
@@ -354,6 +387,78 @@ class WM_OT_reload_library(bpy.types.Operator):
             
         return {'FINISHED'}
 
+def _check_library_file(path, use_hash):
+    """Worker thread: returns (changed, content hash, seconds)"""
+    watcher = library_watcher.watcher
+    start = time.perf_counter()
+    fingerprint = library_watcher.file_fingerprint(path)
+    # Without a baseline there is no telling what was loaded: reload to be safe
+    changed = fingerprint is not None and (
+        not watcher.is_tracked(path) or fingerprint != watcher.baseline(path))
+    content_hash = None
+
+    # mtime/size moved: with hashing on, a touched-but-identical file is skipped
+    if changed and use_hash:
+        content_hash = library_watcher.file_content_hash(path)
+        baseline_hash = watcher.baseline_hash(path)
+        if baseline_hash is not None and content_hash == baseline_hash:
+            changed = False
+
+    return changed, content_hash, time.perf_counter() - start
+
+class WM_OT_reload_changed_libraries(bpy.types.Operator):
+    """Reload only the libraries whose file changed on disk, then refresh the list once"""
+    bl_idname = "wm.reload_changed_libraries"
+    bl_label = "Reload Changed"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_hash: bpy.props.BoolProperty(
+        name="Compare Content",
+        description="Hash files whose date or size changed and skip the ones with identical content",
+        default=False,
+    )
+
+    def execute(self, context):
+        libraries = {library.name: absolute_path(library.filepath) for library in bpy.data.libraries}
+        
+        # --- 1. FINGERPRINT EVERY FILE IN PARALLEL ---
+        with ThreadPoolExecutor(max_workers=path_status.service.max_workers) as pool:
+            checks = {
+                name: pool.submit(_check_library_file, path, self.use_hash)
+                for name, path in libraries.items()
+            }
+            checks = {name: future.result() for name, future in checks.items()}
+
+        # --- 2. RELOAD ONLY WHAT CHANGED ---
+        reloaded = 0
+        failed = 0
+        start = time.perf_counter()
+        for name, (changed, content_hash, check_time) in sorted(checks.items()):
+            if not changed:
+                # Touched but identical: accept the new date so it stops showing as stale
+                if content_hash is not None:
+                    library_watcher.watcher.acknowledge(libraries[name], content_hash=content_hash)
+                continue
+            library = bpy.data.libraries.get(name)
+            try:
+                reload_time = reload_library(library, content_hash=content_hash)
+                reloaded += 1
+                self.report({'INFO'}, f"{name}: check {check_time:.3f}s, reload {reload_time:.3f}s")
+            except RuntimeError as e:
+                failed += 1
+                self.report({'WARNING'}, f"{name}: reload failed: {e}")
+
+        # --- 3. ONE LIST REFRESH AT THE END ---
+        if reloaded:
+            update_linked_items_list(context.scene, context)
+
+        msg = f"Reloaded {reloaded} of {len(libraries)} libraries in {time.perf_counter() - start:.2f}s"
+        if failed:
+            self.report({'WARNING'}, f"{msg}, {failed} failed")
+        else:
+            self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
 class WM_OT_open_library(bpy.types.Operator):
     bl_idname = "wm.open_library"
     bl_label = "Open Library in New Window"
@@ -367,8 +472,9 @@ class WM_OT_open_library(bpy.types.Operator):
             return {'CANCELLED'}
         
         filepath_abs = absolute_path(library.filepath)
+        status = path_status.service.probe_many([filepath_abs])[filepath_abs]
         
-        if not os.path.exists(filepath_abs):
+        if status == path_status.STATUS_MISSING:
             self.report({'ERROR'}, f"File not found at: {filepath_abs}")
             return {'CANCELLED'}
             
@@ -399,8 +505,9 @@ class WM_OT_delete_library(bpy.types.Operator):
              self.report({'WARNING'}, f"Library data block not found (Name: {self.library_name}). Already deleted?")
              return {'FINISHED'}
     
+        # Only used for the report message, so the cached status is enough
         filepath_abs = absolute_path(library.filepath)
-        is_broken = not os.path.exists(filepath_abs)
+        is_broken = path_status.service.status(filepath_abs) == path_status.STATUS_MISSING
         
         try:
             bpy.data.libraries.remove(
@@ -421,6 +528,108 @@ class WM_OT_delete_library(bpy.types.Operator):
             
         return {'FINISHED'}
 
+# ID codes of a .blend file -> readable group label
+BLEND_CODE_LABELS = {
+    'GR': "Collections",
+    'OB': "Objects",
+    'MA': "Materials",
+    'NT': "Node Groups",
+    'WO': "Worlds",
+    'AC': "Actions",
+    'IM': "Images",
+    'ME': "Meshes",
+    'SC': "Scenes",
+}
+
+class WM_OT_inspect_library_file(bpy.types.Operator):
+    """List what a library .blend file contains without loading it"""
+    bl_idname = "wm.inspect_library_file"
+    bl_label = "Inspect Library File"
+
+    library_name: bpy.props.StringProperty()
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH') # Used instead of library_name when set
+
+    def invoke(self, context, event):
+        path = self.filepath
+        if not path:
+            library = bpy.data.libraries.get(self.library_name)
+            if not library:
+                self.report({'ERROR'}, f"Library data block not found: {self.library_name}")
+                return {'CANCELLED'}
+            path = library.filepath
+
+        filepath_abs = absolute_path(path)
+        try:
+            self._contents = blendfile.read_blend_contents(filepath_abs)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot open {filepath_abs}: {e}")
+            return {'CANCELLED'}
+        except blendfile.BlendFileError as e:
+            self.report({'ERROR'}, f"Cannot read {filepath_abs}: {e}")
+            return {'CANCELLED'}
+
+        return context.window_manager.invoke_popup(self, width=420)
+
+    def draw(self, context):
+        layout = self.layout
+        contents = self._contents
+        layout.label(text=os.path.basename(contents.filepath), icon='FILE_BLEND')
+        layout.label(text=f"Saved with Blender {contents.version[0]}.{contents.version[1]}")
+
+        groups = {}
+        for id_info in contents.ids:
+            groups.setdefault(id_info.code, []).append(id_info)
+
+        for code in sorted(groups, key=lambda c: BLEND_CODE_LABELS.get(c, c)):
+            ids = groups[code]
+            box = layout.box()
+            box.label(text=f"{BLEND_CODE_LABELS.get(code, code)} ({len(ids)})")
+            col = box.column(align=True)
+            for id_info in ids[:DIALOG_ROWS]:
+                col.label(text=id_info.name, icon='ASSET_MANAGER' if id_info.is_asset else 'DOT')
+            if len(ids) > DIALOG_ROWS:
+                col.label(text=f"... and {len(ids) - DIALOG_ROWS} more")
+
+        if contents.libraries:
+            box = layout.box()
+            box.label(text=f"Linked Libraries ({len(contents.libraries)})")
+            col = box.column(align=True)
+            for path in contents.libraries:
+                col.label(text=f"{path} ({len(contents.linked.get(path, []))} IDs)", icon='LINK_BLEND')
+
+    def execute(self, context):
+        return {'FINISHED'}
+
+class WM_OT_inspect_libraries_background(bpy.types.Operator):
+    """Open library files in headless Blender processes and report assets, sub-libraries, missing resources and load time"""
+    bl_idname = "wm.inspect_libraries_background"
+    bl_label = "Inspect in Background"
+
+    library_name: bpy.props.StringProperty() # Empty: every library
+
+    def execute(self, context):
+        if self.library_name:
+            library = bpy.data.libraries.get(self.library_name)
+            if not library:
+                self.report({'ERROR'}, f"Library data block not found: {self.library_name}")
+                return {'CANCELLED'}
+            libraries = [library]
+        else:
+            libraries = list(bpy.data.libraries)
+
+        paths = {absolute_path(library.filepath) for library in libraries}
+        statuses = path_status.service.probe_many(paths)
+        existing = sorted(p for p in paths if statuses[p] != path_status.STATUS_MISSING)
+        if not existing:
+            self.report({'WARNING'}, "No library file found on disk")
+            return {'CANCELLED'}
+
+        queued = worker_pool.pool.submit(bpy.app.binary_path, existing)
+        watch_worker_results()
+        self.report({'INFO'}, f"Inspecting {queued} library file(s) with up to "
+                              f"{worker_pool.pool.max_workers} background Blender processes")
+        return {'FINISHED'}
+
 class WM_OT_relocate_library(bpy.types.Operator, ImportHelper):
     """Changes the source path of the selected library"""
     bl_idname = "wm.relocate_library"
@@ -436,6 +645,284 @@ class WM_OT_relocate_library(bpy.types.Operator, ImportHelper):
             return {'FINISHED'}
         return {'CANCELLED'}
 
+def remap_path(path, mode, find, replace):
+    """Rewrites one absolute path; returns None when the rule does not apply.
+
+    PREFIX replaces a leading `find` that ends at a path separator (or is
+    the whole path), so /mnt/assets never matches /mnt/assets_old; REGEX is
+    re.sub and raises re.error for an invalid pattern.
+    """
+    if not find:
+        return None
+    if mode == 'PREFIX':
+        path = os.path.normpath(path)
+        prefix = os.path.normpath(find)
+        head = os.path.normcase(path[:len(prefix)])
+        rest = path[len(prefix):]
+        if head != os.path.normcase(prefix):
+            return None
+        if rest and not rest.startswith(os.sep) and not prefix.endswith(os.sep):
+            return None
+        new_path = replace + rest
+    else:
+        new_path, count = re.subn(find, replace, path)
+        if not count:
+            return None
+    return os.path.normpath(new_path) if new_path != path else None
+
+class WM_OT_remap_library_paths(bpy.types.Operator):
+    """Rewrite the paths of many libraries at once (e.g. after a drive or mount moved)"""
+    bl_idname = "wm.remap_library_paths"
+    bl_label = "Remap Library Paths"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('PREFIX', "Prefix", "Replace the start of the path"),
+            ('REGEX', "Regex", "Replace every match of a regular expression"),
+        ],
+        default='PREFIX',
+    )
+    find: bpy.props.StringProperty(name="Find", description="Path prefix or regular expression to look for")
+    replace: bpy.props.StringProperty(name="Replace", description="Replacement (\\1 etc. refer to regex groups)")
+    skip_missing: bpy.props.BoolProperty(
+        name="Skip Missing Targets",
+        description="Leave a library unchanged when its new path does not exist",
+        default=True,
+    )
+
+    def _rewrites(self):
+        """[(library name, old abs path, new abs path)] for the libraries the rule matches"""
+        rewrites = []
+        for library in bpy.data.libraries:
+            old_path = absolute_path(library.filepath)
+            new_path = remap_path(old_path, self.mode, self.find, self.replace)
+            if new_path is not None:
+                rewrites.append((library.name, old_path, new_path))
+        return rewrites
+
+    def _update_preview(self):
+        """Re-runs the rule and checks every new path in parallel"""
+        self._error = ""
+        try:
+            self._preview = self._rewrites()
+        except re.error as e:
+            self._preview = []
+            self._error = f"Invalid pattern: {e}"
+            return
+        # Bounded wait so a dead network share cannot freeze the dialog
+        self._statuses = path_status.service.probe_many(
+            [new_path for _, _, new_path in self._preview], timeout=2.0)
+
+    def invoke(self, context, event):
+        self._update_preview()
+        return context.window_manager.invoke_props_dialog(self, width=600)
+
+    def check(self, context):
+        # Called when a property changes: refresh the preview and redraw
+        self._update_preview()
+        return True
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row()
+        row.prop(self, "mode", expand=True)
+        layout.prop(self, "find")
+        layout.prop(self, "replace")
+        layout.prop(self, "skip_missing")
+
+        if self._error:
+            layout.label(text=self._error, icon='ERROR')
+            return
+
+        preview = self._preview
+        missing = sum(1 for _, _, p in preview if self._statuses.get(p) != path_status.STATUS_OK)
+        box = layout.box()
+        box.label(text=f"{len(preview)} of {len(bpy.data.libraries)} libraries match, {missing} new path(s) not found")
+        col = box.column(align=True)
+        for name, old_path, new_path in preview[:DIALOG_ROWS]:
+            status = self._statuses.get(new_path)
+            if status == path_status.STATUS_OK:
+                icon = 'CHECKMARK'
+            elif status == path_status.STATUS_MISSING:
+                icon = 'ERROR'
+            else:
+                icon = 'TIME'
+            col.label(text=f"{name}: {new_path}", icon=icon)
+        if len(preview) > DIALOG_ROWS:
+            col.label(text=f"... and {len(preview) - DIALOG_ROWS} more")
+
+    def execute(self, context):
+        try:
+            rewrites = self._rewrites()
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid pattern: {e}")
+            return {'CANCELLED'}
+        if not rewrites:
+            self.report({'INFO'}, "No library path matches the rule")
+            return {'CANCELLED'}
+
+        # --- 1. VALIDATE EVERY NEW PATH IN PARALLEL ---
+        new_paths = [new_path for _, _, new_path in rewrites]
+        path_status.service.invalidate(new_paths)
+        statuses = path_status.service.probe_many(new_paths)
+
+        # --- 2. REWRITE ALL PATHS, THEN RELOAD, ONE LIST REFRESH AT THE END ---
+        moves = []
+        skipped = 0
+        for name, old_path, new_path in rewrites:
+            if self.skip_missing and statuses[new_path] != path_status.STATUS_OK:
+                skipped += 1
+                continue
+            moves.append((bpy.data.libraries.get(name), new_path))
+
+        failed = len(relocate_libraries(moves))
+        if moves:
+            update_linked_items_list(context.scene, context)
+
+        msg = f"Remapped {len(moves)} of {len(rewrites)} matching libraries"
+        if skipped:
+            msg += f", skipped {skipped} with missing targets"
+        if failed:
+            self.report({'WARNING'}, f"{msg}, {failed} failed to reload (see console)")
+        else:
+            self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+
+class WM_OT_swap_library_proxies(bpy.types.Operator):
+    """Load the lightweight proxy file of heavy libraries (e.g. forest_proxy.blend) for a faster viewport"""
+    bl_idname = "wm.swap_library_proxies"
+    bl_label = "Swap to Proxies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    library_name: bpy.props.StringProperty(
+        name="Library",
+        description="Only swap this library (empty: every library)",
+    )
+
+    def _plan(self, context):
+        """([(library, proxy abs path)] to swap, [(name, proxy abs path)] without a proxy file)"""
+        suffix = context.window_manager.library_proxy_suffix
+        if self.library_name:
+            library = bpy.data.libraries.get(self.library_name)
+            libraries = [library] if library else []
+        else:
+            libraries = list(bpy.data.libraries)
+
+        candidates = []
+        for library in libraries:
+            full_path = absolute_path(library.filepath)
+            # Already swapped, or itself a proxy file
+            if PROXY_PATH_KEY in library or not suffix or os.path.splitext(full_path)[0].endswith(suffix):
+                continue
+            candidates.append((library, proxy_path(full_path, suffix)))
+
+        # --- CHECK EVERY PROXY FILE IN PARALLEL, BEFORE TOUCHING ANYTHING ---
+        paths = [path for _, path in candidates]
+        path_status.service.invalidate(paths)
+        statuses = path_status.service.probe_many(paths)
+        found = [(lib, path) for lib, path in candidates if statuses[path] == path_status.STATUS_OK]
+        missing = [(lib.name, path) for lib, path in candidates if statuses[path] != path_status.STATUS_OK]
+        return found, missing
+
+    def invoke(self, context, event):
+        self._found, self._missing = self._plan(context)
+        if self._missing:
+            return context.window_manager.invoke_props_dialog(self, width=600)
+        return self.execute(context)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text=f"{len(self._found)} libraries have a proxy, {len(self._missing)} do not "
+                          f"(kept at full resolution):", icon='ERROR')
+        col = layout.box().column(align=True)
+        for name, path in self._missing[:DIALOG_ROWS]:
+            col.label(text=f"{name}: {path}")
+        if len(self._missing) > DIALOG_ROWS:
+            col.label(text=f"... and {len(self._missing) - DIALOG_ROWS} more")
+
+    def execute(self, context):
+        found, missing = self._plan(context)
+        if not found:
+            self.report({'WARNING'}, f"No proxy file found ({len(missing)} missing)")
+            return {'CANCELLED'}
+
+        # Remember the full resolution path (as written) on the library itself,
+        # so the swap survives saving and reopening the file
+        for library, _ in found:
+            library[PROXY_PATH_KEY] = library.filepath
+        failed = relocate_libraries(found)
+
+        # A proxy that fails to load is swapped straight back
+        if failed:
+            restore_proxies([library for library, _ in failed])
+        update_linked_items_list(context.scene, context)
+
+        msg = f"Swapped {len(found) - len(failed)} libraries to proxies"
+        if missing:
+            msg += f", {len(missing)} without proxy"
+        if failed:
+            self.report({'WARNING'}, f"{msg}, {len(failed)} failed to load (see console)")
+        else:
+            self.report({'INFO'}, msg)
+        return {'FINISHED'}
+
+
+class WM_OT_render_full_resolution(bpy.types.Operator):
+    """Restore every proxy library to full resolution, then start the render"""
+    bl_idname = "wm.render_full_resolution"
+    bl_label = "Render Full Resolution"
+
+    animation: bpy.props.BoolProperty(name="Animation", default=False)
+
+    def execute(self, context):
+        # Restored here, before the render job starts: reloading libraries
+        # from the render thread (render_init) is not safe
+        proxied = proxied_libraries()
+        if proxied:
+            failed = restore_proxies(proxied)
+            update_linked_items_list(context.scene, context)
+            if failed:
+                names = ", ".join(library.name for library, _ in failed)
+                self.report({'ERROR'}, f"Render cancelled: {names} could not be restored to full resolution")
+                return {'CANCELLED'}
+        return bpy.ops.render.render('INVOKE_DEFAULT', animation=self.animation)
+
+
+class WM_OT_restore_library_proxies(bpy.types.Operator):
+    """Swap proxy libraries back to their full resolution files (do this before rendering)"""
+    bl_idname = "wm.restore_library_proxies"
+    bl_label = "Restore Full Resolution"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    library_name: bpy.props.StringProperty(
+        name="Library",
+        description="Only restore this library (empty: every proxy library)",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return bool(proxied_libraries())
+
+    def execute(self, context):
+        libraries = proxied_libraries()
+        if self.library_name:
+            libraries = [lib for lib in libraries if lib.name == self.library_name]
+        if not libraries:
+            self.report({'INFO'}, "No proxy library to restore")
+            return {'CANCELLED'}
+
+        failed = restore_proxies(libraries)
+        update_linked_items_list(context.scene, context)
+
+        if failed:
+            self.report({'WARNING'}, f"Restored {len(libraries)} libraries, {len(failed)} failed to reload (see console)")
+        else:
+            self.report({'INFO'}, f"Restored {len(libraries)} libraries to full resolution")
+        return {'FINISHED'}
+
 
 # =========================================================================
 # OBJECT: VIEW & SELECTION
@@ -448,12 +935,10 @@ class OBJECT_OT_ToggleAllLinked(bpy.types.Operator):
     bl_label = "Global Toggle"
 
     def execute(self, context):
-        scene = context.scene
-        first_lib = next((i for i in scene.linked_assets_list if i.is_library), None)
+        wm = context.window_manager
+        first_lib = next((i for i in wm.linked_assets_list if i.is_library), None)
         if first_lib:
-            target_state = not first_lib.is_expanded
-            for item in scene.linked_assets_list:
-                if item.is_library: item.is_expanded = target_state
+            set_all_expanded(wm, not first_lib.is_expanded)
         return {'FINISHED'}
 
 class OBJECT_OT_SelectLinkedFromList(bpy.types.Operator):
@@ -462,13 +947,15 @@ class OBJECT_OT_SelectLinkedFromList(bpy.types.Operator):
     bl_label = "Select Instances"
 
     def execute(self, context):
-        idx = context.scene.linked_assets_index
-        bpy.ops.wm.reveal_all_objects()
+        idx = context.window_manager.linked_assets_index
         
-        if idx < 0 or idx >= len(context.scene.linked_assets_list):
+        if idx < 0 or idx >= len(context.window_manager.linked_assets_list):
             return {'CANCELLED'}
             
-        item = context.scene.linked_assets_list[idx]
+        item = context.window_manager.linked_assets_list[idx]
+
+        # Only unhide this item's objects (undone with Restore Visibility)
+        reveal_item_objects(context.scene, context, item)
         
         # 1. Capture the count from the internal function
         from .utils import select_instances_internal
@@ -491,12 +978,13 @@ class OBJECT_OT_FocusLinkedFromList(bpy.types.Operator):
    
     def execute(self, context):
         scene = context.scene
-        bpy.ops.wm.reveal_all_objects()
+        wm = context.window_manager
         # Ensure we have a valid index
-        if scene.linked_assets_index >= len(scene.linked_assets_list):
+        if wm.linked_assets_index >= len(wm.linked_assets_list):
             return {'CANCELLED'}
             
-        item = scene.linked_assets_list[scene.linked_assets_index]
+        item = wm.linked_assets_list[wm.linked_assets_index]
+        reveal_item_objects(scene, context, item)
 
         from .utils import select_instances_internal
         success = select_instances_internal(scene, context, item)
@@ -517,6 +1005,53 @@ class OBJECT_OT_FocusLinkedFromList(bpy.types.Operator):
         self.report({'WARNING'}, "No visible objects found to focus.")
         return {'CANCELLED'}
 
+class WM_OT_jump_to_linked_item(bpy.types.Operator):
+    """Show this search result in the list and make it the active item"""
+    bl_idname = "wm.jump_to_linked_item"
+    bl_label = "Jump to Item"
+
+    lib_path: bpy.props.StringProperty()
+    name: bpy.props.StringProperty()
+    id_type: bpy.props.StringProperty(default='LIBRARY')
+    is_library: bpy.props.BoolProperty()
+    action: bpy.props.EnumProperty(
+        name="Then",
+        items=[
+            ('NONE', "Jump", "Only make it the active list item"),
+            ('SELECT', "Select", "Then select its objects (Select Item)"),
+            ('FOCUS', "Focus", "Then select and frame its objects (Focus Item)"),
+        ],
+        default='NONE',
+    )
+
+    def execute(self, context):
+        key = (self.lib_path, self.is_library, self.name, self.id_type)
+        if reveal_list_row(context.window_manager, key) is None:
+            self.report({'WARNING'}, f"'{self.name}' is no longer in the list")
+            return {'CANCELLED'}
+
+        # The same operators as the Select/Focus Item buttons, on the new active item
+        if self.action == 'SELECT':
+            return bpy.ops.object.select_linked_from_list()
+        if self.action == 'FOCUS':
+            return bpy.ops.object.focus_linked_from_list()
+        return {'FINISHED'}
+
+class OBJECT_OT_RestoreRevealedObjects(bpy.types.Operator):
+    """Hide again what Select/Focus Item revealed, restoring the previous visibility"""
+    bl_idname = "object.restore_revealed_objects"
+    bl_label = "Restore Visibility"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return has_reveal_snapshot(context.scene)
+
+    def execute(self, context):
+        count = restore_revealed_objects(context.scene, context)
+        self.report({'INFO'}, f"Restored visibility of {count} object(s)")
+        return {'FINISHED'}
+
 class WM_OT_reveal_all_objects(bpy.types.Operator):
     """Enable all global selection and visibility filters in the viewport"""
     bl_idname = "wm.reveal_all_objects"
@@ -570,30 +1105,118 @@ class WM_OT_cleanup_libraries(bpy.types.Operator):
         return context.window_manager.invoke_confirm(self, event)
     
     def execute(self, context):
-        count = 0
-        libraries_to_delete = []
+        start = time.perf_counter()
         
-        for library in bpy.data.libraries:
-            filepath_abs = absolute_path(library.filepath)
-            if not os.path.exists(filepath_abs):
-                libraries_to_delete.append(library)
+        # --- 1. CHECK EVERY LIBRARY FILE IN PARALLEL ---
+        paths = {library.name: absolute_path(library.filepath) for library in bpy.data.libraries}
+        path_status.service.invalidate(paths.values())
+        statuses = path_status.service.probe_many(paths.values())
         
-        for library in libraries_to_delete:
-            bpy.data.libraries.remove(
-                library, 
-                do_unlink=True,  
-                do_id_user=True  
-            )
-            count += 1
+        libraries_to_delete = [
+            library for library in bpy.data.libraries
+            if statuses[paths[library.name]] == path_status.STATUS_MISSING
+        ]
+        count = len(libraries_to_delete)
+        
+        # --- 2. ONE BATCH REMOVAL: LIBRARIES + EVERYTHING LINKED FROM THEM ---
+        # A single unlink/user pass over the database instead of one per library
+        if libraries_to_delete:
+            orphans = linked_ids_from(libraries_to_delete)
+            bpy.data.batch_remove(ids=libraries_to_delete + orphans)
             
         if count > 0:
+            # --- 3. ONE LIST REFRESH ---
             update_linked_items_list(context.scene, context)
-            self.report({'INFO'}, f"Successfully cleaned up {count} broken library link(s).")
+            self.report({'INFO'}, f"Successfully cleaned up {count} broken library link(s) "
+                                  f"in {time.perf_counter() - start:.2f}s.")
         else:
             self.report({'INFO'}, "No broken library links found to clean up.")
 
         return {'FINISHED'}
     
+class WM_OT_purge_unused_libraries(bpy.types.Operator):
+    """Remove libraries nothing in any scene uses (directly or through other data), with everything they leave orphaned"""
+    bl_idname = "wm.purge_unused_libraries"
+    bl_label = "Purge Unused Libraries"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report what would be removed",
+        default=False,
+    )
+
+    def _plan(self):
+        """(unused libraries, IDs to remove, [(name, bytes, load seconds or None, ID count)])"""
+        unused, removing = find_unused_libraries()
+        id_counts = {}
+        for id_data in removing:
+            if id_data.library is not None:
+                id_counts[id_data.library.name] = id_counts.get(id_data.library.name, 0) + 1
+
+        report = []
+        for library in unused:
+            path = absolute_path(library.filepath)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+            # Measured reload time, else the load time of a background inspection
+            load_time = reload_times.get(path)
+            if load_time is None:
+                load_time = worker_pool.pool.results.get(path, {}).get("load_time")
+            report.append((library.name, size, load_time, id_counts.get(library.name, 0)))
+        return unused, removing, report
+
+    @staticmethod
+    def _totals(report):
+        size = sum(row[1] for row in report)
+        load = sum(row[2] for row in report if row[2] is not None)
+        unknown = sum(1 for row in report if row[2] is None)
+        text = f"{len(report)} libraries, {size / (1024 * 1024):.1f} MiB on disk, {load:.2f}s load time"
+        if unknown:
+            text += f" (+{unknown} never timed)"
+        return text
+
+    def invoke(self, context, event):
+        self._unused, self._removing, self._report = self._plan()
+        if not self._unused:
+            self.report({'INFO'}, "Every library is used")
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=500)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text=f"Removes {self._totals(self._report)}", icon='ORPHAN_DATA')
+        layout.label(text=f"{len(self._removing) - len(self._unused)} linked or orphaned datablocks go with them")
+        col = layout.box().column(align=True)
+        for name, size, load_time, id_count in self._report[:DIALOG_ROWS]:
+            load_text = f"{load_time:.2f}s" if load_time is not None else "?"
+            col.label(text=f"{name}: {size / 1024:.0f} KiB, load {load_text}, {id_count} IDs")
+        if len(self._report) > DIALOG_ROWS:
+            col.label(text=f"... and {len(self._report) - DIALOG_ROWS} more")
+        layout.prop(self, "dry_run")
+
+    def execute(self, context):
+        unused, removing, report = self._plan()
+        if not unused:
+            self.report({'INFO'}, "Every library is used")
+            return {'CANCELLED'}
+
+        for name, size, load_time, id_count in report:
+            load_text = f"{load_time:.3f}s" if load_time is not None else "unknown"
+            print(f"Library Manager: unused {name} - {size} bytes, load {load_text}, {id_count} IDs")
+
+        if self.dry_run:
+            self.report({'INFO'}, f"Dry run: would remove {self._totals(report)} (details in console)")
+            return {'FINISHED'}
+
+        # One unlink/user pass for the whole purge
+        bpy.data.batch_remove(ids=removing)
+        update_linked_items_list(context.scene, context)
+        self.report({'INFO'}, f"Removed {self._totals(report)}")
+        return {'FINISHED'}
+    
 class WM_OT_missing_files(bpy.types.Operator):
     bl_idname = "wm.missing_files"
     bl_label = "Missing Files"
@@ -653,45 +1276,183 @@ class WM_OT_path_absolute(bpy.types.Operator):
 
 
 
+def placement_matrices(context, distribution, count, spacing, bounds, target, limit, align_to_normal, random_rotation, seed):
+    """World matrices for every instance of a batch placement"""
+    rng = random.Random(seed)
+    origin = context.scene.cursor.location.copy()
+    matrices = []
+
+    if distribution == 'CURSOR':
+        matrices.append(Matrix.Translation(origin))
+    elif distribution == 'GRID':
+        # Square-ish grid on the XY plane, starting at the cursor
+        columns = max(1, math.ceil(math.sqrt(count)))
+        for i in range(count):
+            offset = Vector(((i % columns) * spacing, (i // columns) * spacing, 0.0))
+            matrices.append(Matrix.Translation(origin + offset))
+    elif distribution == 'SCATTER':
+        # Uniform random points in a box centered on the cursor
+        for _ in range(count):
+            offset = Vector([rng.uniform(-size / 2, size / 2) for size in bounds])
+            matrices.append(Matrix.Translation(origin + offset))
+    else:
+        mesh = target.data
+        world = target.matrix_world
+        normal_matrix = world.to_3x3().inverted_safe().transposed()
+        if distribution == 'VERTICES':
+            points = [(v.co, v.normal) for v in mesh.vertices]
+        else:
+            points = [(f.center, f.normal) for f in mesh.polygons]
+        if 0 < limit < len(points):
+            points = rng.sample(points, limit)
+        for co, normal in points:
+            matrix = Matrix.Translation(world @ co)
+            if align_to_normal:
+                normal = (normal_matrix @ normal).normalized()
+                matrix = matrix @ normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
+            matrices.append(matrix)
+
+    if random_rotation:
+        for i, matrix in enumerate(matrices):
+            matrices[i] = matrix @ Matrix.Rotation(rng.uniform(0.0, 2.0 * math.pi), 4, 'Z')
+    return matrices
+
+
 class WM_OT_place_linked_asset(bpy.types.Operator):
-    """Instantiate the linked asset at the 3D Cursor"""
+    """Instantiate the linked asset at the 3D Cursor, or many of them at once"""
     bl_idname = "wm.place_linked_asset"
     bl_label = "Place Linked Asset"
     bl_options = {'REGISTER', 'UNDO'}
     
     asset_name: bpy.props.StringProperty()
+    lib_path: bpy.props.StringProperty() # Library filepath, tells same-named assets apart
     is_collection: bpy.props.BoolProperty()
 
+    distribution: bpy.props.EnumProperty(
+        name="Distribution",
+        items=[
+            ('CURSOR', "Cursor", "One instance at the 3D cursor"),
+            ('GRID', "Grid", "Instances on a grid starting at the 3D cursor"),
+            ('SCATTER', "Scatter", "Instances at random points in a box around the 3D cursor"),
+            ('VERTICES', "Vertices", "One instance on each vertex of the active mesh"),
+            ('FACES', "Faces", "One instance on each face of the active mesh"),
+        ],
+        default='CURSOR',
+    )
+    count: bpy.props.IntProperty(name="Count", default=10, min=1, soft_max=1000)
+    spacing: bpy.props.FloatProperty(name="Spacing", default=2.0, min=0.0, subtype='DISTANCE')
+    bounds: bpy.props.FloatVectorProperty(name="Bounds", default=(10.0, 10.0, 0.0), min=0.0, subtype='XYZ_LENGTH')
+    limit: bpy.props.IntProperty(name="Limit", description="Random subset of vertices/faces to use (0 = all)", default=0, min=0)
+    align_to_normal: bpy.props.BoolProperty(name="Align to Normal", default=True)
+    random_rotation: bpy.props.BoolProperty(name="Random Rotation", default=False)
+    seed: bpy.props.IntProperty(name="Seed", default=0, min=0)
+
+    def invoke(self, context, event):
+        if self.distribution == 'CURSOR':
+            return self.execute(context)
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "distribution")
+        if self.distribution in {'GRID', 'SCATTER'}:
+            layout.prop(self, "count")
+        if self.distribution == 'GRID':
+            layout.prop(self, "spacing")
+        elif self.distribution == 'SCATTER':
+            layout.prop(self, "bounds")
+        elif self.distribution in {'VERTICES', 'FACES'}:
+            layout.prop(self, "limit")
+            layout.prop(self, "align_to_normal")
+        if self.distribution != 'CURSOR':
+            layout.prop(self, "random_rotation")
+            layout.prop(self, "seed")
+
     def execute(self, context):
+        key = (self.asset_name, self.lib_path) if self.lib_path else self.asset_name
+        source = (bpy.data.collections if self.is_collection else bpy.data.objects).get(key)
+        if source is None:
+            self.report({'ERROR'}, f"Linked asset not found: {self.asset_name}")
+            return {'CANCELLED'}
+
+        target = context.active_object
+        if self.distribution in {'VERTICES', 'FACES'} and (target is None or target.type != 'MESH'):
+            self.report({'ERROR'}, "Vertices/Faces placement needs an active mesh object")
+            return {'CANCELLED'}
+
         try:
-            if self.is_collection:
-                coll = bpy.data.collections.get(self.asset_name)
-                if coll:
-                    obj = bpy.data.objects.new(self.asset_name, None)
-                    obj.instance_collection = coll
+            matrices = placement_matrices(
+                context, self.distribution, self.count, self.spacing, self.bounds, target,
+                self.limit, self.align_to_normal, self.random_rotation, self.seed)
+
+            # --- 1. CREATE EVERY INSTANCE (one operator call = one undo step) ---
+            placed = []
+            link = context.scene.collection.objects.link
+            for matrix in matrices:
+                if self.is_collection:
+                    obj = bpy.data.objects.new(source.name, None)
+                    obj.instance_collection = source
                     obj.instance_type = 'COLLECTION'
-                    context.scene.collection.objects.link(obj)
-                    obj.location = context.scene.cursor.location
-            else:
-                obj_data = bpy.data.objects.get(self.asset_name)
-                if obj_data:
-                    new_obj = bpy.data.objects.new(obj_data.name, obj_data.data)
-                    context.scene.collection.objects.link(new_obj)
-                    new_obj.location = context.scene.cursor.location
-            
-            # FIX: Call the function directly instead of using bpy.ops
-            from .ui import update_linked_items_list # Adjust import path if needed
+                else:
+                    obj = bpy.data.objects.new(source.name, source.data)
+                obj.matrix_world = matrix
+                link(obj)
+                placed.append(obj)
+
+            # --- 2. ONE LIST REFRESH FOR THE WHOLE BATCH ---
             update_linked_items_list(context.scene, context)
-            
-            # Select the new object and make it active
-            context.view_layer.objects.active = obj if self.is_collection else new_obj
-            (obj if self.is_collection else new_obj).select_set(True)
-            
+
+            # Select the new objects and make the last one active
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for obj in placed:
+                obj.select_set(True)
+            if placed:
+                context.view_layer.objects.active = placed[-1]
+
+            if len(placed) != 1:
+                self.report({'INFO'}, f"Placed {len(placed)} instances of {source.name}")
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f"Placement failed: {e}")
             return {'CANCELLED'}
 
+# =========================================================================
+# DIAGNOSTICS
+# =========================================================================
+
+
+class WM_OT_dump_library_profile(bpy.types.Operator, ExportHelper):
+    """Save the recorded hot path timings as a JSON file"""
+    bl_idname = "wm.dump_library_profile"
+    bl_label = "Save Library Manager Profile"
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        extra = {
+            "blender_version": list(bpy.app.version),
+            "libraries": len(bpy.data.libraries),
+            "objects": len(bpy.data.objects),
+            "list_rows": len(context.window_manager.linked_assets_list),
+        }
+        try:
+            profiler.dump(self.filepath, extra)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot write {self.filepath}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Profile saved to {self.filepath}")
+        return {'FINISHED'}
+
+class WM_OT_reset_library_profile(bpy.types.Operator):
+    """Forget the recorded hot path timings"""
+    bl_idname = "wm.reset_library_profile"
+    bl_label = "Reset Library Manager Profile"
+
+    def execute(self, context):
+        profiler.reset()
+        return {'FINISHED'}
+
 classes = (
     WM_OT_library_prefs,
     WM_OT_set_asset_import_link,
@@ -708,16 +1469,26 @@ classes = (
     WM_OT_refresh_libraries,
     
     WM_OT_reload_library,
+    WM_OT_reload_changed_libraries,
     WM_OT_open_library,
     WM_OT_delete_library,
     WM_OT_relocate_library,   
+    WM_OT_remap_library_paths,
+    WM_OT_swap_library_proxies,
+    WM_OT_restore_library_proxies,
+    WM_OT_render_full_resolution,
+    WM_OT_inspect_library_file,
+    WM_OT_inspect_libraries_background,
     
     OBJECT_OT_ToggleAllLinked,
     OBJECT_OT_SelectLinkedFromList,
     OBJECT_OT_FocusLinkedFromList,
+    WM_OT_jump_to_linked_item,
+    OBJECT_OT_RestoreRevealedObjects,
     
 
     WM_OT_cleanup_libraries,
+    WM_OT_purge_unused_libraries,
     WM_OT_missing_files,
     WM_OT_path_relative,
     WM_OT_path_absolute,
@@ -725,6 +1496,9 @@ classes = (
     WM_OT_reveal_all_objects,
     
     WM_OT_place_linked_asset,
+
+    WM_OT_dump_library_profile,
+    WM_OT_reset_library_profile,
 )
 
 def register():
@@ -0,0 +1,140 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# =========================================================================
+# PATH STATUS SERVICE
+# =========================================================================
+# Library files often live on network shares where a single stat can take
+# tens of milliseconds. Existence checks run on a small thread pool and the
+# results are cached with a TTL, so the UI only ever reads the cache.
+
+STATUS_UNKNOWN = 'UNKNOWN'   # Never probed yet (probe in flight)
+STATUS_OK = 'OK'
+STATUS_MISSING = 'MISSING'
+
+
+class PathStatusService:
+    """Thread-pooled, TTL-cached file existence checks"""
+
+    def __init__(self, ttl=30.0, max_workers=8):
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._cache = {}     # path -> (status, checked_at)
+        self._fingerprints = {}   # path -> (mtime_ns, size) of the last check, None if missing
+        self._pending = {}   # path -> Future
+        self._changed = False
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="LibraryManagerProbe")
+        return self._executor
+
+    def _probe(self, path):
+        """Runs on a worker thread"""
+        # The stat answering "exists" also gives the file's fingerprint
+        try:
+            st = os.stat(path)
+        except OSError:
+            fingerprint = None
+        else:
+            fingerprint = (st.st_mtime_ns, st.st_size)
+        self.record(path, fingerprint is not None, fingerprint)
+        return STATUS_OK if fingerprint is not None else STATUS_MISSING
+
+    def _submit(self, path):
+        """Starts a probe unless one is already running. Caller holds the lock."""
+        future = self._pending.get(path)
+        if future is None:
+            future = self._pool().submit(self._probe, path)
+            self._pending[path] = future
+        return future
+
+    def status(self, path):
+        """Returns the cached status without blocking.
+
+        Expired or unknown entries are re-probed in the background; until the
+        probe returns the previous status (or STATUS_UNKNOWN) is reported.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(path)
+            if entry is not None and now - entry[1] < self.ttl:
+                return entry[0]
+            self._submit(path)
+            return entry[0] if entry is not None else STATUS_UNKNOWN
+
+    def probe_many(self, paths, timeout=None):
+        """Checks many paths in parallel and waits for the answers.
+
+        Fresh cache entries are reused. Returns {path: status}; paths whose
+        probe did not finish within `timeout` are reported as STATUS_UNKNOWN.
+        """
+        now = time.monotonic()
+        results = {}
+        futures = {}
+        with self._lock:
+            for path in set(paths):
+                entry = self._cache.get(path)
+                if entry is not None and now - entry[1] < self.ttl:
+                    results[path] = entry[0]
+                else:
+                    futures[path] = self._submit(path)
+
+        wait(futures.values(), timeout=timeout)
+        for path, future in futures.items():
+            results[path] = future.result() if future.done() else STATUS_UNKNOWN
+        return results
+
+    def record(self, path, exists, fingerprint=None):
+        """Stores a result (from a probe or any other source that stat'ed the file)"""
+        status = STATUS_OK if exists else STATUS_MISSING
+        with self._lock:
+            previous = self._cache.get(path)
+            self._cache[path] = (status, time.monotonic())
+            self._fingerprints[path] = fingerprint
+            self._pending.pop(path, None)
+            if previous is None or previous[0] != status:
+                self._changed = True
+
+    def fingerprint(self, path):
+        """(mtime_ns, size) seen by the last check, None if unknown or missing"""
+        with self._lock:
+            return self._fingerprints.get(path)
+
+    def invalidate(self, paths=None):
+        """Forgets cached results (all of them when paths is None)"""
+        with self._lock:
+            if paths is None:
+                self._cache.clear()
+                self._fingerprints.clear()
+            else:
+                for path in paths:
+                    self._cache.pop(path, None)
+                    self._fingerprints.pop(path, None)
+
+    def has_pending(self):
+        with self._lock:
+            return bool(self._pending)
+
+    def take_changed(self):
+        """True once after any cached status changed; resets the flag"""
+        with self._lock:
+            changed = self._changed
+            self._changed = False
+            return changed
+
+    def shutdown(self):
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+service = PathStatusService()
@@ -0,0 +1,150 @@
+import contextlib
+import functools
+import json
+import threading
+import time
+from collections import deque
+
+# =========================================================================
+# HOT PATH PROFILER
+# =========================================================================
+# Times the add-on's hot paths (list refresh, depsgraph handler, selection,
+# list filtering, panel drawing) when switched on from the diagnostics
+# panel. While off, an instrumented call costs one attribute check: the
+# wrapper calls straight through without reading the clock.
+
+SAMPLES_KEPT = 1024   # Most recent durations kept per section, for percentiles
+
+
+class _Section:
+    """Counters for one instrumented function"""
+
+    __slots__ = ("calls", "total", "max", "items", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.items = 0
+        self.samples = deque(maxlen=SAMPLES_KEPT)
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class _Timer:
+    """Context manager behind Profiler.section()"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.profiler._record(self.name, time.perf_counter() - self.start)
+
+
+_NOT_TIMED = contextlib.nullcontext()
+
+
+class Profiler:
+    """Per-section call counts, timings and processed item counts"""
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._sections = {}
+
+    def timed(self, name):
+        """Decorator recording the wrapped function's duration under `name`.
+
+        The wrapper takes (*args, **kwargs): not for callbacks of registered
+        classes (Panel.draw, UIList.filter_items, ...), whose argument count
+        Blender checks against the RNA signature. Use section() in those.
+        """
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._record(name, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def section(self, name):
+        """Context manager recording the duration of its block under `name`"""
+        if not self.enabled:
+            return _NOT_TIMED
+        return _Timer(self, name)
+
+    def _section(self, name):
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section()
+        return section
+
+    def _record(self, name, elapsed):
+        with self._lock:
+            section = self._section(name)
+            section.calls += 1
+            section.total += elapsed
+            section.max = max(section.max, elapsed)
+            section.samples.append(elapsed)
+
+    def add_items(self, name, count):
+        """Adds to the number of items (rows, objects, ...) a section processed"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._section(name).items += count
+
+    def reset(self):
+        with self._lock:
+            self._sections.clear()
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """{name: stats dict} with timings in milliseconds, sorted by name"""
+        with self._lock:
+            stats = {}
+            for name in sorted(self._sections):
+                section = self._sections[name]
+                stats[name] = {
+                    "calls": section.calls,
+                    "total_ms": section.total * 1000.0,
+                    "mean_ms": section.total * 1000.0 / section.calls if section.calls else 0.0,
+                    "p50_ms": section.percentile(0.50) * 1000.0,
+                    "p95_ms": section.percentile(0.95) * 1000.0,
+                    "p99_ms": section.percentile(0.99) * 1000.0,
+                    "max_ms": section.max * 1000.0,
+                    "items": section.items,
+                }
+            return stats
+
+    def dump(self, filepath, extra=None):
+        """Writes the snapshot (plus `extra` metadata) as JSON"""
+        profile = {
+            "started_at": self.started_at,
+            "dumped_at": time.time(),
+            "enabled": self.enabled,
+            "sections": self.snapshot(),
+        }
+        if extra:
+            profile.update(extra)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+
+
+profiler = Profiler()
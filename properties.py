@@ -1,5 +1,19 @@
 import bpy
 
+from .profiler import profiler
+
+
+def _on_profiling(self, context):
+    profiler.enabled = self.library_manager_profiling
+
+
+def _on_expanded(self, context):
+    """Lazy mode: create or release the library's child rows (deferred to a timer)"""
+    if self.is_library and not self.id_data.is_updating_linked_list:
+        from .utils import schedule_expanded_sync
+        schedule_expanded_sync()
+
+
 # =========================================================================
 # DATA STRUCTURES
 # =========================================================================
@@ -8,11 +22,39 @@ class LinkedAssetItem(bpy.types.PropertyGroup):
     """Data container for items displayed in the UI List"""
     name: bpy.props.StringProperty() # Added this - UI Lists need a name property
     is_library: bpy.props.BoolProperty()
-    is_expanded: bpy.props.BoolProperty(default=False)
+    is_expanded: bpy.props.BoolProperty(default=False, update=_on_expanded)
     lib_path: bpy.props.StringProperty()
     asset_id: bpy.props.StringProperty()
     is_broken: bpy.props.BoolProperty(default=False) # <--- Add this
+    is_checking: bpy.props.BoolProperty(default=False) # File status not probed yet
+    is_stale: bpy.props.BoolProperty(default=False) # File changed on disk since it was loaded
+    instance_count: bpy.props.IntProperty(default=0) # Objects of the shown scene using this asset/library
+    depth: bpy.props.IntProperty(default=0) # Nesting level in the library dependency tree
+    has_broken_dependency: bpy.props.BoolProperty(default=False) # A library this one links (directly or not) is broken
+    has_stale_dependency: bpy.props.BoolProperty(default=False) # ... or changed on disk
+    is_proxy: bpy.props.BoolProperty(default=False) # Lightweight proxy file loaded instead of the full library
+    # Library cost stats (see utils.library_stats); floats where 32 bit ints overflow
+    cost_ids: bpy.props.IntProperty(default=0)
+    cost_vertices: bpy.props.IntProperty(default=0)
+    cost_faces: bpy.props.IntProperty(default=0)
+    cost_image_bytes: bpy.props.FloatProperty(default=0.0)
+    cost_file_size: bpy.props.FloatProperty(default=0.0)
+    cost_reload_time: bpy.props.FloatProperty(default=0.0) # Seconds, 0 = never reloaded
     is_collection: bpy.props.BoolProperty()
+    id_type: bpy.props.EnumProperty(
+        name="ID Type",
+        items=[
+            ('LIBRARY', "Library", ""),
+            ('COLLECTION', "Collection", ""),
+            ('OBJECT', "Object", ""),
+            ('MATERIAL', "Material", ""),
+            ('NODETREE', "Node Group", ""),
+            ('WORLD', "World", ""),
+            ('ACTION', "Action", ""),
+            ('IMAGE', "Image", ""),
+        ],
+        default='OBJECT',
+    )
     # In your properties.py or wherever your list item is defined:
     is_empty_link: bpy.props.BoolProperty(name="Is Empty Link", default=False)
 # =========================================================================
@@ -27,15 +69,50 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     
-    # This is the "Extra Step" that fixes your property error:
-    bpy.types.Scene.linked_assets_list = bpy.props.CollectionProperty(type=LinkedAssetItem)
-    bpy.types.Scene.linked_assets_index = bpy.props.IntProperty()
-    bpy.types.Scene.is_updating_linked_list = bpy.props.BoolProperty(default=False)
+    # One list per file, shared by every scene: the libraries are the same
+    # in all of them, only the usage differs (see utils.usage_overlay)
+    bpy.types.WindowManager.linked_assets_list = bpy.props.CollectionProperty(type=LinkedAssetItem)
+    bpy.types.WindowManager.linked_assets_index = bpy.props.IntProperty()
+    bpy.types.WindowManager.is_updating_linked_list = bpy.props.BoolProperty(default=False)
+    # Settings of that list, next to it rather than per scene
+    bpy.types.WindowManager.linked_list_lazy_children = bpy.props.BoolProperty(
+        name="Lazy Asset Rows",
+        description="Only create asset rows for expanded libraries (faster with large libraries)",
+        default=True,
+    )
+    bpy.types.WindowManager.linked_list_refresh_delay = bpy.props.FloatProperty(
+        name="Refresh Delay",
+        description="Seconds to wait after the last scene change before refreshing the linked assets list",
+        default=0.25, min=0.0, max=5.0,
+    )
+    bpy.types.WindowManager.library_proxy_suffix = bpy.props.StringProperty(
+        name="Proxy Suffix",
+        description="Suffix of the lightweight companion file of a library (forest.blend -> forest_proxy.blend)",
+        default="_proxy",
+    )
+    # Session-only (WindowManager properties are not saved)
+    bpy.types.WindowManager.library_search = bpy.props.StringProperty(
+        name="Search",
+        description="Fuzzy search over every linked library and asset name",
+        options={'TEXTEDIT_UPDATE'},
+    )
+    bpy.types.WindowManager.library_manager_profiling = bpy.props.BoolProperty(
+        name="Profile Hot Paths",
+        description="Record call counts and timings of the list refresh, handlers, filtering and drawing",
+        default=False,
+        update=_on_profiling,
+    )
 
 def unregister():
     # Clean up properties
-    del bpy.types.Scene.linked_assets_list
-    del bpy.types.Scene.linked_assets_index
-    del bpy.types.Scene.is_updating_linked_list
+    del bpy.types.WindowManager.linked_assets_list
+    del bpy.types.WindowManager.linked_assets_index
+    del bpy.types.WindowManager.is_updating_linked_list
+    del bpy.types.WindowManager.linked_list_refresh_delay
+    del bpy.types.WindowManager.library_proxy_suffix
+    del bpy.types.WindowManager.linked_list_lazy_children
+    del bpy.types.WindowManager.library_manager_profiling
+    del bpy.types.WindowManager.library_search
+    profiler.enabled = False
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
\ No newline at end of file
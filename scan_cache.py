@@ -0,0 +1,117 @@
+import json
+import os
+import sqlite3
+import sys
+import time
+
+# =========================================================================
+# PERSISTENT SCAN CACHE
+# =========================================================================
+# Remembers each library's scan result (assets, broken status) between
+# sessions in a small SQLite file under the user cache directory, keyed by
+# the library's absolute path plus the (mtime, size) it had when scanned.
+# On file load every cached path is stat'ed: entries whose fingerprint
+# still matches fill the list immediately, the others are dropped and
+# rewritten once the next refresh has rescanned those libraries.
+
+SCHEMA_VERSION = 1
+
+
+def default_cache_path():
+    """Per-user cache location (XDG on Linux, LOCALAPPDATA on Windows)"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "library_manager", "scan_cache.sqlite3")
+
+
+class ScanCache:
+    """SQLite-backed store of per-library scan results (main thread only)"""
+
+    def __init__(self, path=None):
+        self.path = path or default_cache_path()
+        self._conn = None
+        self._disabled = False
+
+    def _connect(self):
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS libraries ("
+                " path TEXT PRIMARY KEY,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " is_broken INTEGER NOT NULL,"
+                " assets TEXT NOT NULL,"
+                " scanned_at REAL NOT NULL,"
+                " schema INTEGER NOT NULL)"
+            )
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            # A cache that cannot be opened just means no cache
+            print(f"Library Manager: scan cache disabled ({e})")
+            self._disabled = True
+        return self._conn
+
+    def load(self, paths):
+        """Returns {path: entry} for the cached paths.
+
+        entry = {"fingerprint": (mtime_ns, size) or None, "is_broken": bool,
+                 "assets": [(name, id_type), ...]}
+        """
+        conn = self._connect()
+        paths = list(paths)
+        if conn is None or not paths:
+            return {}
+
+        entries = {}
+        try:
+            # Chunked to stay under SQLite's host parameter limit
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, is_broken, assets FROM libraries"
+                    f" WHERE schema = ? AND path IN ({','.join('?' * len(chunk))})",
+                    [SCHEMA_VERSION] + chunk,
+                )
+                for path, mtime_ns, size, is_broken, assets in rows:
+                    entries[path] = {
+                        "fingerprint": None if mtime_ns < 0 else (mtime_ns, size),
+                        "is_broken": bool(is_broken),
+                        "assets": [tuple(asset) for asset in json.loads(assets)],
+                    }
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Library Manager: scan cache read failed ({e})")
+        return entries
+
+    def store(self, entries):
+        """Writes {path: entry} (same shape as load() returns) in one transaction"""
+        conn = self._connect()
+        if conn is None or not entries:
+            return
+        now = time.time()
+        rows = []
+        for path, entry in entries.items():
+            mtime_ns, size = entry["fingerprint"] or (-1, -1)
+            rows.append((path, mtime_ns, size, int(entry["is_broken"]),
+                         json.dumps(entry["assets"]), now, SCHEMA_VERSION))
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO libraries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"Library Manager: scan cache write failed ({e})")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+cache = ScanCache()
@@ -0,0 +1,151 @@
+import bisect
+import re
+from itertools import islice
+
+# =========================================================================
+# FUZZY NAME SEARCH INDEX
+# =========================================================================
+# Tens of thousands of linked assets are too many to scroll, or to substring
+# test on every keystroke. The names are indexed as libraries are rescanned:
+# trigram postings for fuzzy matches (typos, missing or swapped letters) and
+# a sorted name table for prefixes. A query only looks at the postings of
+# its own trigrams, capped at MAX_CANDIDATES rows, and recent queries are
+# cached so redraws cost a dict lookup.
+
+MAX_CANDIDATES = 2000   # Rows scored per query at most (taken from the rarest trigrams)
+MIN_SIMILARITY = 0.3    # Share of the query's trigrams a fuzzy match must have
+
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize(name):
+    """Lowercase, with every run of separators (_ . - spaces) as one space"""
+    return _SEPARATORS.sub(" ", name.lower()).strip()
+
+
+def trigrams(text):
+    """Trigrams of a lowercased, space padded string: "ab" -> {"  a", " ab", "ab "}"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Ranked fuzzy lookup of list rows by name"""
+
+    def __init__(self, cache_size=64):
+        self.cache_size = cache_size
+        self.clear()
+
+    def clear(self):
+        self._entries = {}    # key -> (name, normalized name, trigram count)
+        self._grams = {}      # trigram -> set of keys
+        self._sorted = []     # (normalized name, key), for prefix lookups
+        self._cache = {}      # (query, limit) -> results
+
+    def update(self, entries):
+        """Makes the index hold exactly [(key, name)].
+
+        Only the entries that came or went are (un)indexed, so the usual
+        rescan, where a few libraries changed, costs a key diff.
+        """
+        wanted = dict(entries)
+        removed = {key for key, entry in self._entries.items() if wanted.get(key) != entry[0]}
+        added = [key for key, name in wanted.items()
+                 if key in removed or key not in self._entries]
+        if not removed and not added:
+            return
+
+        for key in removed:
+            name, normalized, gram_count = self._entries.pop(key)
+            for gram in trigrams(normalized):
+                posting = self._grams[gram]
+                posting.discard(key)
+                if not posting:
+                    del self._grams[gram]
+        if removed:
+            self._sorted = [entry for entry in self._sorted if entry[1] not in removed]
+
+        for key in added:
+            name = wanted[key]
+            normalized = normalize(name)
+            grams = trigrams(normalized)
+            self._entries[key] = (name, normalized, len(grams))
+            for gram in grams:
+                self._grams.setdefault(gram, set()).add(key)
+            self._sorted.append((normalized, key))
+        # Nearly sorted already: cheap for timsort
+        self._sorted.sort()
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _prefix_keys(self, query, limit):
+        """Up to `limit` keys whose name starts with `query`"""
+        start = bisect.bisect_left(self._sorted, (query,))
+        keys = []
+        for normalized, key in islice(self._sorted, start, start + limit):
+            if not normalized.startswith(query):
+                break
+            keys.append(key)
+        return keys
+
+    def search(self, query, limit=20):
+        """Best matches for `query`: [(key, name, score)], best first.
+
+        Prefix matches rank above substring matches, which rank above
+        fuzzy (trigram) matches; ties go to the shorter name.
+        """
+        query = normalize(query)
+        if not query or not self._entries:
+            return []
+        cached = self._cache.get((query, limit))
+        if cached is not None:
+            return cached
+
+        # --- 1. CANDIDATES: PREFIX HITS + ROWS SHARING THE RAREST TRIGRAMS ---
+        query_grams = trigrams(query)
+        postings = sorted((self._grams[g] for g in query_grams if g in self._grams), key=len)
+        candidates = set(self._prefix_keys(query, limit))
+        for i, posting in enumerate(postings):
+            if len(candidates) + len(posting) > MAX_CANDIDATES:
+                # Too common on its own: keep the rows that also share as
+                # many of the remaining trigrams as possible
+                common = posting
+                for other in postings[i + 1:]:
+                    narrowed = common & other
+                    if not narrowed:
+                        break
+                    common = narrowed
+                candidates.update(islice(common, MAX_CANDIDATES - len(candidates)))
+                break
+            candidates.update(posting)
+
+        # --- 2. SCORE: TRIGRAM SIMILARITY + PREFIX/SUBSTRING BONUS ---
+        scored = []
+        for key in candidates:
+            name, normalized, gram_count = self._entries[key]
+            shared = sum(1 for posting in postings if key in posting)
+            if normalized.startswith(query):
+                bonus = 2.0
+            elif query in normalized:
+                bonus = 1.0
+            elif shared >= MIN_SIMILARITY * len(query_grams):
+                bonus = 0.0
+            else:
+                continue
+            similarity = shared / (len(query_grams) + gram_count - shared)
+            scored.append((bonus + similarity, len(name), name, key))
+
+        scored.sort(key=lambda entry: (-entry[0], entry[1], entry[2]))
+        results = [(key, name, score) for score, _, name, key in scored[:limit]]
+
+        if len(self._cache) >= self.cache_size:
+            # Oldest query first (dicts keep insertion order)
+            del self._cache[next(iter(self._cache))]
+        self._cache[(query, limit)] = results
+        return results
+
+
+index = SearchIndex()
@@ -0,0 +1,188 @@
+"""Tests for the .blend header reader (blendfile.py), on generated files.
+
+blendfile.py only needs the standard library, so it is loaded on its own
+and these run without Blender:
+
+    python -m unittest discover tests
+"""
+
+import gzip
+import importlib.util
+import os
+import struct
+import tempfile
+import unittest
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_spec = importlib.util.spec_from_file_location("blendfile", os.path.join(ADDON_DIR, "blendfile.py"))
+blendfile = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(blendfile)
+
+
+# =========================================================================
+# FILE BUILDERS
+# =========================================================================
+# Minimal but well-formed .blend files: a header, a few BHead blocks and an
+# SDNA describing just the ID and Library structs the reader looks at.
+
+NAME_LEN = 258   # ID.name size since 4.2 (66 before)
+
+
+def build_sdna(endian="<", name_len=NAME_LEN):
+    """SDNA block with ID, Library and Collection structs (pointer size 8)"""
+    names = ["*next", "*prev", "*newid", "*lib", "*asset_data", f"name[{name_len}]", "flag",
+             "id", "*filedata", "filepath[1024]", "filepath_abs[1024]"]
+    types = ["char", "int", "void", "ID", "Library", "Collection"]
+    id_size = 8 * 5 + name_len + 4
+    lengths = [1, 4, 0, id_size, id_size + 8 + 2048, id_size + 4]
+    structs = [
+        (3, [(2, 0), (2, 1), (2, 2), (2, 3), (2, 4), (0, 5), (1, 6)]),   # ID
+        (4, [(3, 7), (2, 8), (0, 9), (0, 10)]),                          # Library
+        (5, [(3, 7), (1, 6)]),                                           # Collection
+    ]
+
+    def pad4(data):
+        return data + b"\0" * (-len(data) % 4)
+
+    def strings(tag, values):
+        return pad4(tag + struct.pack(endian + "i", len(values))
+                    + b"".join(value.encode() + b"\0" for value in values))
+
+    data = b"SDNA" + strings(b"NAME", names) + strings(b"TYPE", types)
+    data = pad4(data + b"TLEN" + struct.pack(endian + f"{len(lengths)}h", *lengths))
+    data += b"STRC" + struct.pack(endian + "i", len(structs))
+    for type_index, fields in structs:
+        data += struct.pack(endian + "hh", type_index, len(fields))
+        data += b"".join(struct.pack(endian + "hh", *field) for field in fields)
+    return data
+
+
+def id_block(name, is_asset=False, name_len=NAME_LEN, extra=b""):
+    """ID struct bytes: `name` includes its two letter code, e.g. "OBRock" """
+    pointers = struct.pack("<5Q", 1, 0, 0, 0, 0x1234 if is_asset else 0)
+    return pointers + name.encode().ljust(name_len, b"\0") + struct.pack("<i", 0) + extra
+
+
+def library_block(name, filepath, name_len=NAME_LEN):
+    return id_block(name, name_len=name_len,
+                    extra=struct.pack("<Q", 0) + filepath.encode().ljust(1024, b"\0") + b"\0" * 1024)
+
+
+def build_blend(large_bhead=True, name_len=NAME_LEN, compress=False, blocks=None):
+    """Bytes of a .blend file.
+
+    large_bhead: 5.x header ("BLENDER17-01v0501") with 64 bit block lengths,
+    otherwise the legacy 12 byte header ("BLENDER-v402"). `blocks` is a list
+    of (code, SDNA struct index, data); by default a collection asset, an
+    object, a non-ID data block and a library with one linked placeholder.
+    """
+    if blocks is None:
+        blocks = [
+            (b"REND", 0, b"x" * 32),
+            (b"GR\0\0", 2, id_block("GRTrees", True, name_len, b"\0" * 4)),
+            (b"DATA", 0, b"y" * 5000),
+            (b"OB\0\0", 0, id_block("OBRock", False, name_len)),
+            (b"LI\0\0", 1, library_block("LIlib.blend", "//libs/lib.blend", name_len)),
+            (b"ID\0\0", 0, id_block("MAShared", True, name_len)),
+            (b"ID\0\0", 0, id_block("OBBoulder", False, name_len)),
+        ]
+    blocks = blocks + [(b"DNA1", 0, build_sdna(name_len=name_len)), (b"ENDB", 0, b"")]
+
+    if large_bhead:
+        out = b"BLENDER17-01v0501"
+        for code, sdna_nr, data in blocks:
+            out += struct.pack("<4siQqq", code, sdna_nr, 1, len(data), 1) + data
+    else:
+        out = b"BLENDER-v402"
+        for code, sdna_nr, data in blocks:
+            out += struct.pack("<4siQii", code, len(data), 1, sdna_nr, 1) + data
+    return gzip.compress(out) if compress else out
+
+
+# =========================================================================
+# TESTS
+# =========================================================================
+
+class ReadBlendContentsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+
+    def write(self, data, name="test.blend"):
+        path = os.path.join(self._dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def read(self, data):
+        return blendfile.read_blend_contents(self.write(data))
+
+    def assert_default_contents(self, contents):
+        self.assertEqual(contents.ids, [
+            blendfile.BlendID("GR", "Trees", True),
+            blendfile.BlendID("OB", "Rock", False),
+        ])
+        self.assertEqual(contents.assets(), [blendfile.BlendID("GR", "Trees", True)])
+        self.assertEqual(contents.libraries, ["//libs/lib.blend"])
+        self.assertEqual(contents.linked, {"//libs/lib.blend": [
+            blendfile.BlendID("MA", "Shared", True),
+            blendfile.BlendID("OB", "Boulder", False),
+        ]})
+
+    def test_large_bhead_header(self):
+        contents = self.read(build_blend(large_bhead=True))
+        self.assertEqual(contents.version, (5, 1))
+        self.assert_default_contents(contents)
+
+    def test_legacy_header(self):
+        contents = self.read(build_blend(large_bhead=False, name_len=66))
+        self.assertEqual(contents.version, (4, 2))
+        self.assert_default_contents(contents)
+
+    def test_gzip(self):
+        self.assert_default_contents(self.read(build_blend(compress=True)))
+
+    def test_placeholders_follow_their_library(self):
+        blocks = [
+            (b"LI\0\0", 1, library_block("LIa.blend", "//a.blend")),
+            (b"ID\0\0", 0, id_block("OBFromA")),
+            (b"LI\0\0", 1, library_block("LIb.blend", "")),
+            (b"ID\0\0", 0, id_block("GRFromB", True)),
+        ]
+        contents = self.read(build_blend(blocks=blocks))
+        self.assertEqual(contents.ids, [])
+        # A library with an empty path is listed under its ID name
+        self.assertEqual(contents.libraries, ["//a.blend", "b.blend"])
+        self.assertEqual(contents.linked["//a.blend"], [blendfile.BlendID("OB", "FromA", False)])
+        self.assertEqual(contents.linked["b.blend"], [blendfile.BlendID("GR", "FromB", True)])
+
+    def test_empty_file(self):
+        with self.assertRaises(blendfile.BlendFileError):
+            self.read(b"")
+
+    def test_not_a_blend_file(self):
+        with self.assertRaises(blendfile.BlendFileError):
+            self.read(b"PK\x03\x04 definitely a zip")
+
+    def test_truncated_files(self):
+        data = build_blend()
+        # Inside the header, a BHead, an ID block and the DNA1 block
+        for size in (5, 20, 200, len(data) - 100):
+            with self.subTest(size=size), self.assertRaises(blendfile.BlendFileError):
+                self.read(data[:size])
+
+    def test_truncated_gzip(self):
+        data = build_blend(compress=True)
+        with self.assertRaises(blendfile.BlendFileError):
+            self.read(data[:len(data) // 2])
+
+    def test_missing_dna(self):
+        data = b"BLENDER17-01v0501" + struct.pack("<4siQqq", b"ENDB", 0, 0, 0, 0)
+        with self.assertRaises(blendfile.BlendFileError):
+            self.read(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,10 @@ import bpy
 import os  # <--- Add this line
 import subprocess
 from bpy_extras.io_utils import ImportHelper
-from .utils import auto_update_linked_handler, select_instances_internal, update_linked_items_list
+from . import search_index
+from . import worker_pool
+from .profiler import profiler
+from .utils import auto_update_linked_handler, cached_library_stats, list_usage_scene, proxied_libraries, select_instances_internal, update_linked_items_list
     
 class VIEW3D_PT_library_main(bpy.types.Panel):
     bl_label = "Library Manager"
@@ -12,6 +15,10 @@ class VIEW3D_PT_library_main(bpy.types.Panel):
     bl_category = 'Library Manager'
 
     def draw(self, context):
+        with profiler.section("VIEW3D_PT_library_main.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         scene = context.scene
         # You can leave this empty or add your main list here
@@ -26,6 +33,10 @@ class VIEW3D_PT_library_preferences(bpy.types.Panel):
     bl_options = {'DEFAULT_CLOSED'} # Starts collapsed like your image
 
     def draw(self, context):
+        with profiler.section("VIEW3D_PT_library_preferences.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         scene = context.scene
         prefs = context.preferences.filepaths
@@ -47,6 +58,8 @@ class VIEW3D_PT_library_preferences(bpy.types.Panel):
         row = layout.row(align=True)
         row.operator("wm.set_asset_import_link", text=btn_texto , icon=btn_icono,depress=is_currently_linked)
         row.operator("wm.toggle_relative_path", text=btn_text, icon=btn_icon,depress=is_relative)
+        layout.prop(context.window_manager, "linked_list_refresh_delay")
+        layout.prop(context.window_manager, "linked_list_lazy_children")
            
 class VIEW3D_PT_assetbrowser_preferences(bpy.types.Panel):
     bl_label = "Assets / Library "
@@ -57,6 +70,10 @@ class VIEW3D_PT_assetbrowser_preferences(bpy.types.Panel):
     bl_options = {'DEFAULT_CLOSED'} # Starts collapsed like your image
 
     def draw(self, context):
+        with profiler.section("VIEW3D_PT_assetbrowser_preferences.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         scene = context.scene
         # We find the asset area again just to decide on the icon/blue state
@@ -88,9 +105,13 @@ class VIEW3D_PT_libraries_list(bpy.types.Panel):
 
     
     def draw(self, context):
+        with profiler.section("VIEW3D_PT_libraries_list.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         scene = context.scene 
-        
+        wm = context.window_manager
         
         layout.operator("wm.show_outliner_vertical", text="Library Outline", icon="OUTLINER")
         layout.operator("wm.refresh_libraries", text="Add / Refresh - List", icon="FILE_REFRESH")
@@ -100,7 +121,7 @@ class VIEW3D_PT_libraries_list(bpy.types.Panel):
    #===========================================================
        
        # 1. Check if list is empty first
-        if not scene.linked_assets_list:
+        if not wm.linked_assets_list:
             # Create a box to house the message
             box = layout.box()
             
@@ -122,9 +143,9 @@ class VIEW3D_PT_libraries_list(bpy.types.Panel):
             return
   
         # 2. Get a safe index for the UI to use right now
-        # We DON'T write to scene.linked_assets_index here. 
+        # We DON'T write to wm.linked_assets_index here. 
         # We just calculate a safe number for the calculation below.
-        safe_index = min(max(0, scene.linked_assets_index), len(scene.linked_assets_list) - 1)
+        safe_index = min(max(0, wm.linked_assets_index), len(wm.linked_assets_list) - 1)
 
     # # SAFETY: If properties aren't registered yet, stop drawing and show a message
         # if not hasattr(scene, "linked_items"):
@@ -142,50 +163,93 @@ class VIEW3D_PT_libraries_list(bpy.types.Panel):
         # Header with Global Expansion Toggle
         row = layout.row(align=True)
         row.label(text="Linked Assets List")
-        first_lib = next((i for i in scene.linked_assets_list if i.is_library), None)
+        # The list is shared by every scene; usage follows the active one
+        usage_scene = list_usage_scene()
+        if usage_scene is not None and usage_scene != scene.name:
+            row.label(text=f"Usage: {usage_scene}", icon='SCENE_DATA')
+        first_lib = next((i for i in wm.linked_assets_list if i.is_library), None)
         glob_icon = 'FULLSCREEN_EXIT' if (first_lib and first_lib.is_expanded) else 'FULLSCREEN_ENTER'
         row.operator("object.toggle_all_linked", text="", icon=glob_icon, emboss=False)
 
+        # Fuzzy search over every library and asset, collapsed or not
+        layout.prop(wm, "library_search", text="", icon='VIEWZOOM')
+        if wm.library_search:
+            draw_search_results(layout, wm.library_search)
+
         # Main List Display
-        layout.template_list("VIEW3D_UL_libraries", "", scene, "linked_assets_list", scene, "linked_assets_index")
+        layout.template_list("VIEW3D_UL_libraries", "", wm, "linked_assets_list", wm, "linked_assets_index")
         
         # 4. Use the safe_index to get the item for the buttons below
-        item = scene.linked_assets_list[safe_index]
+        item = wm.linked_assets_list[safe_index]
         
         # Context-Sensitive Selection Buttons
-        if len(scene.linked_assets_list) > 0 and scene.linked_assets_index >= 0:
-            if len(scene.linked_assets_list) > 0:
+        if len(wm.linked_assets_list) > 0 and wm.linked_assets_index >= 0:
+            if len(wm.linked_assets_list) > 0:
                 # Clamp the index so it never exceeds the list size
-                if scene.linked_assets_index >= len(scene.linked_assets_list):
-                    scene.linked_assets_index = len(scene.linked_assets_list) - 1
+                if wm.linked_assets_index >= len(wm.linked_assets_list):
+                    wm.linked_assets_index = len(wm.linked_assets_list) - 1
     
             # Safely get the item now
-            item = scene.linked_assets_list[scene.linked_assets_index]
+            item = wm.linked_assets_list[wm.linked_assets_index]
             
             row = layout.row(align=True)
             row.operator("object.select_linked_from_list", text="Select Item", icon='RESTRICT_SELECT_OFF')
             row.operator("object.focus_linked_from_list", text="Focus Item", icon='GRID')
+            row.operator("object.restore_revealed_objects", text="", icon='HIDE_ON')
+            if not item.is_library and item.id_type in {'COLLECTION', 'OBJECT'}:
+                place_op = layout.operator("wm.place_linked_asset", text="Place Batch...", icon='PARTICLES')
+                place_op.asset_name = item.name
+                place_op.lib_path = item.lib_path
+                place_op.is_collection = item.is_collection
+                place_op.distribution = 'GRID'
 
-            layout.operator("wm.cleanup_libraries", text="Clean Broken Files", icon="TRASH")
+            row = layout.row(align=True)
+            row.operator("wm.reload_changed_libraries", text="Reload Changed", icon="FILE_REFRESH")
+            row.operator("wm.cleanup_libraries", text="Clean Broken Files", icon="TRASH")
+            row.operator("wm.purge_unused_libraries", text="Purge Unused", icon="ORPHAN_DATA")
+            row = layout.row(align=True)
+            row.operator("wm.remap_library_paths", text="Remap Paths", icon="FILE_FOLDER")
+            pending = worker_pool.pool.pending()
+            if pending:
+                row.label(text=f"Inspecting {pending}...", icon='TIME')
+            else:
+                row.operator("wm.inspect_libraries_background", text="Inspect All", icon='VIEWZOOM')
+
+            # Proxy / full resolution swap
+            row = layout.row(align=True)
+            row.operator("wm.swap_library_proxies", text="Swap to Proxies", icon='MOD_DECIM').library_name = ""
+            row.operator("wm.restore_library_proxies", text="Full Resolution", icon='MOD_SUBSURF').library_name = ""
+            row.prop(wm, "library_proxy_suffix", text="")
+            proxied = len(proxied_libraries())
+            if proxied:
+                warning = layout.row()
+                warning.alert = True
+                warning.label(text=f"{proxied} proxy libraries loaded: restore before rendering", icon='ERROR')
+                row = layout.row(align=True)
+                row.operator("wm.render_full_resolution", text="Render Image", icon='RENDER_STILL').animation = False
+                row.operator("wm.render_full_resolution", text="Render Animation", icon='RENDER_ANIMATION').animation = True
 
          # 1. Get the current selection from the list
-        idx = scene.linked_assets_index
-        list_items = scene.linked_assets_list
+        idx = wm.linked_assets_index
+        list_items = wm.linked_assets_list
 
         if idx >= 0 and idx < len(list_items):
             selected_item = list_items[idx]
             
             # Identify the target library
             target_lib_name = ""
+            library_item = None # Header row of that library (holds its cost fields)
             is_main_library_selected = selected_item.is_library
             
             if is_main_library_selected:
                 target_lib_name = selected_item.name
+                library_item = selected_item
             else:
                 # User selected a sub-item: Search backwards for parent
                 for i in range(idx - 1, -1, -1):
                     if list_items[i].is_library:
                         target_lib_name = list_items[i].name
+                        library_item = list_items[i]
                         break
             
             # 2. Draw the UI Elements
@@ -204,9 +268,45 @@ class VIEW3D_PT_libraries_list(bpy.types.Panel):
                     # File path property
                     box.prop(lib_data, "filepath", text="")
                     
-                    # Relocate Button
-                    op = box.operator("wm.relocate_library", text="Relocate Library")
+                    # Relocate / Inspect Buttons
+                    row = box.row(align=True)
+                    op = row.operator("wm.relocate_library", text="Relocate Library")
                     op.library_name = lib_data.name
+                    op = row.operator("wm.inspect_library_file", text="Inspect File", icon='VIEWZOOM')
+                    op.library_name = lib_data.name
+                    op = row.operator("wm.inspect_libraries_background", text="", icon='CONSOLE')
+                    op.library_name = lib_data.name
+                    if library_item.is_proxy:
+                        op = row.operator("wm.restore_library_proxies", text="", icon='MOD_SUBSURF')
+                    else:
+                        op = row.operator("wm.swap_library_proxies", text="", icon='MOD_DECIM')
+                    op.library_name = lib_data.name
+
+                    # Cost footprint of this library in the open file, as of
+                    # the last refresh (computing it here would run on redraw)
+                    col = box.column(align=True)
+                    col.label(text=f"{format_count(library_item.cost_vertices)} verts, "
+                                   f"{format_count(library_item.cost_faces)} faces, "
+                                   f"images {format_bytes(library_item.cost_image_bytes)}, "
+                                   f"file {format_bytes(library_item.cost_file_size)}", icon='MEMORY')
+                    cost = cached_library_stats().get(lib_data.name)
+                    if cost is not None and cost["ids"]:
+                        col.label(text=", ".join(f"{count} {attr}" for attr, count in sorted(
+                            cost["ids"].items(), key=lambda entry: -entry[1])))
+
+                    # Last background inspection of this file, if any
+                    result = worker_pool.pool.results.get(os.path.abspath(bpy.path.abspath(lib_data.filepath)))
+                    if result is not None:
+                        col = box.column(align=True)
+                        if result.get("ok"):
+                            col.label(text=f"{sum(len(n) for n in result['ids'].values())} IDs, "
+                                           f"{len(result['assets'])} assets, "
+                                           f"{len(result['libraries'])} sub-libraries, "
+                                           f"load {result['load_time']:.2f}s", icon='INFO')
+                            if result["missing"]:
+                                col.label(text=f"{len(result['missing'])} missing resource(s)", icon='ERROR')
+                        else:
+                            col.label(text=result.get("error", "Inspection failed"), icon='ERROR')
 
 
 
@@ -220,6 +320,10 @@ class VIEW3D_PT_external_data(bpy.types.Panel):
     bl_options = {'DEFAULT_CLOSED'}
 
     def draw(self, context):
+        with profiler.section("VIEW3D_PT_external_data.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         
         # Access the global 'Automatically Pack Resources' setting
@@ -266,6 +370,75 @@ class VIEW3D_PT_external_data(bpy.types.Panel):
         
 
  
+# Icon per LinkedAssetItem.id_type
+ID_TYPE_ICONS = {
+    'COLLECTION': 'OUTLINER_COLLECTION',
+    'OBJECT': 'OBJECT_DATA',
+    'MATERIAL': 'MATERIAL',
+    'NODETREE': 'NODETREE',
+    'WORLD': 'WORLD',
+    'ACTION': 'ACTION',
+    'IMAGE': 'IMAGE_DATA',
+}
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def format_count(count):
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.1f}k"
+    return str(count)
+
+
+# Cost column -> (item property, formatter)
+COST_COLUMNS = {
+    'VERTICES': ("cost_vertices", format_count),
+    'FACES': ("cost_faces", format_count),
+    'IMAGE_MEMORY': ("cost_image_bytes", format_bytes),
+    'FILE_SIZE': ("cost_file_size", format_bytes),
+    'RELOAD_TIME': ("cost_reload_time", lambda seconds: f"{seconds:.2f}s" if seconds else "-"),
+    'IDS': ("cost_ids", format_count),
+}
+
+
+SEARCH_RESULTS = 8 # Rows shown under the search field
+
+
+def draw_search_results(layout, query):
+    """Best search matches, each jumping to its list row (and selecting/framing it)"""
+    results = search_index.index.search(query, limit=SEARCH_RESULTS)
+    box = layout.box()
+    if not results:
+        box.label(text="No match", icon='INFO')
+        return
+    col = box.column(align=True)
+    for (lib_path, is_library, name, id_type), _, score in results:
+        row = col.row(align=True)
+        if is_library:
+            icon = 'LINK_BLEND'
+            text = name
+        else:
+            icon = ID_TYPE_ICONS.get(id_type, 'OBJECT_DATA')
+            text = f"{name}  ({os.path.basename(lib_path)})"
+        for action, action_text, action_icon in (
+            ('NONE', text, icon),
+            ('SELECT', "", 'RESTRICT_SELECT_OFF'),
+            ('FOCUS', "", 'GRID'),
+        ):
+            op = row.operator("wm.jump_to_linked_item", text=action_text, icon=action_icon, emboss=action != 'NONE')
+            op.lib_path = lib_path
+            op.is_library = is_library
+            op.name = name
+            op.id_type = id_type
+            op.action = action
+
+
 class VIEW3D_UL_libraries(bpy.types.UIList):
     """UIList that handles assets and libraries with ghost status"""
     bl_idname = "VIEW3D_UL_libraries"
@@ -274,9 +447,19 @@ class VIEW3D_UL_libraries(bpy.types.UIList):
         row = layout.row(align=True)
 
         if item.is_library:
+            # Indent libraries linked by other libraries under their parent
+            if item.depth:
+                row.separator(factor=2.0 * item.depth)
+
             # 1. Indicator Icons (Broken vs Ghost)
             if item.is_broken:
                 row.label(text="", icon='ERROR')
+            elif item.has_broken_dependency:
+                row.label(text="", icon='LIBRARY_DATA_BROKEN')
+            elif item.is_checking:
+                row.label(text="", icon='TIME')
+            elif item.is_stale or item.has_stale_dependency:
+                row.label(text="", icon='RECOVER_LAST')
             elif item.is_empty_link:
                 row.label(text="", icon='GHOST_DISABLED')
             
@@ -285,6 +468,18 @@ class VIEW3D_UL_libraries(bpy.types.UIList):
                      icon='TRIA_DOWN' if item.is_expanded else 'TRIA_RIGHT')
             
             row.label(text=item.name)
+            if item.is_proxy:
+                row.label(text="", icon='MOD_DECIM')
+            if item.instance_count:
+                row.label(text=str(item.instance_count))
+
+            # Cost column (chosen in the filter options)
+            column = COST_COLUMNS.get(self.cost_column)
+            if column is not None:
+                attr, formatter = column
+                cost_row = row.row()
+                cost_row.alignment = 'RIGHT'
+                cost_row.label(text=formatter(getattr(item, attr)))
             
             # if item.is_empty_link:
                 # row.label(text="", translate=False)
@@ -292,7 +487,10 @@ class VIEW3D_UL_libraries(bpy.types.UIList):
             # Utility buttons
             button_row = row.row(align=True)
             if not item.is_broken:
-                op = button_row.operator("wm.reload_library", text="", icon="FILE_REFRESH", emboss=False)
+                # Highlight the reload button when the file changed on disk
+                reload_row = button_row.row(align=True)
+                reload_row.alert = item.is_stale
+                op = reload_row.operator("wm.reload_library", text="", icon="FILE_REFRESH", emboss=False)
                 op.library_name = item.name
                 
                 op = button_row.operator("wm.open_library", text="", icon="BLENDER", emboss=False)
@@ -303,10 +501,10 @@ class VIEW3D_UL_libraries(bpy.types.UIList):
                 
         else:
             # --- CHILD ASSETS ---
-            row.separator(factor=2.0)
+            row.separator(factor=2.0 * (item.depth + 1))
             
             # FIX: Define icon_type before using it!
-            icon_type = 'OUTLINER_COLLECTION' if item.is_collection else 'OBJECT_DATA'
+            icon_type = ID_TYPE_ICONS.get(item.id_type, 'OBJECT_DATA')
             
             if item.is_broken:
                 row.label(text=item.name, icon='CANCEL')
@@ -315,37 +513,194 @@ class VIEW3D_UL_libraries(bpy.types.UIList):
                 # Use ghost icon if parent library has no instances in scene
                 sub_icon = 'GHOST_ENABLED' if item.is_empty_link else icon_type
                 
-                # Draw the Asset Name
+                # Draw the Asset Name (and how many scene objects use it)
                 row.label(text=item.name, icon=sub_icon)
+                if item.instance_count:
+                    row.label(text=str(item.instance_count))
                 
                 # NEW: Add the Place Asset button (Pseudo-Drag substitute)
                 # This button will spawn the asset at the 3D Cursor
-                place_op = row.operator("wm.place_linked_asset", text="", icon='ADD', emboss=False)
-                place_op.asset_name = item.name
-                place_op.is_collection = item.is_collection
+                if item.id_type in {'COLLECTION', 'OBJECT'}:
+                    place_op = row.operator("wm.place_linked_asset", text="", icon='ADD', emboss=False)
+                    place_op.asset_name = item.name
+                    place_op.lib_path = item.lib_path
+                    place_op.is_collection = item.is_collection
+                    place_op.distribution = 'CURSOR' # Not the last batch mode used
+
+    # Filter / sort options (shown in the list's filter popover)
+    use_prefix_match: bpy.props.BoolProperty(
+        name="Prefix",
+        description="Match names that start with the filter text instead of containing it",
+        default=False,
+    )
+    sort_mode: bpy.props.EnumProperty(
+        name="Sort",
+        items=[
+            ('NONE', "Default", "Keep the library order"),
+            ('NAME', "Name", "Sort by name"),
+            ('COUNT', "Instances", "Most used first"),
+            ('BROKEN', "Broken", "Broken and stale first"),
+            ('COST', "Cost", "Heaviest libraries first, by the cost column"),
+        ],
+        default='NONE',
+    )
+    cost_column: bpy.props.EnumProperty(
+        name="Cost",
+        description="Per-library cost shown next to each library",
+        items=[
+            ('NONE', "None", "No cost column"),
+            ('VERTICES', "Vertices", "Vertices of the linked meshes"),
+            ('FACES', "Faces", "Faces of the linked meshes"),
+            ('IMAGE_MEMORY', "Image Memory", "Memory of the loaded linked images"),
+            ('FILE_SIZE', "File Size", "Size of the library file on disk"),
+            ('RELOAD_TIME', "Reload Time", "Last measured reload time"),
+            ('IDS', "Datablocks", "Number of linked datablocks"),
+        ],
+        default='VERTICES',
+    )
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_prefix_match", toggle=True)
+        row = layout.row(align=True)
+        row.prop(self, "sort_mode", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+        layout.prop(self, "cost_column")
+
+    def _sort_key(self, item):
+        if self.sort_mode == 'COUNT':
+            return (-item.instance_count, item.name.lower())
+        if self.sort_mode == 'BROKEN':
+            return (not item.is_broken, not item.is_stale, item.name.lower())
+        if self.sort_mode == 'COST':
+            # Assets have no cost: they keep their name order
+            column = COST_COLUMNS.get(self.cost_column)
+            cost = getattr(item, column[0]) if column and item.is_library else 0
+            return (-cost, item.name.lower())
+        return item.name.lower()
 
     def filter_items(self, context, data, propname):
-        """This function physically removes items from the list view"""
+        with profiler.section("VIEW3D_UL_libraries.filter_items"):
+            return self._filter_items(context, data, propname)
+
+    def _filter_items(self, context, data, propname):
+        """This function physically removes items from the list view.
+
+        Single forward pass: each asset belongs to the last header seen and
+        each header hangs under the closest shallower header above it, so the
+        cost is linear in the list length (plus the sort, if any).
+        """
         items = getattr(data, propname)
+        visible = self.bitflag_filter_item
+        profiler.add_items("VIEW3D_UL_libraries.filter_items", len(items))
         
-        # Default: Show everything
-        filter_flags = [self.bitflag_filter_item] * len(items)
-        
-        # Loop through all items to check if they should be hidden
+        needle = self.filter_name.lower()
+        prefix = self.use_prefix_match
+
+        def matches(name):
+            name = name.lower()
+            return name.startswith(needle) if prefix else needle in name
+
+        # --- 1. ONE PASS: TREE LINKS, NAME MATCHES, EXPANSION ---
+        filter_flags = [0] * len(items)
+        leading = []   # Rows before the first library header (should not happen)
+        roots = []
+        stack = []     # Library nodes along the current tree path
         for index, item in enumerate(items):
-            if not item.is_library:
-                # Find the library this item belongs to by looking upwards
-                parent_library = None
-                for i in range(index - 1, -1, -1):
-                    if items[i].is_library and items[i].lib_path == item.lib_path:
-                        parent_library = items[i]
-                        break
-                
-                # If the parent is collapsed, FLIP THE FLAG to hide it
-                if parent_library and not parent_library.is_expanded:
-                    filter_flags[index] &= ~self.bitflag_filter_item
+            if item.is_library:
+                while stack and stack[-1]["depth"] >= item.depth:
+                    stack.pop()
+                parent = stack[-1] if stack else None
+                # Hidden when any ancestor library is collapsed
+                shown = parent is None or parent["open"]
+                node = {
+                    "index": index,
+                    "depth": item.depth,
+                    "open": shown and item.is_expanded,
+                    "match": not needle or matches(item.name),
+                    "assets": [],
+                    "libs": [],
+                }
+                (parent["libs"] if parent else roots).append(node)
+                stack.append(node)
+                if shown and node["match"]:
+                    filter_flags[index] = visible
+                continue
+
+            if not stack:
+                leading.append(index)
+                filter_flags[index] = visible
+                continue
+
+            node = stack[-1]
+            node["assets"].append(index)
+            if needle and matches(item.name):
+                # Matching assets show even inside collapsed libraries,
+                # and keep their library chain visible
+                filter_flags[index] = visible
+                for ancestor in stack:
+                    filter_flags[ancestor["index"]] = visible
+            elif node["open"] and node["match"]:
+                filter_flags[index] = visible
+
+        # --- 2. SORT SIBLING LIBRARIES, THEN ASSETS WITHIN EACH LIBRARY ---
+        if self.sort_mode == 'NONE' and not self.use_filter_sort_reverse:
+            return filter_flags, []
 
-        return filter_flags, []
+        reverse = self.use_filter_sort_reverse
+        sorting = self.sort_mode != 'NONE'
+        order = list(leading)
+
+        def emit(nodes):
+            if sorting:
+                nodes = sorted(nodes, key=lambda node: self._sort_key(items[node["index"]]), reverse=reverse)
+            elif reverse:
+                nodes = nodes[::-1]
+            for node in nodes:
+                order.append(node["index"])
+                assets = node["assets"]
+                if sorting:
+                    assets = sorted(assets, key=lambda i: self._sort_key(items[i]), reverse=reverse)
+                order.extend(assets)
+                emit(node["libs"])
+
+        emit(roots)
+
+        new_order = [0] * len(items)
+        for position, index in enumerate(order):
+            new_order[index] = position
+
+        return filter_flags, new_order
+
+
+class VIEW3D_PT_library_diagnostics(bpy.types.Panel):
+    """Timings of the add-on's own hot paths"""
+    bl_label = "Diagnostics"
+    bl_idname = "VIEW3D_PT_library_diagnostics"
+    bl_parent_id = "VIEW3D_PT_library_main"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.window_manager, "library_manager_profiling")
+
+        stats = profiler.snapshot()
+        if not stats:
+            layout.label(text="No samples yet" if profiler.enabled else "Profiling is off")
+        for name, section in stats.items():
+            box = layout.box()
+            box.label(text=name)
+            col = box.column(align=True)
+            col.label(text=f"{section['calls']} calls, {section['total_ms']:.1f} ms total, {section['items']} items")
+            col.label(text=f"p50 {section['p50_ms']:.2f}  p95 {section['p95_ms']:.2f}  "
+                           f"p99 {section['p99_ms']:.2f}  max {section['max_ms']:.2f} ms")
+
+        row = layout.row(align=True)
+        row.operator("wm.reset_library_profile", text="Reset", icon='LOOP_BACK')
+        row.operator("wm.dump_library_profile", text="Save JSON", icon='EXPORT')
 
 
 classes = (
@@ -354,6 +709,7 @@ classes = (
     VIEW3D_PT_assetbrowser_preferences,
     VIEW3D_PT_libraries_list,
     VIEW3D_PT_external_data,
+    VIEW3D_PT_library_diagnostics,
     VIEW3D_UL_libraries,
 )
 
@@ -0,0 +1,152 @@
+import bpy
+
+# =========================================================================
+# REVERSE USAGE INDEX
+# =========================================================================
+# Maps every linked datablock (and its library) to the scene objects that
+# use it, keyed by session_uid so two libraries shipping the same asset name
+# never get mixed up. The index is kept up to date incrementally: objects
+# reported by the depsgraph are re-indexed one by one and a refresh only
+# adds/drops the objects that came or went.
+
+
+def object_ref(obj):
+    """Key that bpy.data.objects.get() resolves back to the object"""
+    if obj.library is None:
+        return obj.name
+    return (obj.name, obj.library.filepath)
+
+
+def linked_ids_used_by(obj):
+    """Linked datablocks (and their libraries) an object depends on directly"""
+    used = set()
+
+    def add(id_data):
+        if id_data is not None and id_data.library is not None:
+            used.add(id_data.session_uid)
+            used.add(id_data.library.session_uid)
+
+    add(obj)
+    add(obj.data)
+    add(obj.instance_collection)
+    for slot in obj.material_slots:
+        add(slot.material)
+    anim = obj.animation_data
+    if anim is not None:
+        add(anim.action)
+    return used
+
+
+def usage_uids(id_data):
+    """uids whose users count as users of this asset.
+
+    An object asset is also 'used' by objects that only share its mesh,
+    which is what placing a linked object asset creates.
+    """
+    uids = {id_data.session_uid}
+    if isinstance(id_data, bpy.types.Object):
+        data = id_data.data
+        if data is not None and data.library is not None:
+            uids.add(data.session_uid)
+    return uids
+
+
+class UsageIndex:
+    """Reverse index for one scene: linked ID uid -> object refs"""
+
+    def __init__(self):
+        self.users = {}   # linked ID / library session_uid -> set of object refs
+        self.uses = {}    # object session_uid -> (object ref, set of linked uids)
+        self.version = 0  # Bumped on every change, so results can be cached per version
+        self._synced = None  # (scene uid, object count) at the last full walk
+
+    def update_object(self, obj):
+        """Re-indexes a single object (new, renamed or re-targeted)"""
+        ref = object_ref(obj)
+        new_uses = linked_ids_used_by(obj)
+        old_ref, old_uses = self.uses.get(obj.session_uid, (ref, set()))
+
+        if old_ref == ref and old_uses == new_uses:
+            return False
+
+        self._unlink(old_ref, old_uses)
+        for uid in new_uses:
+            self.users.setdefault(uid, set()).add(ref)
+        self.uses[obj.session_uid] = (ref, new_uses)
+        self.version += 1
+        return True
+
+    def drop_object(self, obj_uid):
+        entry = self.uses.pop(obj_uid, None)
+        if entry is not None:
+            self._unlink(*entry)
+            self.version += 1
+
+    def _unlink(self, ref, uids):
+        for uid in uids:
+            refs = self.users.get(uid)
+            if refs is not None:
+                refs.discard(ref)
+                if not refs:
+                    del self.users[uid]
+
+    def sync(self, scene):
+        """Adds objects new to the scene and drops the ones that left it.
+
+        The walk over the scene objects is skipped while the scene and its
+        object count are the ones of the last walk and nothing called
+        invalidate() (the depsgraph handler does, when collections change).
+        """
+        stamp = (scene.session_uid, len(scene.objects))
+        if stamp == self._synced:
+            return
+        objects = {obj.session_uid: obj for obj in scene.objects}
+        for uid in self.uses.keys() - objects.keys():
+            self.drop_object(uid)
+        for uid in objects.keys() - self.uses.keys():
+            self.update_object(objects[uid])
+        self._synced = stamp
+
+    def invalidate(self):
+        """Makes the next sync() walk the scene objects again"""
+        self._synced = None
+
+    def refs(self, uids):
+        """Object refs using any of `uids`"""
+        uids = list(uids)
+        if len(uids) == 1:
+            return self.users.get(uids[0], set())
+        found = set()
+        for uid in uids:
+            found |= self.users.get(uid, set())
+        return found
+
+    def count(self, uids):
+        """Number of scene objects using any of the linked IDs (or libraries) `uids`"""
+        return len(self.refs(uids))
+
+    def objects(self, uids):
+        """Resolves the objects using any of `uids`, skipping deleted ones"""
+        found = []
+        for ref in self.refs(uids):
+            obj = bpy.data.objects.get(ref)
+            if obj is not None:
+                found.append(obj)
+        return found
+
+
+# One index per scene, keyed by scene name
+_indexes = {}
+
+
+def get_index(scene):
+    index = _indexes.get(scene.name)
+    if index is None:
+        index = _indexes[scene.name] = UsageIndex()
+        index.sync(scene)
+    return index
+
+
+def clear():
+    """Forgets every index (e.g. when a new file is loaded)"""
+    _indexes.clear()
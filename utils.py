@@ -1,164 +1,1305 @@
 import bpy
 import os
+import time
+
+from . import library_watcher
+from . import path_status
+from . import scan_cache
+from . import search_index
+from . import usage_index
+from . import worker_pool
+from .profiler import profiler
+
+
+# (id_type, bpy.data attribute) for every ID type shown under a library
+LINKED_ID_TYPES = (
+    ('COLLECTION', "collections"),
+    ('OBJECT', "objects"),
+    ('MATERIAL', "materials"),
+    ('NODETREE', "node_groups"),
+    ('WORLD', "worlds"),
+    ('ACTION', "actions"),
+    ('IMAGE', "images"),
+)
+
+# Collections and objects are only listed when marked as assets, the other
+# types also show up when they were linked directly (not pulled in indirectly)
+ASSET_ONLY_ID_TYPES = {'COLLECTION', 'OBJECT'}
+
+
+# Every bpy.data collection holding ID datablocks (for whole-database passes)
+ID_COLLECTIONS = (
+    "actions", "annotations", "armatures", "brushes", "cache_files", "cameras",
+    "collections", "curves", "fonts", "grease_pencils", "hair_curves", "images",
+    "lattices", "lightprobes", "lights", "linestyles", "masks", "materials",
+    "meshes", "metaballs", "movieclips", "node_groups", "objects", "paint_curves",
+    "palettes", "particles", "pointclouds", "scenes", "screens", "sounds",
+    "speakers", "texts", "textures", "volumes", "workspaces", "worlds",
+)
+
+
+def linked_ids_from(libraries):
+    """IDs of every type linked from `libraries`, in one pass over bpy.data"""
+    lib_uids = {lib.session_uid for lib in libraries}
+    found = []
+    for attr in ID_COLLECTIONS:
+        for id_data in getattr(bpy.data, attr, ()):
+            lib = id_data.library
+            if lib is not None and lib.session_uid in lib_uids:
+                found.append(id_data)
+    return found
+
+
+def find_unused_libraries():
+    """Libraries nothing in any scene reaches, and the IDs purging them removes.
+
+    Walks bpy.data.user_map() forward from every scene (and every local
+    fake-user ID), so indirect use counts: a node group inside a material
+    on an instanced collection keeps its library alive. A used library also
+    keeps its parent libraries. The removal set holds the unused libraries,
+    everything linked from them and the local IDs that would be left with no
+    users but each other. Returns (unused libraries, IDs to remove).
+    """
+    user_map = bpy.data.user_map()
+    uses = {}
+    for id_data, users in user_map.items():
+        for user in users:
+            uses.setdefault(user, []).append(id_data)
+
+    # --- 1. EVERYTHING REACHABLE FROM THE SCENES ---
+    roots = list(bpy.data.scenes)
+    roots += [id_data for id_data in user_map if id_data.library is None and id_data.use_fake_user]
+    reachable = set(roots)
+    stack = list(roots)
+    while stack:
+        for used in uses.get(stack.pop(), ()):
+            if used not in reachable:
+                reachable.add(used)
+                stack.append(used)
+
+    # --- 2. LIBRARIES (AND THEIR PARENTS) OF REACHABLE IDS ARE USED ---
+    used_libraries = set()
+    for id_data in reachable:
+        lib = id_data.library
+        while lib is not None and lib.name not in used_libraries:
+            used_libraries.add(lib.name)
+            lib = lib.parent
+    unused = [lib for lib in bpy.data.libraries if lib.name not in used_libraries]
+    if not unused:
+        return [], []
+
+    # --- 3. REMOVAL SET + IDS ORPHANED BY IT ---
+    removing = set(unused)
+    removing.update(linked_ids_from(unused))
+    queue = list(removing)
+    while queue:
+        for user in user_map.get(queue.pop(), ()):
+            if user in removing or user in reachable or user.use_fake_user:
+                continue
+            if user_map.get(user, set()) <= removing:
+                removing.add(user)
+                queue.append(user)
+
+    return unused, list(removing)
+
+
+# Number of IDs linked from each library, per bpy.data collection; a
+# collection is only recounted when its own length changed
+_linked_counts = {"lengths": {}, "counts": {}}
+
+
+def linked_id_counts():
+    """{library session_uid: number of IDs linked from it}.
+
+    Only the bpy.data collections whose length changed are walked again, so
+    adding a local object recounts bpy.data.objects and nothing else.
+    """
+    lengths = _linked_counts["lengths"]
+    per_attr = _linked_counts["counts"]
+    for attr in ID_COLLECTIONS:
+        ids = getattr(bpy.data, attr, ())
+        if lengths.get(attr) == len(ids):
+            continue
+        counts = {}
+        for id_data in ids:
+            lib = id_data.library
+            if lib is not None:
+                counts[lib.session_uid] = counts.get(lib.session_uid, 0) + 1
+        lengths[attr] = len(ids)
+        per_attr[attr] = counts
+
+    totals = {}
+    for counts in per_attr.values():
+        for uid, count in counts.items():
+            totals[uid] = totals.get(uid, 0) + count
+    return totals
+
+
+# Per-library cost stats, each recomputed only when its library's key
+# (session_uid, loaded file version, number of linked IDs) changed
+_stats_cache = {"keys": {}, "stats": {}}
+
+
+def _compute_library_stats(libraries):
+    """Cost stats of `libraries` in one pass over bpy.data"""
+    stats = {}
+    by_uid = {}
+    for lib in libraries:
+        entry = {
+            "ids": {},
+            "vertices": 0,
+            "faces": 0,
+            "image_bytes": 0,
+        }
+        stats[lib.name] = entry
+        by_uid[lib.session_uid] = entry
+
+    for attr in ID_COLLECTIONS:
+        for id_data in getattr(bpy.data, attr, ()):
+            lib = id_data.library
+            if lib is None:
+                continue
+            entry = by_uid.get(lib.session_uid)
+            if entry is None:
+                continue
+            entry["ids"][attr] = entry["ids"].get(attr, 0) + 1
+            if attr == "meshes":
+                entry["vertices"] += len(id_data.vertices)
+                entry["faces"] += len(id_data.polygons)
+            elif attr == "images" and id_data.has_data:
+                # Only pixels actually loaded in memory (reading size of an
+                # unloaded image would load it)
+                width, height = id_data.size
+                entry["image_bytes"] += width * height * id_data.channels * (4 if id_data.is_float else 1)
+    return stats
+
+
+def library_stats(abs_paths=None):
+    """{library name: cost stats} for every library.
+
+    Stats: "ids" ({bpy.data attribute: count}), "vertices", "faces",
+    "image_bytes" (loaded pixels), "file_size" (from the watcher's baseline,
+    0 until the watcher has stat'ed the file) and "reload_time" (seconds of
+    the last measured reload, or None). A library's stats are kept until
+    IDs are linked from/removed from it or its file is reloaded with
+    different content; only changed libraries are rescanned. Never touches
+    the library files.
+    """
+    libraries = list(bpy.data.libraries)
+    if abs_paths is None:
+        abs_paths = [library_abspath(lib) for lib in libraries]
+    watcher = library_watcher.watcher
+    counts = linked_id_counts()
+
+    old_keys = _stats_cache["keys"]
+    old_stats = _stats_cache["stats"]
+    keys = {}
+    stats = {}
+    changed = []
+    for lib, abs_path in zip(libraries, abs_paths):
+        key = (lib.session_uid, watcher.baseline(abs_path), counts.get(lib.session_uid, 0))
+        keys[lib.name] = key
+        if old_keys.get(lib.name) == key and lib.name in old_stats:
+            stats[lib.name] = old_stats[lib.name]
+        else:
+            changed.append(lib)
+    if changed:
+        stats.update(_compute_library_stats(changed))
+    _stats_cache["keys"] = keys
+    _stats_cache["stats"] = stats
+
+    # File size and reload time come from elsewhere, so they are always read fresh
+    for lib, abs_path in zip(libraries, abs_paths):
+        entry = stats[lib.name]
+        baseline = watcher.baseline(abs_path)
+        entry["file_size"] = baseline[1] if baseline else 0
+        entry["reload_time"] = reload_times.get(abs_path)
+    return stats
+
+
+def cached_library_stats():
+    """Stats as of the last refresh, never recomputed (safe to call from draw)"""
+    return _stats_cache["stats"]
+
+
+def bucket_linked_ids():
+    """Groups every linked ID by its library in a single pass over bpy.data.
+
+    Returns {library name: [(id_type, id), ...]}. Cost is linear in the
+    number of IDs, independent of how many libraries are linked.
+    """
+    buckets = {lib.name: [] for lib in bpy.data.libraries}
+
+    for id_type, attr in LINKED_ID_TYPES:
+        asset_only = id_type in ASSET_ONLY_ID_TYPES
+        for id_data in getattr(bpy.data, attr):
+            lib = id_data.library
+            if lib is None:
+                continue
+            if not id_data.asset_data and (asset_only or id_data.is_library_indirect):
+                continue
+            buckets.setdefault(lib.name, []).append((id_type, id_data))
+
+    return buckets
 
     
-def update_linked_items_list(scene=None, context=None):
-    """Rebuilds the list from Library data, ensuring assets persist after scene deletion."""
+def library_abspath(lib):
+    """Normalized absolute path of a Library datablock's file"""
+    return os.path.abspath(bpy.path.abspath(lib.filepath))
+
+
+def _watch_path_probes():
+    """Timer callback: refreshes the list once background probes report back"""
+    if path_status.service.take_changed():
+        schedule_linked_list_refresh(bpy.context.scene, delay=0.0)
+    if path_status.service.has_pending():
+        return 0.2
+    return None
+
+
+def watch_path_probes():
+    """Starts polling for path probe results while probes are in flight"""
+    if not path_status.service.has_pending():
+        return
+    if not bpy.app.timers.is_registered(_watch_path_probes):
+        bpy.app.timers.register(_watch_path_probes, first_interval=0.2)
+
+
+def stop_path_probes():
+    """Stops polling and shuts the probe pool down (used on unregister)"""
+    if bpy.app.timers.is_registered(_watch_path_probes):
+        bpy.app.timers.unregister(_watch_path_probes)
+    path_status.service.shutdown()
+
+
+def _watch_library_changes():
+    """Persistent timer: refreshes the list when a library file changed on disk"""
+    if library_watcher.watcher.take_changed():
+        schedule_linked_list_refresh(bpy.context.scene, delay=0.0)
+    if _cache_pending:
+        flush_scan_cache()
+    return 1.0
+
+
+def start_library_watch():
+    if not bpy.app.timers.is_registered(_watch_library_changes):
+        bpy.app.timers.register(_watch_library_changes, first_interval=1.0, persistent=True)
+
+
+def stop_library_watch():
+    if bpy.app.timers.is_registered(_watch_library_changes):
+        bpy.app.timers.unregister(_watch_library_changes)
+    flush_scan_cache()
+    scan_cache.cache.close()
+    library_watcher.watcher.stop()
+
+
+def _watch_worker_results():
+    """Timer callback: collects finished background inspections"""
+    finished = worker_pool.pool.take_results()
+    for path, result in sorted(finished.items()):
+        if result.get("ok"):
+            print(f"Library Manager: inspected {path} - load {result['load_time']:.2f}s, "
+                  f"{len(result['missing'])} missing resource(s)")
+        else:
+            print(f"Library Manager: inspection failed for {path}: {result.get('error')}")
+    if finished:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    if worker_pool.pool.pending():
+        return 0.5
+    return None
+
+
+def watch_worker_results():
+    """Starts polling for background inspection results"""
+    if not bpy.app.timers.is_registered(_watch_worker_results):
+        bpy.app.timers.register(_watch_worker_results, first_interval=0.5)
+
+
+def stop_worker_pool():
+    """Stops polling and the headless Blender workers (used on unregister)"""
+    if bpy.app.timers.is_registered(_watch_worker_results):
+        bpy.app.timers.unregister(_watch_worker_results)
+    worker_pool.pool.shutdown()
+
+
+# Seconds the last reload of each library file took (abs path -> seconds)
+reload_times = {}
+
+
+def reload_library(lib, content_hash=None):
+    """Reloads a Library datablock and records how long it took.
+
+    The watcher is told the current file is now the loaded one. Returns the
+    elapsed time in seconds; RuntimeError from Blender is passed through.
+    """
+    abs_path = library_abspath(lib)
+    start = time.perf_counter()
+    lib.reload()
+    elapsed = time.perf_counter() - start
+
+    reload_times[abs_path] = elapsed
+    library_watcher.watcher.acknowledge(abs_path, content_hash=content_hash)
+    # Same IDs counts, new contents: the inventory has to rescan
+    invalidate_library_inventory()
+    return elapsed
+
+
+def relocate_libraries(moves):
+    """Points many libraries at new files and reloads them in one pass.
+
+    `moves` is [(library, new abs path)]. Every path is rewritten before the
+    first reload (relative paths stay relative), so libraries linking each
+    other never load a half-swapped set. Returns [(library, error)] for the
+    reloads that failed; the caller refreshes the list once afterwards.
+    """
+    for library, new_path in moves:
+        if library.filepath.startswith("//"):
+            try:
+                library.filepath = bpy.path.relpath(new_path)
+            except ValueError:
+                # Different drive on Windows: no relative form exists
+                library.filepath = new_path
+        else:
+            library.filepath = new_path
+
+    failed = []
+    for library, _ in moves:
+        try:
+            reload_library(library)
+        except RuntimeError as e:
+            failed.append((library, e))
+            print(f"Library Manager: {library.name} - reload failed: {e}")
+    return failed
+
+
+# Library ID property holding the full resolution filepath while a proxy is loaded
+PROXY_PATH_KEY = "library_manager_full_path"
+
+
+def proxy_path(path, suffix):
+    """Companion proxy file of a library: /a/forest.blend -> /a/forest_proxy.blend"""
+    root, ext = os.path.splitext(path)
+    return root + suffix + ext
+
+
+def is_proxy_active(library):
+    return PROXY_PATH_KEY in library
+
+
+def proxied_libraries():
+    return [lib for lib in bpy.data.libraries if PROXY_PATH_KEY in lib]
+
+
+def restore_proxies(libraries):
+    """Points proxy libraries back at their full resolution files.
+
+    A library whose full resolution file fails to reload keeps its proxy
+    path and its PROXY_PATH_KEY, so it can be restored again later.
+    Returns [(library, error)] for those (see relocate_libraries); the
+    caller refreshes the list.
+    """
+    proxy_paths = {}
+    moves = []
+    for library in libraries:
+        proxy_paths[library.name] = library.filepath
+        moves.append((library, os.path.abspath(bpy.path.abspath(library[PROXY_PATH_KEY]))))
+    failed = relocate_libraries(moves)
+
+    failed_names = {library.name for library, _ in failed}
+    for library, _ in moves:
+        if library.name in failed_names:
+            # The proxy data is still what is loaded
+            library.filepath = proxy_paths[library.name]
+        else:
+            del library[PROXY_PATH_KEY]
+    return failed
+
+
+@bpy.app.handlers.persistent
+def warn_proxies_on_render(scene, *args):
+    """Console warning for renders started with proxies loaded.
+
+    render_init runs on the render job thread for F12 and animation renders,
+    where reloading libraries is not safe: restoring is done before the job
+    starts, by the Render Full Resolution operator.
+    """
+    proxied = proxied_libraries()
+    if proxied:
+        print(f"Library Manager: WARNING - rendering with {len(proxied)} proxy "
+              f"libraries loaded ({', '.join(lib.name for lib in proxied[:5])}"
+              f"{', ...' if len(proxied) > 5 else ''}). Use 'Render Full Resolution' instead.")
+
+
+def library_tree_order(parent_of):
+    """Orders libraries as a tree following Library.parent.
+
+    `parent_of` maps library name -> parent library name (None for libraries
+    linked directly). Returns ([(name, depth)] in depth-first order with
+    parents before children, {name: [child names]}).
+    """
+    children_of = {}
+    roots = []
+    for name, parent in parent_of.items():
+        if parent in parent_of:
+            children_of.setdefault(parent, []).append(name)
+        else:
+            roots.append(name)
+
+    order = []
+    seen = set()
+    stack = [(name, 0) for name in sorted(roots, reverse=True)]
+    while stack:
+        name, depth = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        order.append((name, depth))
+        for child in sorted(children_of.get(name, ()), reverse=True):
+            stack.append((child, depth + 1))
+
+    # A parent cycle has no root; list those libraries flat rather than lose them
+    for name in sorted(parent_of):
+        if name not in seen:
+            seen.add(name)
+            order.append((name, 0))
+
+    return order, children_of
+
+
+def propagate_dependency_status(order, children_of, lib_groups):
+    """Flags every library that depends (transitively) on a broken/stale one.
+
+    One pass in reverse tree order: children are finished before their
+    parents, so each dependency edge is looked at exactly once.
+    """
+    for name, depth in reversed(order):
+        data = lib_groups[name]
+        broken = stale = False
+        for child in children_of.get(name, ()):
+            child_data = lib_groups[child]
+            # .get(): only a parent cycle can reach a child not finished yet
+            broken = broken or child_data["is_broken"] or child_data.get("has_broken_dependency", False)
+            stale = stale or child_data["is_stale"] or child_data.get("has_stale_dependency", False)
+        data["has_broken_dependency"] = broken
+        data["has_stale_dependency"] = stale
+
+
+def asset_usage(scene, index, id_type, id_data):
+    """(instance count, in use) of a linked asset in `scene`"""
+    # Known only from the scan cache (library not loaded)
+    if id_data is None:
+        return 0, False
+
+    # Node groups and images are used through materials/worlds, so the
+    # user count is the cheap stand-in for "used somewhere"
+    if id_type in {'NODETREE', 'IMAGE'}:
+        return 0, id_data.users > int(id_data.use_fake_user)
+    if id_type == 'WORLD':
+        return 0, scene.world == id_data
+
+    count = index.count(usage_index.usage_uids(id_data))
+    return count, count > 0
+
+
+def resolve_item_id(item):
+    """The datablock a list row stands for (Library for headers), or None"""
+    if item.is_library:
+        return bpy.data.libraries.get(item.name)
+    attr = dict(LINKED_ID_TYPES).get(item.id_type)
+    if attr is None:
+        return None
+    return getattr(bpy.data, attr).get((item.name, item.lib_path))
+
+
+# The linked assets list lives on the WindowManager: one list per file,
+# shared by every scene. Rows last applied to it, the scene whose usage they
+# show and the stamp of that usage, so expanding a library can materialize
+# its children and an unchanged refresh can stop early.
+_list_state = {"rows": None, "scene": None, "stamp": None, "lazy": None}
+
+# File-level inventory of the libraries and their assets, without usage
+# (see library_inventory)
+_inventory = {"signature": None, "generation": 0, "rows": [], "abs_paths": []}
+
+# Per-scene usage overlay: scene name -> (stamp, [(instance count, in use)]
+# aligned with the inventory rows), computed when that scene is shown
+_overlays = {}
+
+# Persistent scan cache: entries as last stored (abs path -> entry), the
+# entries loaded with the file whose fingerprint was not checked yet and
+# scan results still waiting for the watcher's file fingerprint
+_cache_entries = {}
+_cache_unvalidated = set()
+_cache_pending = {}
+
+
+def _queue_cache_entry(abs_path, is_broken, assets):
+    """Remembers a library's scan result for the persistent cache"""
+    _cache_pending[abs_path] = {
+        "is_broken": is_broken,
+        "assets": sorted(assets),
+    }
+
+
+def flush_scan_cache():
+    """Writes queued scan results whose fingerprint is known and changed.
+
+    Libraries whose (mtime, size) and contents match the stored entry are
+    not written again.
+    """
+    watcher = library_watcher.watcher
+    changed = {}
+    for abs_path in list(_cache_pending):
+        if not watcher.is_tracked(abs_path):
+            continue
+        entry = _cache_pending.pop(abs_path)
+        entry["fingerprint"] = watcher.baseline(abs_path)
+        stored = _cache_entries.get(abs_path)
+        if stored == entry:
+            continue
+        changed[abs_path] = entry
+
+    if changed:
+        scan_cache.cache.store(changed)
+        _cache_entries.update(changed)
+        _cache_unvalidated.difference_update(changed)
+
+
+def _validate_cache_entries():
+    """Drops loaded cache entries whose file changed since it was scanned.
+
+    The fingerprints come from the background path probes; an entry whose
+    probe has not answered yet stays in use until it does.
+    """
+    for abs_path in list(_cache_unvalidated):
+        if path_status.service.status(abs_path) == path_status.STATUS_UNKNOWN:
+            continue
+        _cache_unvalidated.discard(abs_path)
+        if path_status.service.fingerprint(abs_path) != _cache_entries[abs_path]["fingerprint"]:
+            del _cache_entries[abs_path]
+
+
+def _selected_key(wm):
+    if 0 <= wm.linked_assets_index < len(wm.linked_assets_list):
+        return _row_key(wm.linked_assets_list[wm.linked_assets_index])
+    return None
+
+
+def _expanded_paths(wm):
+    return {item.lib_path for item in wm.linked_assets_list if item.is_library and item.is_expanded}
+
+
+def _apply_visible_rows(wm, rows, expanded_paths, selected_key, lazy_children):
+    """Applies `rows` to the list and restores the selection.
+
+    In lazy mode only the children of expanded libraries are materialized,
+    so collapsed libraries cost a single header row.
+    """
+    if lazy_children:
+        rows = [row for row in rows if row[0][1] or row[0][0] in expanded_paths]
+
+    index_of = _apply_rows_diff(wm, rows)
+
+    # --- RESTORE SELECTION ---
+    # A selected child that was released falls back to its library header
+    new_index = index_of.get(selected_key)
+    if new_index is None and selected_key is not None:
+        lib_path = selected_key[0]
+        new_index = next((index_of[key] for key, fields in rows if key[1] and key[0] == lib_path), 0)
+
+    num_items = len(wm.linked_assets_list)
+    new_index = min(new_index or 0, num_items - 1) if num_items > 0 else 0
+    if wm.linked_assets_index != new_index:
+        wm.linked_assets_index = new_index
+
+
+def sync_expanded_children(wm):
+    """Materializes/releases child rows after libraries were expanded or collapsed"""
+    if not wm.linked_list_lazy_children or wm.is_updating_linked_list:
+        return
+
+    rows = _list_state["rows"]
+    if rows is None:
+        # Nothing scanned yet in this session
+        update_linked_items_list(bpy.context.scene)
+        return
+
+    wm.is_updating_linked_list = True
+    try:
+        _apply_visible_rows(wm, rows, _expanded_paths(wm), _selected_key(wm), True)
+    finally:
+        wm.is_updating_linked_list = False
+
+
+def _run_expanded_sync():
+    """Timer callback: applies the expand/collapse clicks since the last run"""
+    sync_expanded_children(bpy.context.window_manager)
+    return None
+
+
+def schedule_expanded_sync():
+    """Runs sync_expanded_children() on the next timer tick.
+
+    Used from the is_expanded update callback, which must not add or remove
+    items of the collection that owns the item being updated.
+    """
+    if not bpy.app.timers.is_registered(_run_expanded_sync):
+        bpy.app.timers.register(_run_expanded_sync, first_interval=0)
+
+
+def set_all_expanded(wm, state):
+    """Expands/collapses every library with a single child sync at the end"""
+    wm.is_updating_linked_list = True
+    try:
+        for item in wm.linked_assets_list:
+            if item.is_library and item.is_expanded != state:
+                item.is_expanded = state
+    finally:
+        wm.is_updating_linked_list = False
+    sync_expanded_children(wm)
+
+
+def reveal_list_row(wm, key):
+    """Makes the row `key` visible in the list and active.
+
+    Expands the libraries above it (and its own library for an asset, which
+    in lazy mode also creates the row), so the Select/Focus buttons act on
+    it right away. Returns the row index, or None when the row is gone.
+    """
+    items = wm.linked_assets_list
+    lib_path, is_library = key[0], key[1]
+    header = next((i for i, item in enumerate(items) if item.is_library and item.lib_path == lib_path), None)
+    if header is None:
+        return None
+
+    # The library chain, walking up to ever shallower headers
+    chain = [] if is_library else [items[header]]
+    depth = items[header].depth
+    for i in range(header - 1, -1, -1):
+        if depth == 0:
+            break
+        item = items[i]
+        if item.is_library and item.depth < depth:
+            chain.append(item)
+            depth = item.depth
+
+    collapsed = [item for item in chain if not item.is_expanded]
+    if collapsed:
+        wm.is_updating_linked_list = True
+        try:
+            for item in collapsed:
+                item.is_expanded = True
+        finally:
+            wm.is_updating_linked_list = False
+        sync_expanded_children(wm)
+
+    index = next((i for i, item in enumerate(items) if _row_key(item) == key), None)
+    if index is not None and wm.linked_assets_index != index:
+        wm.linked_assets_index = index
+    return index
+
+
+def list_usage_scene():
+    """Name of the scene whose usage the shared list shows (None before the first refresh)"""
+    return _list_state["scene"]
+
+
+def _row_key(item):
+    """Identity of a list row: (lib_path, is_library, name, id_type)"""
+    return (item.lib_path, item.is_library, item.name, item.id_type)
+
+
+def _apply_rows_diff(wm, rows):
+    """Patches wm.linked_assets_list in place so it matches `rows`.
+
+    `rows` is an ordered list of (key, fields) tuples where key comes from
+    _row_key() and fields is a dict of the mutable status flags. Existing
+    items are kept (so is_expanded and per-item state survive), only missing
+    rows are added, vanished rows removed and changed flags written.
+    Returns a dict mapping each key to its final index.
+    """
+    items = wm.linked_assets_list
+    wanted_keys = [key for key, fields in rows]
+    wanted_set = set(wanted_keys)
+
+    # --- 1. REMOVE ROWS THAT NO LONGER EXIST ---
+    current_keys = [_row_key(item) for item in items]
+    for i in range(len(current_keys) - 1, -1, -1):
+        if current_keys[i] not in wanted_set:
+            items.remove(i)
+            del current_keys[i]
+
+    # --- 2. ADD NEW ROWS (appended, moved into place below) ---
+    present = set(current_keys)
+    for key in wanted_keys:
+        if key in present:
+            continue
+        lib_path, is_library, name, id_type = key
+        item = items.add()
+        item.name = name
+        item.is_library = is_library
+        item.lib_path = lib_path
+        item.id_type = id_type
+        item.is_collection = id_type == 'COLLECTION'
+        current_keys.append(key)
+
+    # --- 3. REORDER (no-op when the order is already right) ---
+    if current_keys != wanted_keys:
+        for target, key in enumerate(wanted_keys):
+            if current_keys[target] == key:
+                continue
+            source = current_keys.index(key, target)
+            items.move(source, target)
+            current_keys.insert(target, current_keys.pop(source))
+
+    # --- 4. PATCH ONLY THE FLAGS THAT CHANGED ---
+    for item, (key, fields) in zip(items, rows):
+        for attr, value in fields.items():
+            if getattr(item, attr) != value:
+                setattr(item, attr, value)
+
+    return {key: i for i, key in enumerate(wanted_keys)}
+
+
+def invalidate_library_inventory():
+    """Makes the next refresh rescan the libraries (reloads, a new file)"""
+    _inventory["signature"] = None
+    _stats_cache["keys"] = {}
+    _linked_counts["lengths"] = {}
+
+
+def _inventory_signature(libraries, abs_paths):
+    """Cheap fingerprint of everything the inventory is built from"""
+    watcher = library_watcher.watcher
+    counts = linked_id_counts()
+    return tuple(
+        (lib.session_uid, counts.get(lib.session_uid, 0), lib.filepath, path_status.service.status(abs_path),
+         watcher.is_stale(abs_path), watcher.baseline(abs_path), PROXY_PATH_KEY in lib)
+        for lib, abs_path in zip(libraries, abs_paths))
+
+
+def library_inventory(cache_only=False):
+    """Scans every library and its assets, independently of any scene.
+
+    Returns the shared inventory: {"rows", "abs_paths", "generation", ...}.
+    Each row is (key, fields, usage) with key (lib_path, is_library, name,
+    id_type), the scene-independent fields, and what usage_overlay() needs:
+    the library session_uid for headers, (id_type, id_data) for assets.
+    Libraries come in dependency tree order, each followed by its assets.
+    Cached until IDs are linked from or removed from a library, or a
+    library's path, status or file changed, so neither switching scenes nor
+    adding local objects rescans.
+    `cache_only` skips the pass over bpy.data and takes the assets from the
+    scan cache entries loaded with the file, validated or not; the result is
+    not kept, so the next refresh does the real scan.
+    """
+    libraries = list(bpy.data.libraries)
+    abs_paths = [library_abspath(lib) for lib in libraries]
+    signature = None if cache_only else _inventory_signature(libraries, abs_paths)
+    if signature is not None and signature == _inventory["signature"]:
+        return _inventory
+    if not cache_only:
+        _validate_cache_entries()
+
+    lib_groups = {}
+
+    # --- 1. SCAN ALL LIBRARIES & THEIR ASSETS ---
+    # This part ensures that even if 0 instances exist in the scene, 
+    # the asset remains visible in the UI list.
+    buckets = {} if cache_only else bucket_linked_ids()
+    watcher = library_watcher.watcher
+    for lib, abs_path in zip(libraries, abs_paths):
+        # Cached, non-blocking: unknown paths are probed in the background
+        status = path_status.service.status(abs_path)
+        assets = {(id_data.name, id_type): id_data for id_type, id_data in buckets.get(lib.name, ())}
+        if assets and status != path_status.STATUS_UNKNOWN:
+            _queue_cache_entry(abs_path, status == path_status.STATUS_MISSING, assets)
+        elif not assets and abs_path in _cache_entries:
+            # Nothing loaded from this library (e.g. broken file):
+            # show what it contained the last time it was scanned
+            assets = {tuple(asset): None for asset in _cache_entries[abs_path]["assets"]}
+
+        lib_groups[lib.name] = {
+            "path": lib.filepath, 
+            "uid": lib.session_uid,
+            "parent": lib.parent.name if lib.parent else None,
+            "assets": assets,
+            "is_broken": status == path_status.STATUS_MISSING,
+            "is_checking": status == path_status.STATUS_UNKNOWN,
+            "is_stale": watcher.is_stale(abs_path),
+            "is_proxy": PROXY_PATH_KEY in lib,
+        }
+
+    # --- 2. DEPENDENCY TREE & TRANSITIVE STATUS ---
+    order, children_of = library_tree_order(
+        {name: data["parent"] for name, data in lib_groups.items()})
+    propagate_dependency_status(order, children_of, lib_groups)
+    stats = {} if cache_only else library_stats(abs_paths)
+
+    # --- 3. BUILD THE ROWS ---
+    rows = []
+    for lib_name, depth in order:
+        data = lib_groups[lib_name]
+        cost = stats.get(lib_name, {})
+        rows.append(((data["path"], True, lib_name, 'LIBRARY'), {
+            "is_broken": data["is_broken"],
+            "is_checking": data["is_checking"],
+            "is_stale": data["is_stale"],
+            "depth": depth,
+            "has_broken_dependency": data["has_broken_dependency"],
+            "has_stale_dependency": data["has_stale_dependency"],
+            "is_proxy": data["is_proxy"],
+            "cost_ids": sum(cost.get("ids", {}).values()),
+            "cost_vertices": cost.get("vertices", 0),
+            "cost_faces": cost.get("faces", 0),
+            "cost_image_bytes": float(cost.get("image_bytes", 0)),
+            "cost_file_size": float(cost.get("file_size", 0)),
+            "cost_reload_time": cost.get("reload_time") or 0.0,
+        }, data["uid"]))
+
+        for (asset_name, id_type), id_data in sorted(data["assets"].items()):
+            rows.append(((data["path"], False, asset_name, id_type), {
+                "is_broken": data["is_broken"],
+                "depth": depth,
+            }, (id_type, id_data)))
+
+    # Every library and asset is searchable, expanded or not
+    search_index.index.update((key, key[2]) for key, fields, usage in rows)
+
+    _inventory.update(
+        signature=signature,
+        generation=_inventory["generation"] + 1,
+        rows=rows,
+        abs_paths=abs_paths,
+    )
+    return _inventory
+
+
+def usage_overlay(scene, inventory):
+    """Usage of every inventory row in `scene`: (stamp, [(instance count, in use)]).
+
+    Only this part depends on the scene. It is cached per scene and
+    recomputed when the inventory, the scene's usage index or its world
+    changed, so going back to a scene costs nothing.
+    """
+    # The reverse usage index only re-indexes objects that came or went
+    index = usage_index.get_index(scene)
+    index.sync(scene)
+    stamp = (inventory["generation"], index.version, scene.world.session_uid if scene.world else None)
+    cached = _overlays.get(scene.name)
+    if cached is not None and cached[0] == stamp:
+        return cached
+
+    # Backwards, so a library header sees whether any of its assets is used:
+    # solid if one is in the scene, ghost if not
+    rows = inventory["rows"]
+    overlay = [None] * len(rows)
+    any_in_use = False
+    for i in range(len(rows) - 1, -1, -1):
+        key, fields, usage = rows[i]
+        if key[1]:
+            overlay[i] = (index.count([usage]), any_in_use)
+            any_in_use = False
+        else:
+            overlay[i] = asset_usage(scene, index, *usage)
+            any_in_use = any_in_use or overlay[i][1]
+
+    _overlays[scene.name] = (stamp, overlay)
+    return stamp, overlay
+
+
+def _merge_usage(inventory, overlay):
+    return [
+        (key, dict(fields, is_empty_link=not in_use, instance_count=count))
+        for (key, fields, usage), (count, in_use) in zip(inventory["rows"], overlay)
+    ]
+
+
+@profiler.timed("update_linked_items_list")
+def update_linked_items_list(scene=None, context=None, full_rebuild=False):
+    """Refreshes the shared list from Library data, with the usage of `scene`.
+
+    By default the new (library, asset) rows are diffed against the existing
+    collection and only the differences are applied; when neither the
+    inventory nor the scene's usage changed nothing is touched at all.
+    `full_rebuild` rescans the libraries, clears the list and re-adds
+    everything (the old behaviour).
+    """
     
     if scene is None: 
         scene = bpy.context.scene
+    wm = bpy.context.window_manager
     
     # Prevents recursion errors
-    if scene.get("is_updating_linked_list", False):
+    if wm.get("is_updating_linked_list", False):
         return None
         
-    scene.is_updating_linked_list = True
+    wm.is_updating_linked_list = True
 
     try:
         # --- 1. STORE CURRENT STATE ---
-        selected_name = ""
-        if 0 <= scene.linked_assets_index < len(scene.linked_assets_list):
-            selected_name = scene.linked_assets_list[scene.linked_assets_index].name
+        selected_key = _selected_key(wm)
+        expanded_paths = _expanded_paths(wm)
 
-        expansion_states = {
-            item.lib_path: item.is_expanded 
-            for item in scene.linked_assets_list if item.is_library
-        }
+        if full_rebuild:
+            invalidate_library_inventory()
+            usage_index.get_index(scene).invalidate()
+            wm.linked_assets_list.clear()
 
-        # --- 2. RESET LIST ---
-        scene.linked_assets_list.clear()
-        lib_groups = {}
-
-        # --- 3. SCAN ALL LIBRARIES & THEIR ASSETS ---
-        # This part ensures that even if 0 instances exist in the scene, 
-        # the asset remains visible in the UI list.
-        for lib in bpy.data.libraries:
-            abs_path = bpy.path.abspath(lib.filepath)
-            lib_groups[lib.name] = {
-                "path": lib.filepath, 
-                "assets": set(),
-                "is_broken": not os.path.exists(abs_path)
-            }
-
-            # Deep Scan: Find Collections in THIS library marked as Assets
-            for coll in bpy.data.collections:
-                if coll.library == lib and coll.asset_data:
-                    lib_groups[lib.name]["assets"].add((coll.name, True))
-
-            # Deep Scan: Find Objects in THIS library marked as Assets
-            for obj_data in bpy.data.objects:
-                if obj_data.library == lib and obj_data.asset_data:
-                    lib_groups[lib.name]["assets"].add((obj_data.name, False))
-
-        # --- 4. SCAN SCENE FOR ACTIVE USAGE ---
-        # We build a lookup set to determine which items are 'Ghosts'
-        assets_in_scene = set()
-        for obj in scene.objects:
-            # Check for Collection Instances (Empties)
-            if obj.instance_collection:
-                assets_in_scene.add(obj.instance_collection.name)
-            
-            # Check for Direct Object Links (Mesh/Data)
-            if obj.library:
-                assets_in_scene.add(obj.name)
-            if obj.data and obj.data.library:
-                assets_in_scene.add(obj.data.name)
-
-        # --- 5. REBUILD THE UI COLLECTION ---
-        for lib_name in sorted(lib_groups.keys()):
-            data = lib_groups[lib_name]
-            
-            # Add Library Header
-            parent = scene.linked_assets_list.add()
-            parent.name = lib_name
-            parent.is_library = True
-            parent.lib_path = data["path"]
-            parent.is_expanded = expansion_states.get(data["path"], False)
-            parent.is_broken = data["is_broken"]
-            
-            # Library header status: ghost if no child assets are in the scene
-            lib_in_use = any(name in assets_in_scene for name, is_c in data["assets"])
-            parent.is_empty_link = not lib_in_use
-
-            # Add Asset Sub-items
-            for asset_name, is_coll in sorted(data["assets"]):
-                child = scene.linked_assets_list.add()
-                child.name = asset_name
-                child.is_collection = is_coll
-                child.is_library = False
-                child.lib_path = data["path"]
-                child.is_broken = data["is_broken"]
-                
-                # If it's in the scene, it's a solid item. If not, it's a ghost.
-                child.is_empty_link = asset_name not in assets_in_scene
-
-        # --- 6. RESTORE SELECTION ---
-        num_items = len(scene.linked_assets_list)
-        new_index = 0
-        if selected_name and num_items > 0:
-            for i, item in enumerate(scene.linked_assets_list):
-                if item.name == selected_name:
-                    new_index = i
-                    break
-        
-        scene.linked_assets_index = min(new_index, num_items - 1) if num_items > 0 else 0
+        # --- 2. SHARED INVENTORY + THIS SCENE'S USAGE ---
+        inventory = library_inventory()
+        stamp, overlay = usage_overlay(scene, inventory)
+        lazy_children = wm.linked_list_lazy_children
+        shown = (_list_state["scene"], _list_state["stamp"], _list_state["lazy"])
+        if not full_rebuild and shown == (scene.name, stamp, lazy_children):
+            return None
+        rows = _merge_usage(inventory, overlay)
+        profiler.add_items("update_linked_items_list", len(rows))
+
+        # Keep the on-disk watcher in sync with the linked libraries
+        library_watcher.watcher.set_paths(inventory["abs_paths"])
+
+        # --- 3. APPLY THE DIFF TO THE UI COLLECTION ---
+        _list_state.update(rows=rows, scene=scene.name, stamp=stamp, lazy=lazy_children)
+        _apply_visible_rows(wm, rows, expanded_paths, selected_key, lazy_children)
+
+        if full_rebuild:
+            for item in wm.linked_assets_list:
+                if item.is_library:
+                    item.is_expanded = item.lib_path in expanded_paths
 
     except Exception as e:
         print(f"Library Manager Error: {e}")
     
     finally:
-        scene.is_updating_linked_list = False
+        wm.is_updating_linked_list = False
+
+        # Pick up the results of any probe started by this refresh
+        watch_path_probes()
+        flush_scan_cache()
+
 
+def item_objects(scene, item):
+    """Scene objects using the list item's datablock (all its assets for a library row).
 
+    Uses the reverse usage index, so this is a lookup instead of a scan of
+    every object, and assets with the same name in two libraries stay apart.
+    """
+    id_data = resolve_item_id(item)
+    if id_data is None:
+        return []
+    if item.is_library:
+        uids = [id_data.session_uid]
+    else:
+        uids = usage_index.usage_uids(id_data)
+    return usage_index.get_index(scene).objects(uids)
+
+
+@profiler.timed("select_instances_internal")
 def select_instances_internal(scene, context, item):
+    """Selects the view layer objects using the list item's datablock"""
     # 1. Clear current selection to start fresh
     bpy.ops.object.select_all(action='DESELECT')
-    
+
+    # 2. Select the users that are in the current View Layer
     count = 0
-    target_name = item.name # This is the name from your UI list
-    
-    # 2. Iterate through all objects in the current View Layer
-    for obj in context.view_layer.objects:
-        is_match = False
-        
-        # --- CHECK CATEGORY 1: Linked Data (Lights, Meshes, Cameras, etc.) ---
-        if obj.data:
-            # Check if this data comes from the specific library file
-            if obj.data.library and obj.data.library.name == target_name:
-                is_match = True
-            # Check if the data name itself matches (for appended/local items)
-            elif obj.data.name == target_name:
-                is_match = True
-                
-        # --- CHECK CATEGORY 2: Collection Instances (The 'Empty' group) ---
-        if not is_match and obj.instance_type == 'COLLECTION' and obj.instance_collection:
-            if obj.instance_collection.name == target_name:
-                is_match = True
-            # Also check if the collection itself is linked from the target library
-            elif obj.instance_collection.library and obj.instance_collection.library.name == target_name:
-                is_match = True
-
-        # --- CHECK CATEGORY 3: Object-Level Library Link ---
-        if not is_match and obj.library and obj.library.name == target_name:
-            is_match = True
-
-        # 3. If any of the above matched, select the object
-        if is_match:
-            obj.select_set(True)
-            # Make the last one found the 'Active' object for framing
-            context.view_layer.objects.active = obj
-            count += 1
+    view_layer_objects = context.view_layer.objects
+    for obj in item_objects(scene, item):
+        if view_layer_objects.get(obj.name) != obj:
+            continue
+        obj.select_set(True)
+        # Make the last one found the 'Active' object for framing
+        view_layer_objects.active = obj
+        count += 1
             
+    profiler.add_items("select_instances_internal", count)
     return count
    
 
+# =========================================================================
+# SCOPED REVEAL
+# =========================================================================
+
+# What reveal_item_objects() changed, per scene, so it can be put back:
+# "objects": object ref -> (hide_viewport, hide_select, hidden in view layer)
+# "spaces": (screen name, area index, attribute) -> previous value
+# Only the first (original) value of anything is kept across reveals.
+_reveal_snapshots = {}
+
+# Object type -> suffix of the 3D view's show_object_viewport_*/show_object_select_*
+_SPACE_TYPE_FLAGS = {
+    'MESH': "mesh", 'CURVE': "curve", 'SURFACE': "surf", 'META': "meta", 'FONT': "font",
+    'CURVES': "curves", 'POINTCLOUD': "pointcloud", 'VOLUME': "volume",
+    'GREASEPENCIL': "grease_pencil", 'ARMATURE': "armature", 'LATTICE': "lattice",
+    'EMPTY': "empty", 'LIGHT': "light", 'LIGHT_PROBE': "light_probe",
+    'CAMERA': "camera", 'SPEAKER': "speaker",
+}
+
+
+def _object_types(objects):
+    """Object types drawn for `objects`, including collection instance contents"""
+    types = set()
+    seen_collections = set()
+    for obj in objects:
+        types.add(obj.type)
+        collection = obj.instance_collection
+        if collection is not None and obj.instance_type == 'COLLECTION':
+            if collection.session_uid not in seen_collections:
+                seen_collections.add(collection.session_uid)
+                types.update(o.type for o in collection.all_objects)
+    return types
+
+
+def reveal_item_objects(scene, context, item):
+    """Makes the objects using the list item visible and selectable.
+
+    Only those objects (and the 3D view object-type filters their types
+    need) are touched, and only where something is actually hidden, so an
+    artist's visibility setup survives and no other object gets re-evaluated.
+    The previous state is recorded for restore_revealed_objects().
+    Returns how many objects were changed.
+    """
+    snapshot = _reveal_snapshots.setdefault(scene.name, {"objects": {}, "spaces": {}})
+    view_layer = context.view_layer
+    objects = item_objects(scene, item)
+
+    changed = 0
+    for obj in objects:
+        hidden = obj.hide_get(view_layer=view_layer)
+        if not (obj.hide_viewport or obj.hide_select or hidden):
+            continue
+        snapshot["objects"].setdefault(
+            usage_index.object_ref(obj), (obj.hide_viewport, obj.hide_select, hidden))
+        if obj.hide_viewport:
+            obj.hide_viewport = False
+        if obj.hide_select:
+            obj.hide_select = False
+        if hidden:
+            obj.hide_set(False, view_layer=view_layer)
+        changed += 1
+
+    # Object type filters of the 3D views, for the types involved only
+    screen = context.screen
+    if screen is not None and objects:
+        flags = [_SPACE_TYPE_FLAGS[t] for t in _object_types(objects) if t in _SPACE_TYPE_FLAGS]
+        for area_index, area in enumerate(screen.areas):
+            if area.type != 'VIEW_3D':
+                continue
+            space = area.spaces.active
+            for flag in flags:
+                for attr in (f"show_object_viewport_{flag}", f"show_object_select_{flag}"):
+                    if getattr(space, attr, True):
+                        continue
+                    snapshot["spaces"].setdefault((screen.name, area_index, attr), False)
+                    setattr(space, attr, True)
+
+    return changed
+
+
+def has_reveal_snapshot(scene):
+    snapshot = _reveal_snapshots.get(scene.name)
+    return bool(snapshot and (snapshot["objects"] or snapshot["spaces"]))
+
+
+def restore_revealed_objects(scene, context):
+    """Puts back what reveal_item_objects() changed; returns how many objects were restored"""
+    snapshot = _reveal_snapshots.pop(scene.name, None)
+    if not snapshot:
+        return 0
+
+    view_layer = context.view_layer
+    restored = 0
+    for ref, (hide_viewport, hide_select, hidden) in snapshot["objects"].items():
+        obj = bpy.data.objects.get(ref)
+        if obj is None:
+            continue
+        if obj.hide_viewport != hide_viewport:
+            obj.hide_viewport = hide_viewport
+        if obj.hide_select != hide_select:
+            obj.hide_select = hide_select
+        if view_layer.objects.get(obj.name) == obj and obj.hide_get(view_layer=view_layer) != hidden:
+            obj.hide_set(hidden, view_layer=view_layer)
+        restored += 1
+
+    for (screen_name, area_index, attr), value in snapshot["spaces"].items():
+        screen = bpy.data.screens.get(screen_name)
+        if screen is None or area_index >= len(screen.areas):
+            continue
+        area = screen.areas[area_index]
+        if area.type == 'VIEW_3D' and hasattr(area.spaces.active, attr):
+            setattr(area.spaces.active, attr, value)
+
+    return restored
+
+
+# =========================================================================
+# REFRESH SCHEDULER
+# =========================================================================
+
+# Pending deferred refresh: which scenes are dirty and when the debounce
+# window closes. Everything here is touched on the main thread only.
+_refresh_state = {
+    "scenes": set(),
+    "deadline": 0.0,
+}
+
+# Cheap fingerprint used to filter depsgraph updates
+_data_counts = {"objects": -1, "libraries": -1}
+
+
+def schedule_linked_list_refresh(scene=None, delay=None):
+    """Marks the scene's list dirty and (re)arms the debounce timer.
+
+    Bursts of calls collapse into a single refresh that runs once no new
+    call has arrived for `delay` seconds (default: the window manager's
+    linked_list_refresh_delay).
+    """
+    if scene is None:
+        scene = bpy.context.scene
+    if delay is None:
+        delay = bpy.context.window_manager.linked_list_refresh_delay
+
+    _refresh_state["scenes"].add(scene.name)
+    _refresh_state["deadline"] = time.monotonic() + delay
+
+    if not bpy.app.timers.is_registered(_run_scheduled_refresh):
+        bpy.app.timers.register(_run_scheduled_refresh, first_interval=delay)
+
+
+def cancel_scheduled_refresh():
+    """Drops any pending refresh (used on unregister)"""
+    _refresh_state["scenes"].clear()
+    if bpy.app.timers.is_registered(_run_scheduled_refresh):
+        bpy.app.timers.unregister(_run_scheduled_refresh)
+    if bpy.app.timers.is_registered(_run_expanded_sync):
+        bpy.app.timers.unregister(_run_expanded_sync)
+
+
+def _run_scheduled_refresh():
+    """Timer callback: waits out the debounce window, then refreshes once"""
+    remaining = _refresh_state["deadline"] - time.monotonic()
+    if remaining > 0:
+        return remaining
+
+    scene_names = _refresh_state["scenes"]
+    _refresh_state["scenes"] = set()
+
+    # One shared list showing the active scene's usage; the overlay of any
+    # other dirty scene is recomputed when that scene becomes active
+    scene = bpy.context.scene
+    if scene is None:
+        scene = next(filter(None, map(bpy.data.scenes.get, sorted(scene_names))), None)
+    if scene is not None:
+        update_linked_items_list(scene)
+
+    return None
+
+
+def _data_counts_changed():
+    """True when objects or libraries were added/removed since the last check"""
+    counts = {"objects": len(bpy.data.objects), "libraries": len(bpy.data.libraries)}
+    if counts == _data_counts:
+        return False
+    _data_counts.update(counts)
+    return True
+
+
+def _update_changes_library_usage(scene, update):
+    """Filters a depsgraph update down to what can change library usage"""
+    id_data = update.id
+
+    # Objects linked to / unlinked from a collection tag that collection
+    if isinstance(id_data, bpy.types.Collection):
+        usage_index.get_index(scene).invalidate()
+        return True
+
+    # Scene updates fire for almost anything (including our own list edits),
+    # so only count them when objects or libraries actually came or went
+    if isinstance(id_data, bpy.types.Scene):
+        if not _data_counts_changed():
+            return False
+        usage_index.get_index(scene).invalidate()
+        return True
+
+    # New objects and instance_collection/data/material swaps: re-index the
+    # object, which reports whether the linked IDs it uses changed
+    if isinstance(id_data, bpy.types.Object):
+        return usage_index.get_index(scene).update_object(id_data.original)
+
+    return False
+
+
+@bpy.app.handlers.persistent
+def reset_on_file_load(dummy):
+    """Drops per-file state and fills the list straight from the scan cache.
+
+    session_uid values restart with every file, so the usage indexes go.
+    Nothing here touches the library files: the list is filled from the
+    cache as stored, the path probes check every file's (mtime, size) in
+    the background and refreshes drop the entries that no longer match.
+    """
+    usage_index.clear()
+    _overlays.clear()
+    _list_state.update(rows=None, scene=None, stamp=None, lazy=None)
+    invalidate_library_inventory()
+    _reveal_snapshots.clear()
+    _cache_pending.clear()
+    _cache_entries.clear()
+    _cache_unvalidated.clear()
+
+    # Fresh probes for this file's libraries; their fingerprints decide
+    # which cache entries stay (see _validate_cache_entries)
+    paths = [library_abspath(lib) for lib in bpy.data.libraries]
+    path_status.service.invalidate(paths)
+    _cache_entries.update(scan_cache.cache.load(paths))
+    _cache_unvalidated.update(_cache_entries)
+
+    scene = bpy.context.scene
+    if scene is None or not paths:
+        return
+    if _cache_entries:
+        _fill_list_from_cache(scene)
+    schedule_linked_list_refresh(scene)
+
+
+def _fill_list_from_cache(scene):
+    """Shows the cached libraries and assets before the first real scan"""
+    wm = bpy.context.window_manager
+    inventory = library_inventory(cache_only=True)
+    overlay = [(0, False)] * len(inventory["rows"])
+    rows = _merge_usage(inventory, overlay)
+    lazy_children = wm.linked_list_lazy_children
+    _list_state.update(rows=rows, scene=None, stamp=None, lazy=lazy_children)
+    wm.is_updating_linked_list = True
+    try:
+        _apply_visible_rows(wm, rows, _expanded_paths(wm), _selected_key(wm), lazy_children)
+    finally:
+        wm.is_updating_linked_list = False
+
+
 @bpy.app.handlers.persistent
+@profiler.timed("auto_update_linked_handler")
 def auto_update_linked_handler(scene, depsgraph):
-    """Triggers list refresh when the scene geometry changes"""
-    if any(update.is_updated_geometry for update in depsgraph.updates):
-        update_linked_items_list(bpy.context.scene, bpy.context)
-        
-        # We use a Timer to call the update 0.1 seconds later.
-        # This prevents the "Context is Read Only" error common in Handlers.
-        if not bpy.app.timers.is_registered(update_linked_items_list):
-            bpy.app.timers.register(lambda: update_linked_items_list(scene), first_interval=0.1)
+    """Schedules a deferred list refresh when library usage may have changed.
+
+    Never refreshes synchronously: the handler only marks the list dirty,
+    the scheduler coalesces bursts into a single refresh.
+    """
+    changed = False
+    updates = depsgraph.updates
+    profiler.add_items("auto_update_linked_handler", len(updates))
+    for update in updates:
+        # No short-circuit: every updated object must be re-indexed
+        if _update_changes_library_usage(scene, update):
+            changed = True
+
+    # Another scene became active: the shared list needs its usage overlay
+    if scene.name != _list_state["scene"] and scene == bpy.context.scene:
+        changed = True
+
+    if changed:
+        schedule_linked_list_refresh(scene)
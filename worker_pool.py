@@ -0,0 +1,166 @@
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+
+# =========================================================================
+# BACKGROUND BLENDER WORKER POOL
+# =========================================================================
+# Inspecting a library for real (assets, sub-libraries, missing resources,
+# load time) means opening it in Blender. Doing that in the interactive
+# session blocks the UI and uses one core, so library files are instead
+# handed to a few long-lived headless `blender -b` processes running
+# inspect_worker.py. Each process is driven by its own thread that feeds it
+# paths from a shared job queue and parses the JSON answer.
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "inspect_worker.py")
+RESULT_PREFIX = "LIBRARY_MANAGER_RESULT:"   # Must match inspect_worker.py
+
+
+class _Worker:
+    """One headless Blender process, restarted after a crash or timeout"""
+
+    def __init__(self, binary, script, script_args):
+        self.binary = binary
+        self.script = script
+        self.script_args = script_args
+        self.proc = None
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            [self.binary, "-b", "--factory-startup", "--python", self.script, "--", *self.script_args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, path, timeout):
+        """Inspects one file; returns the worker's result dict"""
+        if self.proc is None or self.proc.poll() is not None:
+            self._start()
+        # A hung file is killed, which makes readline() below return ""
+        killer = threading.Timer(timeout, self.proc.kill)
+        killer.start()
+        try:
+            self.proc.stdin.write(path + "\n")
+            self.proc.stdin.flush()
+            for line in self.proc.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    return json.loads(line[len(RESULT_PREFIX):])
+        except (OSError, ValueError) as e:
+            self.close()
+            return {"filepath": path, "ok": False, "error": f"Worker failed: {e}"}
+        finally:
+            killer.cancel()
+        self.close()
+        return {"filepath": path, "ok": False, "error": "Worker exited or timed out"}
+
+    def close(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+        self.proc = None
+
+
+class BlenderWorkerPool:
+    """Job queue served by up to `max_workers` headless Blender processes.
+
+    `script` is the Python file each process runs (inspect_worker.py by
+    default); it must answer every stdin path with a RESULT_PREFIX line.
+    """
+
+    def __init__(self, max_workers=None, timeout=120.0, script=WORKER_SCRIPT, script_args=()):
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self.timeout = timeout        # Seconds one file may take before its worker is killed
+        self.script = script
+        self.script_args = list(script_args)
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._queued = set()          # Paths submitted and not finished yet
+        self._finished = {}           # path -> result, until take_results()
+        self.results = {}             # path -> last result (read by the UI)
+
+    def submit(self, binary, paths):
+        """Queues library files for inspection; returns how many were queued"""
+        queued = 0
+        with self._lock:
+            for path in paths:
+                if path in self._queued:
+                    continue
+                self._queued.add(path)
+                self._jobs.put(path)
+                queued += 1
+            # One worker per queued file at most, so small jobs stay cheap
+            wanted = min(self.max_workers, len(self._queued))
+            self._threads = [t for t in self._threads if t.is_alive()]
+            while len(self._threads) < wanted:
+                thread = threading.Thread(
+                    target=self._serve, args=(binary,), name="LibraryManagerWorker", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return queued
+
+    def _serve(self, binary):
+        """Worker thread: owns one Blender process until the queue is drained"""
+        worker = _Worker(binary, self.script, self.script_args)
+        try:
+            while True:
+                try:
+                    path = self._jobs.get(timeout=5.0)
+                except queue.Empty:
+                    return
+                if path is None:
+                    return
+                start = time.perf_counter()
+                try:
+                    result = worker.run(path, self.timeout)
+                except OSError as e:
+                    # The binary itself could not be started
+                    result = {"filepath": path, "ok": False, "error": str(e)}
+                result["wall_time"] = time.perf_counter() - start
+                with self._lock:
+                    self._queued.discard(path)
+                    self._finished[path] = result
+                    self.results[path] = result
+        finally:
+            worker.close()
+
+    def pending(self):
+        """Number of files queued or being inspected"""
+        with self._lock:
+            return len(self._queued)
+
+    def take_results(self):
+        """Results finished since the last call ({path: result})"""
+        with self._lock:
+            finished = self._finished
+            self._finished = {}
+            return finished
+
+    def shutdown(self):
+        """Drops queued jobs and stops every worker"""
+        with self._lock:
+            self._queued.clear()
+            while True:
+                try:
+                    self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in self._threads:
+                self._jobs.put(None)
+            self._threads = []
+
+
+pool = BlenderWorkerPool()